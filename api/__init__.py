@@ -0,0 +1,9 @@
+from .servidor import ServidorNominas, ManejadorNominas, ErrorAPI, RUTAS, crear_servidor
+
+__all__ = [
+    'ServidorNominas',
+    'ManejadorNominas',
+    'ErrorAPI',
+    'RUTAS',
+    'crear_servidor'
+]
@@ -0,0 +1,53 @@
+"""
+API HTTP/JSON del sistema de nóminas.
+
+Uso:
+    python -m api --puerto 8000
+    python -m api --backend sqlite --datos archivos --precargar
+    python -m api --journal   (cambios de empleados en un journal JSONL)
+    python -m api --metricas   (GET /metricas en formato Prometheus, ?formato=json)
+"""
+import argparse
+
+from api.servidor import crear_servidor
+from sistema import SistemaNominas
+from utils import REGISTRO
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--puerto', type=int, default=8000)
+    parser.add_argument('--backend', choices=("json", "sqlite", "binario"), default="json")
+    parser.add_argument('--datos', default="archivos", help="directorio con empleados y nóminas")
+    parser.add_argument('--journal', action='store_true',
+                        help="guardar los cambios de empleados en un journal (JSONL)")
+    parser.add_argument('--cache', type=int, default=8, help="nóminas a mantener cargadas en memoria")
+    parser.add_argument('--precargar', action='store_true',
+                        help="cargar en la caché los períodos más recientes al iniciar")
+    parser.add_argument('--registrar', action='store_true', help="mostrar cada petición en consola")
+    parser.add_argument('--metricas', action='store_true',
+                        help="habilitar el registro de métricas (GET /metricas)")
+    args = parser.parse_args()
+
+    if args.metricas:
+        REGISTRO.habilitar()
+
+    sistema = SistemaNominas(backend=args.backend, directorio=args.datos, cache_nominas=args.cache,
+                             journal=args.journal)
+    # Con --cache 0 no hay caché que llenar ([-0:] serían todos los períodos)
+    if args.precargar and args.cache > 0:
+        for aniomes in sistema.listar_nominas()[-args.cache:]:
+            sistema.obtener_nomina(aniomes)
+
+    servidor = crear_servidor(args.host, args.puerto, sistema, args.registrar)
+    host, puerto = servidor.server_address[:2]
+    print(f"🌐 API de nóminas en http://{host}:{puerto} (Ctrl+C para detener)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Servidor detenido")
+    finally:
+        servidor.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+import contextlib
+import json
+import re
+import threading
+
+from sistema import SistemaNominas
+from utils import REGISTRO, convertir_a_json, resumen_publico, validar_datos_empleado
+
+# Tamaño máximo del cuerpo de una petición (los cuerpos son objetos JSON pequeños)
+MAX_CUERPO = 1024 * 1024
+
+class BloqueoLecturaEscritura:
+    """
+    Varias lecturas a la vez o una sola escritura: las consultas (GET) no se
+    esperan entre sí y las operaciones que modifican datos corren solas
+    """
+
+    def __init__(self):
+        self._condicion = threading.Condition()
+        self._lectores = 0
+        self._escribiendo = False
+
+    @contextlib.contextmanager
+    def lectura(self):
+        with self._condicion:
+            self._condicion.wait_for(lambda: not self._escribiendo)
+            self._lectores += 1
+        try:
+            yield
+        finally:
+            with self._condicion:
+                self._lectores -= 1
+                if not self._lectores:
+                    self._condicion.notify_all()
+
+    @contextlib.contextmanager
+    def escritura(self):
+        with self._condicion:
+            self._condicion.wait_for(lambda: not self._escribiendo and not self._lectores)
+            self._escribiendo = True
+        try:
+            yield
+        finally:
+            with self._condicion:
+                self._escribiendo = False
+                self._condicion.notify_all()
+
+class ErrorAPI(Exception):
+    """
+    Error que se responde al cliente con su código HTTP
+    """
+
+    def __init__(self, estado: HTTPStatus, mensaje, detalles: Optional[List[str]] = None):
+        super().__init__(mensaje)
+        self.estado = estado
+        self.mensaje = mensaje
+        self.detalles = detalles
+
+# --- OPERACIONES ---
+# Cada operación recibe (sistema, parámetros de la ruta, query, cuerpo JSON)
+# y devuelve (estado HTTP, datos a responder)
+Respuesta = Tuple[HTTPStatus, object]
+
+def _no_encontrado(mensaje: str) -> ErrorAPI:
+    return ErrorAPI(HTTPStatus.NOT_FOUND, mensaje)
+
+def _listar_empleados(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+    return HTTPStatus.OK, sistema.listar_empleados()
+
+def _obtener_empleado(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+    empleado = sistema.obtener_empleado(ruta['cedula'])
+    if empleado is None:
+        raise _no_encontrado("Empleado no encontrado")
+    return HTTPStatus.OK, empleado
+
+def _datos_empleado(cuerpo: Dict, base: Optional[Dict] = None) -> Dict:
+    """
+    Combina el cuerpo con los datos actuales y valida con las reglas del sistema
+    """
+    datos = dict(base or {})
+    datos.update({campo: cuerpo[campo] for campo in
+                  ('cedula', 'nombre', 'sueldo', 'departamento', 'cargo') if campo in cuerpo})
+    faltantes = [campo for campo in ('cedula', 'nombre', 'sueldo', 'departamento', 'cargo')
+                 if campo not in datos]
+    if faltantes:
+        raise ErrorAPI(HTTPStatus.BAD_REQUEST, f"Faltan campos: {', '.join(faltantes)}")
+    errores = validar_datos_empleado(**datos)
+    if errores:
+        raise ErrorAPI(HTTPStatus.BAD_REQUEST, "Datos de empleado no válidos", errores)
+    return datos
+
+def _crear_empleado(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+    datos = _datos_empleado(cuerpo)
+    if sistema.obtener_empleado(datos['cedula']) is not None:
+        raise ErrorAPI(HTTPStatus.CONFLICT, f"Ya existe un empleado con cédula {datos['cedula']}")
+    empleado = sistema.crear_empleado(**datos)
+    if empleado is None:
+        raise ErrorAPI(HTTPStatus.INTERNAL_SERVER_ERROR, "No se pudo crear el empleado")
+    return HTTPStatus.CREATED, empleado
+
+def _actualizar_empleado(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+    actual = sistema.obtener_empleado(ruta['cedula'])
+    if actual is None:
+        raise _no_encontrado("Empleado no encontrado")
+    cuerpo = {campo: valor for campo, valor in cuerpo.items() if campo != 'cedula'}
+    datos = _datos_empleado(cuerpo, actual.to_dict())
+    del datos['cedula']
+    return HTTPStatus.OK, sistema.actualizar_empleado(ruta['cedula'], **datos)
+
+def _eliminar_empleado(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+    if not sistema.eliminar_empleado(ruta['cedula']):
+        raise _no_encontrado("Empleado no encontrado")
+    return HTTPStatus.OK, {'eliminado': ruta['cedula']}
+
+def _listar_nominas(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+    resumenes = sistema.repo_nominas.obtener_resumenes()
+    return HTTPStatus.OK, [resumen_publico(resumen) for resumen in resumenes]
+
+def _generar_nomina(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+    aniomes = str(cuerpo.get('aniomes', ''))
+    if not re.fullmatch(r'\d{6}', aniomes):
+        raise ErrorAPI(HTTPStatus.BAD_REQUEST, "aniomes debe tener el formato YYYYMM")
+    resumen = sistema.generar_nomina_streaming(aniomes)
+    if resumen is None:
+        raise ErrorAPI(HTTPStatus.CONFLICT, "No hay empleados para generar la nómina")
+    return HTTPStatus.CREATED, resumen
+
+def _obtener_nomina(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+    nomina = sistema.obtener_nomina(ruta['aniomes'])
+    if nomina is None:
+        raise _no_encontrado("Nómina no encontrada")
+    return HTTPStatus.OK, nomina
+
+def _estadisticas(generar: Callable[[SistemaNominas, str], Dict]):
+    def operacion(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+        datos = generar(sistema, ruta['aniomes'])
+        if not datos:
+            raise _no_encontrado("Nómina no encontrada")
+        return HTTPStatus.OK, datos
+    return operacion
+
+def _serie(tipo: str):
+    def operacion(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+        desde, hasta = query.get('desde'), query.get('hasta')
+        try:
+            if tipo == 'empleado':
+                return HTTPStatus.OK, sistema.serie_empleado(ruta['clave'], desde, hasta)
+            return HTTPStatus.OK, sistema.serie_departamento(ruta['clave'], desde, hasta)
+        except ValueError as e:
+            raise ErrorAPI(HTTPStatus.BAD_REQUEST, str(e))
+    return operacion
+
+def _total_nominas(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+    return HTTPStatus.OK, {'total_neto': sistema.calcular_total_nominas()}
+
+def _salud(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+    estado = {'estado': 'ok'}
+    if hasattr(sistema.repo_nominas, 'estadisticas'):
+        estado['cache'] = sistema.repo_nominas.estadisticas()
+    return HTTPStatus.OK, estado
+
+def _metricas(sistema: SistemaNominas, ruta, query, cuerpo) -> Respuesta:
+    if query.get('formato') == 'json':
+        return HTTPStatus.OK, {'habilitado': REGISTRO.habilitado, 'operaciones': REGISTRO.instantanea()}
+    return HTTPStatus.OK, REGISTRO.exportar_prometheus()
+
+# (método, ruta, operación); los segmentos {nombre} se pasan en 'ruta'
+RUTAS = [
+    ('GET', '/salud', _salud),
+    ('GET', '/metricas', _metricas),
+    ('GET', '/empleados', _listar_empleados),
+    ('POST', '/empleados', _crear_empleado),
+    ('GET', '/empleados/{cedula}', _obtener_empleado),
+    ('PUT', '/empleados/{cedula}', _actualizar_empleado),
+    ('DELETE', '/empleados/{cedula}', _eliminar_empleado),
+    ('GET', '/nominas', _listar_nominas),
+    ('POST', '/nominas', _generar_nomina),
+    ('GET', '/nominas/total', _total_nominas),
+    ('GET', '/nominas/{aniomes}', _obtener_nomina),
+    ('GET', '/nominas/{aniomes}/estadisticas',
+     _estadisticas(lambda sistema, aniomes: sistema.generar_estadisticas_nomina(aniomes))),
+    ('GET', '/nominas/{aniomes}/avanzadas',
+     _estadisticas(lambda sistema, aniomes: sistema.generar_estadisticas_avanzadas(aniomes))),
+    ('GET', '/nominas/{aniomes}/departamentos',
+     _estadisticas(lambda sistema, aniomes: sistema.generar_metricas_departamento(aniomes))),
+    ('GET', '/series/empleados/{clave}', _serie('empleado')),
+    ('GET', '/series/departamentos/{clave}', _serie('departamento')),
+]
+
+def _compilar(ruta: str) -> re.Pattern:
+    return re.compile('^' + re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', ruta) + '$')
+
+_RUTAS_COMPILADAS = [(metodo, _compilar(ruta), operacion) for metodo, ruta, operacion in RUTAS]
+
+class ManejadorNominas(BaseHTTPRequestHandler):
+    """
+    Atiende una petición HTTP: busca la ruta, lee el cuerpo JSON y responde JSON
+    """
+
+    server: 'ServidorNominas'
+    protocol_version = 'HTTP/1.1'
+
+    def _atender(self, metodo: str) -> None:
+        partes = urlsplit(self.path)
+        query = {clave: valores[-1] for clave, valores in parse_qs(partes.query).items()}
+        try:
+            # El cuerpo se lee siempre, aun si la ruta no existe: si quedara en
+            # el socket se interpretaría como la siguiente petición (keep-alive)
+            datos_cuerpo = self._leer_bytes()
+            operacion, ruta = self._buscar(metodo, partes.path)
+            cuerpo = self._decodificar_cuerpo(datos_cuerpo)
+            # Las métricas se leen sin esperar al sistema (el registro tiene su
+            # propio lock); las consultas comparten el bloqueo y POST, PUT y
+            # DELETE lo toman en exclusiva
+            if operacion is _metricas:
+                bloqueo = contextlib.nullcontext()
+            elif metodo == 'GET':
+                bloqueo = self.server.bloqueo.lectura()
+            else:
+                bloqueo = self.server.bloqueo.escritura()
+            with bloqueo:
+                estado, datos = operacion(self.server.sistema, ruta, query, cuerpo)
+        except ErrorAPI as e:
+            estado, datos = e.estado, {'error': e.mensaje}
+            if e.detalles:
+                datos['detalles'] = e.detalles
+        except Exception as e:
+            estado, datos = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f"Error inesperado: {e}"}
+        self._responder(estado, datos)
+
+    def _buscar(self, metodo: str, camino: str):
+        permitidos = False
+        for metodo_ruta, patron, operacion in _RUTAS_COMPILADAS:
+            coincidencia = patron.match(camino)
+            if coincidencia:
+                if metodo_ruta == metodo:
+                    return operacion, {k: unquote(v) for k, v in coincidencia.groupdict().items()}
+                permitidos = True
+        if permitidos:
+            raise ErrorAPI(HTTPStatus.METHOD_NOT_ALLOWED, f"Método {metodo} no permitido en {camino}")
+        raise ErrorAPI(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {camino}")
+
+    def _leer_bytes(self) -> bytes:
+        try:
+            longitud = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            longitud = -1
+        if longitud < 0:
+            # Sin una longitud válida no se sabe dónde termina el cuerpo
+            self.close_connection = True
+            raise ErrorAPI(HTTPStatus.BAD_REQUEST, "Content-Length no válido")
+        if longitud > MAX_CUERPO:
+            # No se lee: la conexión se cierra en lugar de descartar el cuerpo
+            self.close_connection = True
+            raise ErrorAPI(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                           f"El cuerpo supera el máximo de {MAX_CUERPO} bytes")
+        return self.rfile.read(longitud) if longitud else b''
+
+    def _decodificar_cuerpo(self, datos: bytes) -> Dict:
+        if not datos:
+            return {}
+        try:
+            cuerpo = json.loads(datos)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise ErrorAPI(HTTPStatus.BAD_REQUEST, "El cuerpo no es JSON válido")
+        if not isinstance(cuerpo, dict):
+            raise ErrorAPI(HTTPStatus.BAD_REQUEST, "El cuerpo debe ser un objeto JSON")
+        return cuerpo
+
+    def _responder(self, estado: HTTPStatus, datos) -> None:
+        # Un texto se responde tal cual (exposición de Prometheus); lo demás en JSON
+        if isinstance(datos, str):
+            contenido, tipo = datos.encode('utf-8'), 'text/plain; version=0.0.4; charset=utf-8'
+        else:
+            contenido = json.dumps(datos, default=convertir_a_json, ensure_ascii=False).encode('utf-8')
+            tipo = 'application/json; charset=utf-8'
+        self.send_response(estado)
+        self.send_header('Content-Type', tipo)
+        self.send_header('Content-Length', str(len(contenido)))
+        if self.close_connection:
+            # Avisa al cliente que no reutilice la conexión (cuerpo sin leer)
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(contenido)
+
+    def do_GET(self):
+        self._atender('GET')
+
+    def do_POST(self):
+        self._atender('POST')
+
+    def do_PUT(self):
+        self._atender('PUT')
+
+    def do_DELETE(self):
+        self._atender('DELETE')
+
+    def log_message(self, formato, *args):
+        if self.server.registrar_peticiones:
+            super().log_message(formato, *args)
+
+class ServidorNominas(ThreadingHTTPServer):
+    """
+    Servidor HTTP de larga duración sobre un único SistemaNominas: los
+    repositorios, índices y la caché de nóminas quedan en memoria entre
+    peticiones. Cada conexión se atiende en su hilo; las consultas corren en
+    paralelo y las operaciones que modifican datos se serializan con un
+    bloqueo de lectura/escritura, porque los repositorios no son seguros
+    para escrituras concurrentes (la caché de nóminas tiene su propio lock).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, direccion: Tuple[str, int], sistema: SistemaNominas,
+                 registrar_peticiones: bool = False):
+        super().__init__(direccion, ManejadorNominas)
+        self.sistema = sistema
+        self.bloqueo = BloqueoLecturaEscritura()
+        self.registrar_peticiones = registrar_peticiones
+
+def crear_servidor(host: str = "127.0.0.1", puerto: int = 8000,
+                   sistema: Optional[SistemaNominas] = None,
+                   registrar_peticiones: bool = False) -> ServidorNominas:
+    """
+    Crea el servidor (puerto=0 elige uno libre); iniciarlo con serve_forever()
+    """
+    return ServidorNominas((host, puerto), sistema or SistemaNominas(), registrar_peticiones)
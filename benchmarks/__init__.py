@@ -0,0 +1,4 @@
+"""
+Benchmarks del sistema de nóminas. Se ejecutan desde la raíz del proyecto:
+    python -m benchmarks.<modulo>
+"""
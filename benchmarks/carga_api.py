@@ -0,0 +1,110 @@
+"""
+Prueba de carga de la API HTTP (api/): varios clientes concurrentes repiten
+peticiones GET sobre los endpoints de lectura y se reportan las latencias
+p50/p99 y las peticiones por segundo de cada uno.
+
+Sin --url se levanta un servidor local en un directorio temporal con
+empleados sintéticos y algunas nóminas ya generadas.
+
+Uso:
+    python -m benchmarks.carga_api --empleados 2000 --periodos 6 --clientes 8 --peticiones 200
+    python -m benchmarks.carga_api --url http://127.0.0.1:8000 --clientes 16
+"""
+import argparse
+import json
+import statistics
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from api import crear_servidor
+from benchmarks.datos import generar_empleados
+from sistema import SistemaNominas
+
+def _obtener(url: str) -> float:
+    """
+    Hace un GET y devuelve la latencia en segundos (falla si no responde 200)
+    """
+    inicio = time.perf_counter()
+    with urllib.request.urlopen(url) as respuesta:
+        respuesta.read()
+        if respuesta.status != 200:
+            raise RuntimeError(f"{url} respondió {respuesta.status}")
+    return time.perf_counter() - inicio
+
+def _percentil(latencias: List[float], p: float) -> float:
+    ordenadas = sorted(latencias)
+    return ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * p))]
+
+def _cargar(url: str, clientes: int, peticiones: int) -> Tuple[List[float], float]:
+    """
+    'clientes' hilos hacen 'peticiones' GET cada uno
+    Returns: (latencias, segundos totales)
+    """
+    with ThreadPoolExecutor(max_workers=clientes) as executor:
+        inicio = time.perf_counter()
+        latencias = list(executor.map(_obtener, [url] * (clientes * peticiones)))
+        return latencias, time.perf_counter() - inicio
+
+def _servidor_local(directorio: str, empleados: int, periodos: int):
+    """
+    Sistema aislado con datos sintéticos servido en un puerto libre
+    """
+    sistema = SistemaNominas(directorio=directorio)
+    sistema.repo_empleados.guardar_varios(generar_empleados(empleados))
+    for mes in range(1, periodos + 1):
+        sistema.generar_nomina_streaming(f"2025{mes:02d}")
+    servidor = crear_servidor(puerto=0, sistema=sistema)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    host, puerto = servidor.server_address[:2]
+    return servidor, f"http://{host}:{puerto}"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', help="instancia ya iniciada (por defecto se levanta una local)")
+    parser.add_argument('--empleados', type=int, default=2_000)
+    parser.add_argument('--periodos', type=int, default=6)
+    parser.add_argument('--clientes', type=int, default=8)
+    parser.add_argument('--peticiones', type=int, default=100, help="peticiones por cliente y endpoint")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        servidor = None
+        url = args.url
+        if url is None:
+            servidor, url = _servidor_local(directorio, args.empleados, args.periodos)
+        url = url.rstrip('/')
+
+        with urllib.request.urlopen(f"{url}/nominas") as respuesta:
+            periodos = [resumen['aniomes'] for resumen in json.load(respuesta)]
+        if not periodos:
+            raise SystemExit("❌ La instancia no tiene nóminas para consultar")
+        with urllib.request.urlopen(f"{url}/empleados") as respuesta:
+            cedula = json.load(respuesta)[0]['cedula']
+        ultimo = periodos[-1]
+
+        print(f"{url} | {len(periodos)} períodos | {args.clientes} clientes x {args.peticiones} peticiones")
+        for endpoint in [
+            "/salud",
+            "/nominas",
+            f"/empleados/{cedula}",
+            f"/nominas/{ultimo}/estadisticas",
+            f"/nominas/{ultimo}/departamentos",
+            f"/series/empleados/{cedula}",
+            "/nominas/total",
+        ]:
+            latencias, segundos = _cargar(url + endpoint, args.clientes, args.peticiones)
+            print(f"  {endpoint:38} p50 {_percentil(latencias, 0.50) * 1e3:8.2f} ms"
+                  f"  p99 {_percentil(latencias, 0.99) * 1e3:8.2f} ms"
+                  f"  media {statistics.fmean(latencias) * 1e3:8.2f} ms"
+                  f"  {len(latencias) / segundos:9.0f} req/s")
+
+        if servidor is not None:
+            servidor.shutdown()
+            servidor.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Compara el tiempo de carga de una nómina en formato JSON y en formato
+binario columnar, y el de un agregado (total neto) sobre cada uno.
+
+Uso:
+    python -m benchmarks.carga_nomina_binaria --empleados 100000 --repeticiones 3
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.datos import generar_empleados
+from modelos import Nomina, DetalleNomina
+from repositorios import RepositorioNominasJSON, RepositorioNominasBinario
+from utils import calcular_total_neto
+
+def _mejor_tiempo(funcion, repeticiones: int) -> float:
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def _total_binario(repo: RepositorioNominasBinario, aniomes: str) -> float:
+    with repo.abrir(aniomes) as vista:
+        return vista.total('neto')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--empleados', type=int, default=100_000)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args()
+    
+    nomina = Nomina(1, "202501")
+    for i, empleado in enumerate(generar_empleados(args.empleados), 1):
+        nomina.agregar_detalle(DetalleNomina(i, empleado, empleado.sueldo, Nomina.BONO, Nomina.PRESTAMO))
+    
+    with tempfile.TemporaryDirectory() as directorio:
+        directorio += os.sep
+        repo_json = RepositorioNominasJSON(directorio)
+        repo_binario = RepositorioNominasBinario(directorio)
+        repo_columnar = RepositorioNominasBinario(directorio, columnar=True)
+        repo_json.guardar(nomina)
+        repo_binario.guardar(nomina)
+        
+        tamano_json = os.path.getsize(f"{directorio}nomina_202501.json")
+        tamano_binario = os.path.getsize(f"{directorio}nomina_202501.bin")
+        mediciones = [
+            ("JSON obtener()", lambda: repo_json.obtener("202501")),
+            ("Binario obtener()", lambda: repo_binario.obtener("202501")),
+            ("Binario obtener() columnar", lambda: repo_columnar.obtener("202501")),
+            ("JSON total neto", lambda: calcular_total_neto(repo_json.obtener("202501").detalles)),
+            ("Binario total neto (mmap)", lambda: _total_binario(repo_binario, "202501")),
+        ]
+        
+        print(f"{args.empleados:,} detalles | JSON: {tamano_json / 1e6:.1f} MB | "
+              f"binario: {tamano_binario / 1e6:.1f} MB")
+        for nombre, funcion in mediciones:
+            segundos = _mejor_tiempo(funcion, args.repeticiones)
+            print(f"  {nombre:30} {segundos * 1000:10.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Generación determinista de datos sintéticos para los benchmarks
+"""
+import os
+import random
+from typing import Iterator, List
+
+from modelos import Empleado
+
+DEPARTAMENTOS = ['Ventas', 'Contabilidad', 'Sistemas', 'Bodega', 'Gerencia',
+                 'Talento Humano', 'Marketing', 'Logística']
+CARGOS = ['Asesor', 'Analista', 'Asistente', 'Jefe', 'Operador', 'Coordinador']
+NOMBRES = ['Ana', 'Luis', 'María', 'José', 'Carmen', 'Jorge', 'Lucía', 'Pedro',
+           'Rosa', 'Andrés', 'Sofía', 'Diego']
+APELLIDOS = ['Torres', 'Pérez', 'Zambrano', 'Mendoza', 'Vera', 'Cedeño',
+             'Morales', 'Ortiz', 'Bravo', 'Castro']
+
+def generar_empleados(cantidad: int, semilla: int = 42) -> Iterator[Empleado]:
+    """
+    Genera 'cantidad' empleados válidos; la misma semilla produce los mismos datos
+    """
+    aleatorio = random.Random(semilla)
+    for i in range(cantidad):
+        yield Empleado(
+            f"{i:010d}",
+            f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(APELLIDOS)}",
+            round(aleatorio.uniform(460.0, 4500.0), 2),
+            aleatorio.choice(DEPARTAMENTOS),
+            aleatorio.choice(CARGOS)
+        )
+
+def periodos_sinteticos(cantidad: int, desde: str = "202501") -> List[str]:
+    """
+    'cantidad' períodos YYYYMM consecutivos a partir de 'desde'
+    """
+    anio, mes = int(desde[:4]), int(desde[4:])
+    periodos = []
+    for _ in range(cantidad):
+        periodos.append(f"{anio}{mes:02d}")
+        anio, mes = (anio + 1, 1) if mes == 12 else (anio, mes + 1)
+    return periodos
+
+def preparar_directorio(directorio: str, empleados: int, periodos: int = 3, semilla: int = 42) -> List[str]:
+    """
+    Crea en 'directorio' la misma estructura que archivos/: empleados.json
+    con 'empleados' empleados sintéticos y una nómina JSON por período.
+    Con la misma semilla los archivos son idénticos.
+    Returns: Períodos generados
+    """
+    from repositorios import RepositorioEmpleadosJSON
+    from sistema import SistemaNominas
+
+    RepositorioEmpleadosJSON(os.path.join(directorio, "empleados.json")).guardar_varios(
+        generar_empleados(empleados, semilla))
+    sistema = SistemaNominas(directorio=directorio, cache_nominas=0)
+    generados = periodos_sinteticos(periodos)
+    for aniomes in generados:
+        sistema.generar_nomina_streaming(aniomes)
+    return generados
@@ -0,0 +1,130 @@
+"""
+Exactitud y rendimiento del motor de montos en centavos enteros
+(utils.dinero) contra el camino anterior en floats, sobre N detalles
+sintéticos con bonos y préstamos.
+
+Exactitud: IESS por fila y totales de la nómina comparados con una
+referencia en Decimal (mismas reglas de redondeo que utils.dinero).
+Rendimiento: creación de detalles, suma de totales y empaquetado de una
+columna (array 'd' en floats contra array 'q' en centavos).
+
+Uso:
+    python -m benchmarks.dinero
+    python -m benchmarks.dinero --filas 200000
+"""
+import argparse
+import math
+import random
+import time
+from array import array
+from decimal import Decimal, ROUND_HALF_UP
+from typing import List, Tuple
+
+from benchmarks.datos import generar_empleados
+from modelos import DetalleNomina
+from utils.dinero import a_monto
+
+class DetalleNominaFlotante:
+    """Cálculo anterior de DetalleNomina, con floats"""
+
+    __slots__ = ('id', 'empleado', 'sueldo', 'bono', 'tot_ing', 'iess',
+                 'prestamo', 'tot_des', 'neto')
+
+    def __init__(self, id: int, empleado, sueldo: float, bono: float, prestamo: float):
+        self.id = id
+        self.empleado = empleado
+        self.sueldo = sueldo
+        self.bono = bono
+        self.tot_ing = sueldo + bono
+        self.iess = round(sueldo * 0.0945, 2)
+        self.prestamo = prestamo
+        self.tot_des = self.iess + prestamo
+        self.neto = self.tot_ing - self.tot_des
+
+_CENTAVO = Decimal('0.01')
+_TASA = Decimal('0.0945')
+
+def generar_filas(filas: int, semilla: int = 11) -> List[Tuple]:
+    """
+    (empleado, sueldo, bono, préstamo) con montos de dos decimales
+    """
+    aleatorio = random.Random(semilla)
+    datos = []
+    for empleado in generar_empleados(filas):
+        bono = round(aleatorio.uniform(0, 500), 2) if aleatorio.random() < 0.4 else 0.0
+        prestamo = round(aleatorio.uniform(0, 300), 2) if aleatorio.random() < 0.2 else 0.0
+        datos.append((empleado, empleado.sueldo, bono, prestamo))
+    return datos
+
+def referencia(datos: List[Tuple]) -> Tuple[List[Decimal], Decimal]:
+    """
+    IESS por fila y neto total exactos en Decimal
+    """
+    iess, neto = [], Decimal(0)
+    for _, sueldo, bono, prestamo in datos:
+        sueldo, bono, prestamo = Decimal(repr(sueldo)), Decimal(repr(bono)), Decimal(repr(prestamo))
+        aporte = (sueldo * _TASA).quantize(_CENTAVO, rounding=ROUND_HALF_UP)
+        iess.append(aporte)
+        neto += sueldo + bono - aporte - prestamo
+    return iess, neto
+
+def _medir(funcion, *args):
+    t0 = time.perf_counter()
+    resultado = funcion(*args)
+    return time.perf_counter() - t0, resultado
+
+def _crear(clase, datos: List[Tuple]) -> list:
+    return [clase(i, empleado, sueldo, bono, prestamo)
+            for i, (empleado, sueldo, bono, prestamo) in enumerate(datos, 1)]
+
+def _sumar_flotantes(detalles) -> float:
+    total = 0.0
+    for detalle in detalles:
+        total += detalle.neto
+    return total
+
+def _sumar_centavos(detalles) -> int:
+    return sum(detalle.neto_centavos for detalle in detalles)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filas', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"Generando {args.filas:,} detalles...")
+    datos = generar_filas(args.filas)
+    iess_exacto, neto_exacto = referencia(datos)
+
+    t_flotante, flotantes = _medir(_crear, DetalleNominaFlotante, datos)
+    t_centavos, centavos = _medir(_crear, DetalleNomina, datos)
+
+    print("\nExactitud contra Decimal:")
+    errores_flotante = sum(1 for d, e in zip(flotantes, iess_exacto) if Decimal(repr(d.iess)) != e)
+    errores_centavos = sum(1 for d, e in zip(centavos, iess_exacto) if d.iess_centavos != int(e * 100))
+    print(f"  IESS distinto por fila      floats: {errores_flotante:,}   centavos: {errores_centavos:,}")
+
+    t_suma_flotante, suma = _medir(_sumar_flotantes, flotantes)
+    t_suma_centavos, suma_centavos = _medir(_sumar_centavos, centavos)
+    exacto = int(neto_exacto * 100)
+    for etiqueta, total in [("suma float", suma),
+                            ("math.fsum", math.fsum(d.neto for d in flotantes))]:
+        desvio = Decimal(repr(total)) - neto_exacto
+        print(f"  neto total {etiqueta:11} {total:,.6f}  desvío {desvio:+.6f}")
+    print(f"  neto total centavos    {a_monto(suma_centavos):,.2f}  desvío "
+          f"{(suma_centavos - exacto) / 100:+.2f}")
+
+    print(f"\n{'operación':28} {'floats (s)':>11} {'centavos (s)':>13} {'relación':>9}")
+    filas = [("crear detalles", t_flotante, t_centavos),
+             ("sumar neto", t_suma_flotante, t_suma_centavos)]
+    t_d, _ = _medir(array, 'd', (d.neto for d in flotantes))
+    t_q, _ = _medir(array, 'q', (d.neto_centavos for d in centavos))
+    filas.append(("empaquetar columna neto", t_d, t_q))
+    for operacion, a, b in filas:
+        print(f"{operacion:28} {a:11.3f} {b:13.3f} {b / a:8.2f}x")
+
+    if errores_centavos or suma_centavos != exacto:
+        raise SystemExit("❌ El motor en centavos no coincide con la referencia exacta")
+    print("✅ Centavos exactos en todas las filas y en el total")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compara la memoria pico (tracemalloc) y el tiempo de calcular las
+estadísticas de una nómina JSON cargándola con obtener() (json.load +
+objetos) y recorriéndola con iterar_detalles() (lector incremental).
+
+Uso:
+    python -m benchmarks.lectura_json_streaming --empleados 200000
+    python -m benchmarks.lectura_json_streaming --empleados 200000 --normalizado
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.datos import generar_empleados
+from modelos import Nomina, DetalleNomina
+from repositorios import RepositorioNominasJSON
+from utils import AcumuladorEstadisticas
+
+def _medir(funcion):
+    """
+    Ejecuta la función midiendo tiempo y memoria pico
+    Returns: (resultado, segundos, bytes pico)
+    """
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcion()
+    segundos = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, segundos, pico
+
+def _estadisticas_cargando(repo: RepositorioNominasJSON, aniomes: str) -> float:
+    nomina = repo.obtener(aniomes)
+    return AcumuladorEstadisticas(conservar_filas=False).agregar_todos(nomina.detalles).total_neto
+
+def _estadisticas_streaming(repo: RepositorioNominasJSON, aniomes: str) -> float:
+    return AcumuladorEstadisticas(conservar_filas=False).agregar_todos(repo.iterar_detalles(aniomes)).total_neto
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--empleados', type=int, default=200_000)
+    parser.add_argument('--normalizado', action='store_true',
+                        help="escribir la nómina con tabla de empleados")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        directorio += os.sep
+        repo = RepositorioNominasJSON(directorio, normalizado=args.normalizado)
+        detalles = (DetalleNomina(i, empleado, empleado.sueldo, Nomina.BONO, Nomina.PRESTAMO)
+                    for i, empleado in enumerate(generar_empleados(args.empleados), 1))
+        repo.guardar_streaming(1, "202501", detalles)
+        tamano = os.path.getsize(f"{directorio}nomina_202501.json")
+
+        print(f"{args.empleados:,} detalles | archivo: {tamano / 1e6:.1f} MB"
+              f"{' (normalizado)' if args.normalizado else ''}")
+        totales = []
+        for nombre, funcion in [
+            ("obtener() + estadísticas", lambda: _estadisticas_cargando(repo, "202501")),
+            ("iterar_detalles() + estadísticas", lambda: _estadisticas_streaming(repo, "202501")),
+        ]:
+            total, segundos, pico = _medir(funcion)
+            totales.append(total)
+            print(f"  {nombre:34} pico {pico / 1e6:9.1f} MB  {segundos:8.2f} s")
+        print(f"  Mismo total neto: {totales[0] == totales[1]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Mide con tracemalloc los bytes por fila de una nómina en memoria
+(Empleado + DetalleNomina) comparando los modelos compactos con __slots__
+contra las mismas clases con __dict__ por instancia.
+
+Uso:
+    python -m benchmarks.memoria_modelos --filas 1000000
+"""
+import argparse
+import gc
+import tracemalloc
+
+from modelos import Empleado, DetalleNomina, Nomina
+
+DEPARTAMENTOS = ['Ventas', 'Contabilidad', 'Sistemas', 'Bodega', 'Gerencia']
+CARGOS = ['Asesor', 'Analista', 'Asistente', 'Jefe', 'Operador']
+
+class EmpleadoConDict(Empleado):
+    """Misma lógica que Empleado pero con __dict__ por instancia"""
+
+class DetalleNominaConDict(DetalleNomina):
+    """Misma lógica que DetalleNomina pero con __dict__ por instancia"""
+
+def _copia(texto: str) -> str:
+    # Simula una cadena recién leída de archivo (objeto nuevo, no compartido)
+    return (texto + ' ')[:-1]
+
+def medir(filas: int, clase_empleado, clase_detalle) -> int:
+    """
+    Construye 'filas' detalles y devuelve los bytes asignados por fila
+    """
+    gc.collect()
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    
+    detalles = []
+    for i in range(filas):
+        sueldo = 450.0 + (i % 2500)
+        empleado = clase_empleado(
+            f"{i:010d}",
+            f"Empleado {i}",
+            sueldo,
+            _copia(DEPARTAMENTOS[i % len(DEPARTAMENTOS)]),
+            _copia(CARGOS[i % len(CARGOS)])
+        )
+        detalles.append(clase_detalle(i + 1, empleado, sueldo, Nomina.BONO, Nomina.PRESTAMO))
+    
+    usado = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    del detalles
+    return usado // filas
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filas', type=int, default=1_000_000)
+    args = parser.parse_args()
+    
+    compacto = medir(args.filas, Empleado, DetalleNomina)
+    con_dict = medir(args.filas, EmpleadoConDict, DetalleNominaConDict)
+    
+    print(f"Filas: {args.filas:,}")
+    print(f"Con __slots__: {compacto:,} bytes/fila")
+    print(f"Con __dict__:  {con_dict:,} bytes/fila")
+    print(f"Ahorro: {con_dict - compacto:,} bytes/fila ({(1 - compacto / con_dict) * 100:.1f}%)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compara la generación secuencial (generar_nomina_streaming) con la paralela
+(generar_nomina_paralela) variando la cantidad de procesos. Para cada
+cantidad se muestra la aceleración frente al secuencial y la eficiencia
+por proceso; con más procesos que núcleos la aceleración no puede crecer.
+
+Uso:
+    python -m benchmarks.nomina_paralela --empleados 100000 1000000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.datos import generar_empleados
+from sistema import SistemaNominas
+
+def _sistema(directorio: str, empleados: int) -> SistemaNominas:
+    """
+    Sistema aislado en un directorio temporal con 'empleados' empleados sintéticos
+    """
+    # Sin caché: se mide la generación y escritura, no la nómina guardada en memoria
+    sistema = SistemaNominas(directorio=directorio, cache_nominas=0)
+    sistema.repo_empleados.guardar_varios(generar_empleados(empleados))
+    return sistema
+
+def _medir(funcion, *args, **kwargs) -> float:
+    inicio = time.perf_counter()
+    funcion(*args, **kwargs)
+    return time.perf_counter() - inicio
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--empleados', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument('--particion', choices=['departamento', 'bloques'], default='bloques')
+    parser.add_argument('--tamano-bloque', type=int, default=10_000)
+    args = parser.parse_args()
+    
+    nucleos = os.cpu_count() or 1
+    print(f"Núcleos disponibles: {nucleos}")
+    for cantidad in args.empleados:
+        with tempfile.TemporaryDirectory() as directorio:
+            sistema = _sistema(directorio, cantidad)
+            secuencial = _medir(sistema.generar_nomina_streaming, "202501")
+            print(f"\n{cantidad:,} empleados - secuencial: {secuencial:.2f} s")
+            for workers in args.workers:
+                segundos = _medir(sistema.generar_nomina_paralela, "202501", workers=workers,
+                                  particion=args.particion, tamano_bloque=args.tamano_bloque)
+                aceleracion = secuencial / segundos
+                aviso = " (más procesos que núcleos)" if workers > nucleos else ""
+                print(f"  {workers:>2} procesos: {segundos:.2f} s (x{aceleracion:.2f}, "
+                      f"eficiencia {aceleracion / workers:.0%}){aviso}")
+
+if __name__ == "__main__":
+    main()
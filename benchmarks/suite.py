@@ -0,0 +1,314 @@
+"""
+Suite de benchmarks de las rutas críticas con datos sintéticos deterministas.
+
+Para cada tamaño se genera un directorio con empleados.json y varias
+nóminas (benchmarks.datos.preparar_directorio) y cada caso se ejecuta en su
+propio proceso, así el pico de RSS es el del caso y no el de toda la suite.
+Por caso se reporta: operaciones/s, segundos por operación, pico de
+tracemalloc (de una operación) y pico de RSS del proceso.
+
+El resultado es JSON. Con --comparar se contrasta contra un resultado
+guardado y se marca como regresión cualquier caso cuyas ops/s bajen, o
+cuyos picos de memoria suban, más que la tolerancia; en ese caso el
+código de salida es 1.
+
+Uso:
+    python -m benchmarks.suite --tamanos 1000 100000 --salida base.json
+    python -m benchmarks.suite --tamanos 1000 100000 --comparar base.json
+    python -m benchmarks.suite --tamanos 1000000 --casos nominas_obtener estadisticas_avanzadas
+"""
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows: sin pico de RSS
+    resource = None
+
+from benchmarks.datos import periodos_sinteticos, preparar_directorio
+
+VERSION_FORMATO = 1
+
+# --- CASOS ---
+# Cada caso prepara sus datos (fuera de la medición) y devuelve la operación
+# a medir. 'filas' es cuántas filas se procesan como máximo entre todas las
+# repeticiones: los casos O(n) hacen menos repeticiones en tamaños grandes.
+
+def _cedula(tamano: int, i: int) -> str:
+    return f"{(i * 7919) % tamano:010d}"
+
+def _empleados_obtener(directorio: str, tamano: int) -> Callable[[], None]:
+    from repositorios import RepositorioEmpleadosJSON
+    repo = RepositorioEmpleadosJSON(os.path.join(directorio, "empleados.json"))
+    contador = iter(range(10 ** 9))
+    return lambda: repo.obtener(_cedula(tamano, next(contador)))
+
+def _empleados_obtener_todos(directorio: str, tamano: int) -> Callable[[], None]:
+    from repositorios import RepositorioEmpleadosJSON
+    repo = RepositorioEmpleadosJSON(os.path.join(directorio, "empleados.json"))
+    return repo.obtener_todos
+
+def _empleados_crud(directorio: str, tamano: int) -> Callable[[], None]:
+    """
+    Una operación = crear, actualizar y eliminar un empleado nuevo (el archivo queda igual)
+    """
+    from modelos import Empleado
+    from repositorios import RepositorioEmpleadosJSON
+    repo = RepositorioEmpleadosJSON(os.path.join(directorio, "empleados.json"))
+
+    def operacion():
+        empleado = Empleado("9999999999", "Empleado Benchmark", 1000.0, "Sistemas", "Analista")
+        repo.guardar(empleado)
+        empleado.sueldo = 1100.0
+        repo.guardar(empleado)
+        repo.eliminar(empleado.cedula)
+    return operacion
+
+def _generar_nomina_mensual(directorio: str, tamano: int) -> Callable[[], None]:
+    """
+    Genera en un directorio aparte para no alterar las nóminas de los demás casos
+    """
+    from sistema import SistemaNominas
+    aparte = tempfile.mkdtemp(dir=directorio)
+    shutil.copy(os.path.join(directorio, "empleados.json"), aparte)
+    sistema = SistemaNominas(directorio=aparte, cache_nominas=0)
+    return lambda: sistema.generar_nomina_mensual("209901")
+
+def _nominas_obtener(directorio: str, tamano: int) -> Callable[[], None]:
+    from repositorios import RepositorioNominasJSON
+    repo = RepositorioNominasJSON(os.path.join(directorio, "nominas") + os.sep)
+    return lambda: repo.obtener(periodos_sinteticos(1)[0])
+
+def _detalles(directorio: str):
+    from repositorios import RepositorioNominasJSON
+    repo = RepositorioNominasJSON(os.path.join(directorio, "nominas") + os.sep)
+    return repo.obtener(periodos_sinteticos(1)[0]).detalles
+
+def _estadisticas_avanzadas(directorio: str, tamano: int) -> Callable[[], None]:
+    from utils import generar_estadisticas_avanzadas
+    detalles = _detalles(directorio)
+    return lambda: generar_estadisticas_avanzadas(detalles)
+
+def _metricas_departamento(directorio: str, tamano: int) -> Callable[[], None]:
+    from utils import calcular_metricas_departamento
+    detalles = _detalles(directorio)
+    return lambda: calcular_metricas_departamento(detalles)
+
+def _total_neto(directorio: str, tamano: int) -> Callable[[], None]:
+    from utils import calcular_total_neto
+    detalles = _detalles(directorio)
+    return lambda: calcular_total_neto(detalles)
+
+def _calcular_total_nominas(directorio: str, tamano: int) -> Callable[[], None]:
+    from sistema import SistemaNominas
+    sistema = SistemaNominas(directorio=directorio, cache_nominas=0)
+    return sistema.calcular_total_nominas
+
+def _reconstruir_indice(directorio: str, tamano: int) -> Callable[[], None]:
+    """
+    Lo que cuesta calcular_total_nominas cuando falta el índice de resúmenes
+    """
+    from repositorios import RepositorioNominasJSON
+    repo = RepositorioNominasJSON(os.path.join(directorio, "nominas") + os.sep)
+    return repo.reconstruir_indice
+
+# nombre -> (preparación, filas procesadas como máximo entre todas las repeticiones)
+CASOS: Dict[str, Tuple[Callable[[str, int], Callable[[], None]], int]] = {
+    'empleados_obtener': (_empleados_obtener, 1_000_000),
+    'empleados_obtener_todos': (_empleados_obtener_todos, 1_000_000),
+    'empleados_crud': (_empleados_crud, 300_000),
+    'generar_nomina_mensual': (_generar_nomina_mensual, 200_000),
+    'nominas_obtener': (_nominas_obtener, 500_000),
+    'estadisticas_avanzadas': (_estadisticas_avanzadas, 2_000_000),
+    'metricas_departamento': (_metricas_departamento, 2_000_000),
+    'total_neto': (_total_neto, 10_000_000),
+    'calcular_total_nominas': (_calcular_total_nominas, 100_000_000),
+    'reconstruir_indice': (_reconstruir_indice, 500_000),
+}
+
+# Máximo de repeticiones de un caso (los casos baratos no corren indefinidamente)
+MAX_REPETICIONES = 200
+
+def repeticiones(caso: str, tamano: int) -> int:
+    return max(1, min(MAX_REPETICIONES, CASOS[caso][1] // max(tamano, 1)))
+
+def _pico_rss() -> Optional[int]:
+    """
+    Pico de memoria residente del proceso en bytes (None si no se puede medir)
+    """
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux lo reporta en KiB y macOS en bytes
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+def ejecutar_caso(caso: str, directorio: str, tamano: int) -> Dict:
+    """
+    Prepara y mide un caso en el proceso actual
+    """
+    preparar, _ = CASOS[caso]
+    operacion = preparar(directorio, tamano)
+    veces = repeticiones(caso, tamano)
+
+    gc.collect()
+    inicio = time.perf_counter()
+    for _ in range(veces):
+        operacion()
+    segundos = time.perf_counter() - inicio
+
+    # Una operación más con tracemalloc (su costo no entra en el tiempo)
+    gc.collect()
+    tracemalloc.start()
+    operacion()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'caso': caso,
+        'tamano': tamano,
+        'repeticiones': veces,
+        'segundos': segundos,
+        'segundos_por_op': segundos / veces,
+        'ops_por_segundo': veces / segundos if segundos else None,
+        'pico_tracemalloc': pico,
+        'pico_rss': _pico_rss()
+    }
+
+def _ejecutar_en_proceso(caso: str, directorio: str, tamano: int) -> Dict:
+    proceso = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.suite', '--caso', caso, '--directorio', directorio,
+         '--tamanos', str(tamano)],
+        capture_output=True, text=True
+    )
+    if proceso.returncode != 0:
+        raise RuntimeError(f"El caso {caso} ({tamano:,}) falló:\n{proceso.stderr[-2000:]}")
+    return json.loads(proceso.stdout)
+
+# --- COMPARACIÓN ---
+# Métricas comparadas: (clave, True si más alto es mejor)
+METRICAS = (('ops_por_segundo', True), ('pico_tracemalloc', False), ('pico_rss', False))
+
+# Picos de memoria menores que esto no se comparan (unos pocos bytes de diferencia
+# en un pico de 1 KB no son una regresión)
+MEMORIA_MINIMA = 64 * 1024
+
+def comparar(resultados: List[Dict], base: List[Dict], tolerancia: float) -> List[Dict]:
+    """
+    Compara cada caso con el mismo caso y tamaño de la base
+    Returns: Una entrada por caso comparado con los cocientes y las regresiones
+    """
+    por_clave = {(r['caso'], r['tamano']): r for r in base}
+    comparacion = []
+    for resultado in resultados:
+        anterior = por_clave.get((resultado['caso'], resultado['tamano']))
+        if anterior is None:
+            continue
+        entrada = {'caso': resultado['caso'], 'tamano': resultado['tamano'], 'regresiones': []}
+        for metrica, mayor_es_mejor in METRICAS:
+            actual, previo = resultado.get(metrica), anterior.get(metrica)
+            if not actual or not previo:
+                continue
+            cociente = actual / previo
+            entrada[metrica] = cociente
+            if not mayor_es_mejor and max(actual, previo) < MEMORIA_MINIMA:
+                continue
+            if (cociente < 1 - tolerancia) if mayor_es_mejor else (cociente > 1 + tolerancia):
+                entrada['regresiones'].append(metrica)
+        comparacion.append(entrada)
+    return comparacion
+
+def _mostrar(resultado: Dict, comparacion: Optional[Dict] = None) -> None:
+    linea = (f"  {resultado['caso']:24} {resultado['tamano']:>10,}  "
+             f"{resultado['ops_por_segundo']:12,.2f} ops/s  "
+             f"tracemalloc {resultado['pico_tracemalloc'] / 1e6:9.1f} MB  "
+             f"RSS {(resultado['pico_rss'] or 0) / 1e6:8.1f} MB")
+    if comparacion is not None:
+        linea += f"  x{comparacion.get('ops_por_segundo', 0):.2f}"
+        if comparacion['regresiones']:
+            linea += f"  ❌ regresión: {', '.join(comparacion['regresiones'])}"
+    print(linea, file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[1_000, 100_000],
+                        help="cantidades de empleados (por ejemplo 1000 100000 1000000)")
+    parser.add_argument('--casos', nargs='+', choices=list(CASOS), default=list(CASOS))
+    parser.add_argument('--periodos', type=int, default=3, help="nóminas generadas por tamaño")
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--salida', help="archivo donde guardar el resultado JSON")
+    parser.add_argument('--comparar', help="resultado JSON guardado con el que comparar")
+    parser.add_argument('--tolerancia', type=float, default=0.25,
+                        help="variación relativa aceptada antes de marcar regresión")
+    # Uso interno: ejecutar un solo caso sobre un directorio ya preparado
+    parser.add_argument('--caso', help=argparse.SUPPRESS)
+    parser.add_argument('--directorio', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.caso:
+        # Los mensajes del sistema van a stderr para no mezclarse con el JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            resultado = ejecutar_caso(args.caso, args.directorio, args.tamanos[0])
+        print(json.dumps(resultado))
+        return
+
+    resultados = []
+    preparacion = {}
+    for tamano in args.tamanos:
+        with tempfile.TemporaryDirectory() as directorio:
+            print(f"\n{tamano:,} empleados, {args.periodos} nóminas", file=sys.stderr)
+            inicio = time.perf_counter()
+            with contextlib.redirect_stdout(sys.stderr):
+                preparar_directorio(directorio, tamano, args.periodos, args.semilla)
+            preparacion[str(tamano)] = time.perf_counter() - inicio
+            for caso in args.casos:
+                resultado = _ejecutar_en_proceso(caso, directorio, tamano)
+                resultados.append(resultado)
+                _mostrar(resultado)
+
+    informe = {
+        'version': VERSION_FORMATO,
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'cpus': os.cpu_count(),
+        'periodos': args.periodos,
+        'semilla': args.semilla,
+        'preparacion_segundos': preparacion,
+        'resultados': resultados
+    }
+
+    regresiones = False
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            base = json.load(f)
+        informe['comparacion'] = comparar(resultados, base['resultados'], args.tolerancia)
+        print(f"\nComparación con {args.comparar} (tolerancia {args.tolerancia:.0%})", file=sys.stderr)
+        por_clave = {(c['caso'], c['tamano']): c for c in informe['comparacion']}
+        for resultado in resultados:
+            _mostrar(resultado, por_clave.get((resultado['caso'], resultado['tamano'])))
+        regresiones = any(c['regresiones'] for c in informe['comparacion'])
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump(informe, f, indent=2)
+    else:
+        print(json.dumps(informe, indent=2))
+
+    if regresiones:
+        print("❌ Hay regresiones respecto a la base", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
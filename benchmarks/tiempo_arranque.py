@@ -0,0 +1,102 @@
+"""
+Presupuesto de arranque de la línea de comandos: ejecuta un subcomando de
+main.py con `python -X importtime`, suma el tiempo de los imports de primer
+nivel y falla (código 1) si supera el presupuesto. Muestra también el tiempo
+total del proceso y los imports más costosos.
+
+Uso:
+    python -m benchmarks.tiempo_arranque
+    python -m benchmarks.tiempo_arranque --presupuesto-ms 60 --repeticiones 10
+    python -m benchmarks.tiempo_arranque stats --periodo 202501
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+from benchmarks.datos import generar_empleados
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _leer_importtime(salida: str) -> Tuple[float, Dict[str, float]]:
+    """
+    Interpreta las líneas 'import time: propio | acumulado | módulo'
+    Returns: (milisegundos de los imports de primer nivel, acumulado por módulo)
+    """
+    total = 0.0
+    acumulados = {}
+    for linea in salida.splitlines():
+        if not linea.startswith('import time:') or 'cumulative' in linea:
+            continue
+        _, acumulado, modulo = linea[len('import time:'):].split('|')
+        acumulados[modulo.strip()] = int(acumulado) / 1000
+        # Los submódulos vienen indentados; su tiempo ya está en el de su padre
+        if not modulo.startswith('  '):
+            total += int(acumulado) / 1000
+    return total, acumulados
+
+def _ejecutar(argumentos: List[str]) -> Tuple[float, float, Dict[str, float]]:
+    """
+    Ejecuta main.py una vez
+    Returns: (ms de imports, ms del proceso, acumulado por módulo)
+    """
+    inicio = time.perf_counter()
+    proceso = subprocess.run([sys.executable, '-X', 'importtime', 'main.py', *argumentos],
+                             cwd=RAIZ, capture_output=True, text=True)
+    milisegundos = (time.perf_counter() - inicio) * 1000
+    if proceso.returncode != 0:
+        raise SystemExit(f"❌ main.py {' '.join(argumentos)} terminó con código {proceso.returncode}:\n"
+                         f"{proceso.stderr[-2000:]}")
+    imports, acumulados = _leer_importtime(proceso.stderr)
+    return imports, milisegundos, acumulados
+
+def preparar_datos(directorio: str, empleados: int) -> None:
+    """
+    Datos de prueba: empleados sintéticos y una nómina generada
+    """
+    from sistema import SistemaNominas
+    sistema = SistemaNominas(directorio=directorio)
+    sistema.repo_empleados.guardar_varios(generar_empleados(empleados))
+    sistema.generar_nomina_streaming("202501")
+
+def medir_arranque(directorio: str, comando: List[str],
+                   repeticiones: int) -> Tuple[float, float, Dict[str, float]]:
+    """
+    Ejecuta el comando sobre los datos de 'directorio' varias veces; el
+    mínimo de las ejecuciones descarta el ruido del sistema
+    Returns: (ms de imports, ms del proceso, acumulado por módulo) de la mejor
+    """
+    mediciones = [_ejecutar(['--datos', directorio, *comando]) for _ in range(repeticiones)]
+    return min(mediciones, key=lambda medicion: medicion[0])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--presupuesto-ms', type=float, default=100.0,
+                        help="máximo de milisegundos en imports")
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--empleados', type=int, default=1_000)
+    parser.add_argument('--mostrar', type=int, default=10, help="imports más costosos a mostrar")
+    args, comando = parser.parse_known_args()
+    comando = comando or ['listar']
+
+    with tempfile.TemporaryDirectory() as directorio:
+        preparar_datos(directorio, args.empleados)
+        imports, proceso, acumulados = medir_arranque(directorio, comando, args.repeticiones)
+
+    print(f"main.py {' '.join(comando)} | mejor de {args.repeticiones}")
+    print(f"  imports: {imports:8.1f} ms (presupuesto {args.presupuesto_ms:.0f} ms)")
+    print(f"  proceso: {proceso:8.1f} ms")
+    print(f"  imports más costosos (acumulado):")
+    for modulo, milisegundos in sorted(acumulados.items(), key=lambda item: -item[1])[:args.mostrar]:
+        print(f"    {modulo:45} {milisegundos:8.1f} ms")
+
+    if imports > args.presupuesto_ms:
+        print(f"❌ Los imports superan el presupuesto por {imports - args.presupuesto_ms:.1f} ms")
+        sys.exit(1)
+    print("✅ Dentro del presupuesto")
+
+if __name__ == "__main__":
+    main()
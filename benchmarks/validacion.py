@@ -0,0 +1,122 @@
+"""
+Rendimiento de la validación de empleados con el esquema compilado
+(utils.validacion) sobre N registros sintéticos, con una fracción de filas
+inválidas. Compara las formas de uso: registro por registro
+(validar_datos_empleado), decorador validar_empleado_completo, lote de
+diccionarios (validar_lote) y lote columnar (validar_columnas), y verifica
+que todas encuentren las mismas filas inválidas.
+
+Uso:
+    python -m benchmarks.validacion
+    python -m benchmarks.validacion --registros 100000 --invalidos 0.05
+"""
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from benchmarks.datos import generar_empleados
+from utils.decoradores import validar_datos_empleado, validar_empleado_completo
+from utils.validacion import ESQUEMA_EMPLEADO
+
+# Valores que rompen una regla distinta cada uno
+INVALIDOS = {
+    'cedula': ['123', '', 'abcdefghij'],
+    'nombre': ['A', 'Ana3', '  '],
+    'sueldo': [0, -10.0, 'mil'],
+    'departamento': ['V', ''],
+    'cargo': ['J', None],
+}
+
+# Filas por bloque al armar los diccionarios (su construcción no se mide)
+BLOQUE = 100_000
+
+def generar_columnas(registros: int, invalidos: float, semilla: int = 7) -> Dict[str, List]:
+    """
+    Columnas de 'registros' empleados; una fracción 'invalidos' con un campo roto
+    """
+    columnas = {campo: [] for campo in ESQUEMA_EMPLEADO.nombres}
+    for empleado in generar_empleados(registros):
+        for campo, valores in columnas.items():
+            valores.append(getattr(empleado, campo))
+    aleatorio = random.Random(semilla)
+    for fila in aleatorio.sample(range(registros), int(registros * invalidos)):
+        campo = aleatorio.choice(list(INVALIDOS))
+        columnas[campo][fila] = aleatorio.choice(INVALIDOS[campo])
+    return columnas
+
+def _bloques_de_registros(columnas: Dict[str, List], total: int):
+    nombres = ESQUEMA_EMPLEADO.nombres
+    for inicio in range(0, total, BLOQUE):
+        partes = [columnas[nombre][inicio:inicio + BLOQUE] for nombre in nombres]
+        yield inicio, [dict(zip(nombres, fila)) for fila in zip(*partes)]
+
+def medir_por_registro(columnas: Dict[str, List], total: int):
+    invalidas, segundos = set(), 0.0
+    for inicio, registros in _bloques_de_registros(columnas, total):
+        t0 = time.perf_counter()
+        for fila, registro in enumerate(registros, inicio):
+            if validar_datos_empleado(**registro):
+                invalidas.add(fila)
+        segundos += time.perf_counter() - t0
+    return segundos, invalidas
+
+def medir_decorador(columnas: Dict[str, List], total: int):
+    @validar_empleado_completo
+    def crear(cedula, nombre, sueldo, departamento, cargo):
+        return None
+
+    invalidas, segundos = set(), 0.0
+    for inicio, registros in _bloques_de_registros(columnas, total):
+        t0 = time.perf_counter()
+        for fila, registro in enumerate(registros, inicio):
+            try:
+                crear(**registro)
+            except ValueError:
+                invalidas.add(fila)
+        segundos += time.perf_counter() - t0
+    return segundos, invalidas
+
+def medir_lote(columnas: Dict[str, List], total: int):
+    invalidas, segundos = set(), 0.0
+    for inicio, registros in _bloques_de_registros(columnas, total):
+        t0 = time.perf_counter()
+        resultado = ESQUEMA_EMPLEADO.validar_lote(registros)
+        segundos += time.perf_counter() - t0
+        invalidas.update(inicio + fila for fila in resultado.errores)
+    return segundos, invalidas
+
+def medir_columnas(columnas: Dict[str, List], total: int):
+    t0 = time.perf_counter()
+    resultado = ESQUEMA_EMPLEADO.validar_columnas(columnas)
+    return time.perf_counter() - t0, set(resultado.errores)
+
+MODOS = {
+    'por registro': medir_por_registro,
+    'decorador': medir_decorador,
+    'lote (dicts)': medir_lote,
+    'columnar': medir_columnas,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--registros', type=int, default=1_000_000)
+    parser.add_argument('--invalidos', type=float, default=0.01, help="fracción de filas inválidas")
+    args = parser.parse_args()
+
+    print(f"Generando {args.registros:,} registros ({args.invalidos:.0%} inválidos)...")
+    columnas = generar_columnas(args.registros, args.invalidos)
+
+    referencia = None
+    print(f"{'modo':15} {'segundos':>9} {'registros/s':>13} {'inválidas':>10}")
+    for modo, medir in MODOS.items():
+        segundos, invalidas = medir(columnas, args.registros)
+        print(f"{modo:15} {segundos:9.2f} {args.registros / segundos:13,.0f} {len(invalidas):10,}")
+        if referencia is None:
+            referencia = invalidas
+        elif invalidas != referencia:
+            raise SystemExit(f"❌ '{modo}' encontró filas inválidas distintas")
+    print("✅ Todos los modos coinciden")
+
+if __name__ == "__main__":
+    main()
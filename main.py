@@ -1,4 +1,37 @@
-from sistema import SistemaNominas 
+"""
+Sistema de gestión de nóminas.
+
+Sin argumentos abre el menú interactivo; con un subcomando se ejecuta una
+sola operación y el resultado se escribe en JSON por la salida estándar
+(los mensajes del sistema van a la salida de errores).
+
+Uso:
+    python main.py listar [nominas|empleados]
+    python main.py generar --periodo 202510 [--workers 4]
+    python main.py reporte --periodo 202510 [--texto]
+    python main.py stats --periodo 202510 [--avanzadas | --departamentos]
+    python main.py stats --desde 202501 --hasta 202512
+    python main.py exportar [--periodo 202510] [--formato csv|jsonl] [--salida archivo]
+    python main.py importar empleados.csv [--formato csv|jsonl]
+    python main.py --perfil perfiles [--perfil-resumen] [comando ...]
+
+Con --perfil (o --profile) cada operación del sistema (o el subcomando
+completo) se perfila con cProfile y tracemalloc: en el directorio quedan un
+.pstats y un resumen de asignaciones por operación. Sin subcomando perfila
+las acciones del menú interactivo.
+
+Con --journal los cambios de empleados se agregan a empleados.journal.jsonl
+en lugar de reescribir empleados.json (se compactan al crecer el journal).
+
+Códigos de salida: 0 éxito, 1 error, 2 argumentos no válidos, 3 no encontrado.
+"""
+from typing import TYPE_CHECKING
+import argparse
+import sys
+
+# El sistema se importa al usarlo: así un subcomando simple arranca rápido
+if TYPE_CHECKING:
+    from sistema import SistemaNominas
 
 def mostrar_menu():
     """
@@ -54,7 +87,7 @@ def input_sueldo():
         except ValueError:
             print("❌ Ingrese un valor numérico válido")
 
-def menu_empleados(sistema: SistemaNominas):
+def menu_empleados(sistema: 'SistemaNominas'):
     """
     Submenú completo para gestión de empleados
     """
@@ -193,7 +226,7 @@ def menu_empleados(sistema: SistemaNominas):
         else:
             print("❌ Opción no válida")
 
-def menu_nominas(sistema: SistemaNominas):
+def menu_nominas(sistema: 'SistemaNominas'):
     """
     Submenú para gestión de nóminas
     """
@@ -258,7 +291,7 @@ def menu_nominas(sistema: SistemaNominas):
         else:
             print("❌ Opción no válida")
 
-def menu_estadisticas(sistema: SistemaNominas):
+def menu_estadisticas(sistema: 'SistemaNominas'):
     """
     Submenú para estadísticas y reportes
     """
@@ -325,11 +358,16 @@ def menu_estadisticas(sistema: SistemaNominas):
         else:
             print("❌ Opción no válida")
 
-def main():
+def menu_principal(backend: str = "json", directorio: str = "archivos", perfilador=None,
+                   journal: bool = False):
     """
-    Función principal del sistema
+    Menú interactivo del sistema
+    Con un perfilador, cada llamada al sistema desde el menú se perfila
     """
-    sistema = SistemaNominas()
+    from sistema import SistemaNominas
+    sistema = SistemaNominas(backend=backend, directorio=directorio, journal=journal)
+    if perfilador is not None:
+        sistema = perfilador.envolver(sistema)
     
     print("🚀 Iniciando Sistema de Gestión de Nóminas...")
     
@@ -358,5 +396,248 @@ def main():
         except Exception as e:
             print(f"❌ Error inesperado: {e}")
 
+# --- INTERFAZ DE LÍNEA DE COMANDOS ---
+EXITO = 0
+ERROR = 1
+NO_ENCONTRADO = 3
+
+# Columnas de la exportación CSV de una nómina (datos del empleado aplanados)
+COLUMNAS_EXPORTACION = ('id', 'cedula', 'nombre', 'departamento', 'cargo', 'sueldo',
+                        'bono', 'tot_ing', 'iess', 'prestamo', 'tot_des', 'neto')
+
+class ErrorComando(Exception):
+    """
+    Error de un subcomando con su código de salida
+    """
+
+    def __init__(self, mensaje: str, codigo: int = ERROR):
+        super().__init__(mensaje)
+        self.codigo = codigo
+
+def _requerir(valor, mensaje: str):
+    """
+    Devuelve el valor o termina con NO_ENCONTRADO si está vacío
+    """
+    if not valor:
+        raise ErrorComando(mensaje, NO_ENCONTRADO)
+    return valor
+
+def comando_listar(sistema: 'SistemaNominas', args, salida):
+    if args.que == 'empleados':
+        return sistema.listar_empleados()
+    from utils import resumen_publico
+    return [resumen_publico(resumen) for resumen in sistema.repo_nominas.obtener_resumenes()]
+
+def comando_generar(sistema: 'SistemaNominas', args, salida):
+    if args.workers:
+        resumen = sistema.generar_nomina_paralela(args.periodo, workers=args.workers)
+    else:
+        resumen = sistema.generar_nomina_streaming(args.periodo)
+    if resumen is None:
+        raise ErrorComando(f"No se pudo generar la nómina {args.periodo}")
+    return resumen
+
+def comando_reporte(sistema: 'SistemaNominas', args, salida):
+    if args.texto:
+        _requerir(sistema.obtener_nomina(args.periodo), f"No se encontró nómina para el período {args.periodo}")
+        salida.write(sistema.generar_reporte_completo(args.periodo) + "\n")
+        return None
+    return {
+        'estadisticas': _requerir(sistema.generar_estadisticas_nomina(args.periodo),
+                                  f"No se encontró nómina para el período {args.periodo}"),
+        'avanzadas': sistema.generar_estadisticas_avanzadas(args.periodo),
+        'departamentos': sistema.generar_metricas_departamento(args.periodo)
+    }
+
+def comando_stats(sistema: 'SistemaNominas', args, salida):
+    if args.periodo is None:
+        import asyncio
+        return asyncio.run(sistema.generar_estadisticas_periodos_async(args.desde, args.hasta))
+    if args.avanzadas:
+        estadisticas = sistema.generar_estadisticas_avanzadas(args.periodo)
+    elif args.departamentos:
+        estadisticas = sistema.generar_metricas_departamento(args.periodo)
+    else:
+        estadisticas = sistema.generar_estadisticas_nomina(args.periodo)
+    return _requerir(estadisticas, f"No se encontró nómina para el período {args.periodo}")
+
+def _filas_exportacion(sistema: 'SistemaNominas', periodo):
+    """
+    Filas a exportar: detalles de la nómina (leídos sin cargarla) o empleados
+    """
+    if periodo is None:
+        for empleado in sistema.repo_empleados.iterar_todos():
+            yield empleado.to_dict()
+        return
+    for detalle in sistema.repo_nominas.iterar_detalles(periodo):
+        fila = detalle.to_dict()
+        fila.update(fila.pop('empleado'))
+        yield {columna: fila[columna] for columna in COLUMNAS_EXPORTACION}
+
+def comando_exportar(sistema: 'SistemaNominas', args, salida):
+    import csv
+    import json
+    if args.periodo is not None:
+        _requerir(args.periodo in sistema.listar_nominas(),
+                  f"No se encontró nómina para el período {args.periodo}")
+        columnas = COLUMNAS_EXPORTACION
+    else:
+        from sistema.sistema_nominas import CAMPOS_EMPLEADO
+        columnas = CAMPOS_EMPLEADO
+
+    destino = open(args.salida, 'w', encoding='utf-8', newline='') if args.salida else salida
+    filas = 0
+    try:
+        if args.formato == 'csv':
+            escritor = csv.DictWriter(destino, fieldnames=columnas)
+            escritor.writeheader()
+            for fila in _filas_exportacion(sistema, args.periodo):
+                escritor.writerow(fila)
+                filas += 1
+        else:
+            for fila in _filas_exportacion(sistema, args.periodo):
+                destino.write(json.dumps(fila, ensure_ascii=False) + "\n")
+                filas += 1
+    finally:
+        if args.salida:
+            destino.close()
+    # Sin --salida los datos ya ocupan la salida estándar
+    return {'archivo': args.salida, 'formato': args.formato, 'filas': filas} if args.salida else None
+
+def comando_importar(sistema: 'SistemaNominas', args, salida):
+    resultado = sistema.importar_empleados(args.archivo, args.formato)
+    if resultado is None:
+        raise ErrorComando(f"No se pudo importar {args.archivo}")
+    return resultado
+
+def _periodo(valor: str) -> str:
+    if len(valor) != 6 or not valor.isdigit():
+        raise argparse.ArgumentTypeError("el período debe tener el formato YYYYMM")
+    return valor
+
+def crear_parser() -> argparse.ArgumentParser:
+    """
+    Parser de la interfaz de línea de comandos (un subparser por operación)
+    """
+    parser = argparse.ArgumentParser(prog="main.py", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--backend', choices=("json", "sqlite", "binario"), default="json")
+    parser.add_argument('--datos', default="archivos", help="directorio con empleados y nóminas")
+    parser.add_argument('--journal', action='store_true',
+                        help="guardar los cambios de empleados en un journal (JSONL) en lugar de reescribir el archivo")
+    parser.add_argument('--metricas', action='store_true',
+                        help="escribir en la salida de errores las métricas de la ejecución (JSON)")
+    parser.add_argument('--perfil', '--profile', metavar='DIRECTORIO',
+                        help="perfilar cada operación (cProfile + tracemalloc) en el directorio")
+    parser.add_argument('--perfil-resumen', action='store_true',
+                        help="con --perfil, mostrar tiempo y memoria tras cada operación")
+    # Sin subcomando se abre el menú interactivo (útil con --perfil)
+    subparsers = parser.add_subparsers(dest='comando', metavar='comando')
+
+    listar = subparsers.add_parser('listar', help="lista nóminas (resúmenes) o empleados")
+    listar.add_argument('que', nargs='?', choices=('nominas', 'empleados'), default='nominas')
+    listar.set_defaults(funcion=comando_listar)
+
+    generar = subparsers.add_parser('generar', help="genera la nómina de un período")
+    generar.add_argument('--periodo', type=_periodo, required=True)
+    generar.add_argument('--workers', type=int, help="procesos para la generación paralela")
+    generar.set_defaults(funcion=comando_generar)
+
+    reporte = subparsers.add_parser('reporte', help="estadísticas completas de un período")
+    reporte.add_argument('--periodo', type=_periodo, required=True)
+    reporte.add_argument('--texto', action='store_true', help="reporte legible en lugar de JSON")
+    reporte.set_defaults(funcion=comando_reporte)
+
+    stats = subparsers.add_parser('stats', help="estadísticas de un período o de un rango")
+    stats.add_argument('--periodo', type=_periodo)
+    stats.add_argument('--desde', type=_periodo)
+    stats.add_argument('--hasta', type=_periodo)
+    tipo = stats.add_mutually_exclusive_group()
+    tipo.add_argument('--avanzadas', action='store_true')
+    tipo.add_argument('--departamentos', action='store_true')
+    stats.set_defaults(funcion=comando_stats)
+
+    exportar = subparsers.add_parser('exportar', help="exporta una nómina o los empleados (sin --periodo)")
+    exportar.add_argument('--periodo', type=_periodo)
+    exportar.add_argument('--formato', choices=('csv', 'jsonl'), default='csv')
+    exportar.add_argument('--salida', help="archivo de destino (por defecto la salida estándar)")
+    exportar.set_defaults(funcion=comando_exportar)
+
+    importar = subparsers.add_parser('importar', help="importa empleados desde CSV o JSONL")
+    importar.add_argument('archivo')
+    importar.add_argument('--formato', choices=('csv', 'jsonl'))
+    importar.set_defaults(funcion=comando_importar)
+    return parser
+
+def ejecutar_comando(argv) -> int:
+    """
+    Ejecuta un subcomando y escribe su resultado en JSON
+    Returns: Código de salida
+    """
+    import contextlib
+    import json
+
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    if args.comando == 'stats' and args.periodo is not None and (args.desde or args.hasta):
+        parser.error("use --periodo o --desde/--hasta, no ambos")
+
+    perfilador = None
+    if args.perfil:
+        from utils import Perfilador
+        perfilador = Perfilador(args.perfil, resumen=args.perfil_resumen)
+    if args.comando is None:
+        menu_principal(args.backend, args.datos, perfilador, args.journal)
+        return EXITO
+
+    salida = sys.stdout
+    if args.metricas:
+        from utils import REGISTRO
+        REGISTRO.habilitar()
+    try:
+        # Los mensajes del sistema (✅, ⚠️) no deben mezclarse con el JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            from sistema import SistemaNominas
+            sistema = SistemaNominas(backend=args.backend, directorio=args.datos,
+                                     journal=args.journal)
+            if perfilador is not None:
+                # Un solo perfil con el subcomando completo (incluye la salida)
+                resultado = perfilador.perfilar(f"comando_{args.comando}", args.funcion,
+                                                sistema, args, salida)
+            else:
+                resultado = args.funcion(sistema, args, salida)
+    except ErrorComando as e:
+        print(json.dumps({'error': str(e)}, ensure_ascii=False), file=sys.stderr)
+        return e.codigo
+    except Exception as e:
+        print(json.dumps({'error': f"Error inesperado: {e}"}, ensure_ascii=False), file=sys.stderr)
+        return ERROR
+
+    if resultado is not None:
+        from utils import convertir_a_json
+        json.dump(resultado, salida, default=convertir_a_json, ensure_ascii=False, indent=2)
+        salida.write("\n")
+    if args.metricas:
+        print(json.dumps({'metricas': REGISTRO.instantanea()}, indent=2), file=sys.stderr)
+    return EXITO
+
+def main(argv=None) -> int:
+    """
+    Función principal del sistema: menú interactivo o un subcomando
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        if not argv:
+            menu_principal()
+            return EXITO
+        return ejecutar_comando(argv)
+    except BrokenPipeError:
+        # Quien lee la salida la cerró antes (`python main.py listar | head`):
+        # se termina sin traza y stdout pasa a /dev/null para que el flush
+        # final del intérprete no vuelva a fallar
+        import os
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return ERROR
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
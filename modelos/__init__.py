@@ -1,9 +1,11 @@
 from .empleado import Empleado
 from .detalle_nomina import DetalleNomina
+from .detalles_columnares import DetallesColumnares
 from .nomina import Nomina
 
 __all__ = [
     'Empleado',
     'DetalleNomina', 
+    'DetallesColumnares',
     'Nomina'
 ]
\ No newline at end of file
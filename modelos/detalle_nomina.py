@@ -1,16 +1,67 @@
-from typing import Dict
+from typing import Dict, Optional
+
+from utils.dinero import TASA_IESS, a_centavos, a_monto, aplicar_tasa
 
 class DetalleNomina:
+    # Montos en centavos enteros, calculados una sola vez en el constructor
+    # (sin __dict__); sueldo, iess, neto, etc. son vistas en float para
+    # compatibilidad
+    __slots__ = ('id', 'empleado', 'sueldo_centavos', 'bono_centavos', 'tot_ing_centavos',
+                 'iess_centavos', 'prestamo_centavos', 'tot_des_centavos', 'neto_centavos')
+    
     def __init__(self, id: int, empleado, sueldo: float, bono: float, prestamo: float):
+        self._calcular(id, empleado, a_centavos(sueldo), a_centavos(bono), a_centavos(prestamo))
+    
+    @classmethod
+    def desde_centavos(cls, id: int, empleado, sueldo: int, bono: int, prestamo: int,
+                       iess: Optional[int] = None) -> 'DetalleNomina':
+        """
+        Crea un detalle con los montos ya en centavos (sin convertir).
+        Con 'iess' se conserva el aporte guardado en lugar de recalcularlo.
+        """
+        detalle = cls.__new__(cls)
+        detalle._calcular(id, empleado, sueldo, bono, prestamo, iess)
+        return detalle
+    
+    def _calcular(self, id: int, empleado, sueldo: int, bono: int, prestamo: int,
+                  iess: Optional[int] = None) -> None:
         self.id = id
-        self.empleado = empleado  
-        self.sueldo = sueldo
-        self.bono = bono
-        self.tot_ing = sueldo + bono
-        self.iess = round(sueldo * 0.0945, 2)
-        self.prestamo = prestamo
-        self.tot_des = self.iess + prestamo
-        self.neto = self.tot_ing - self.tot_des
+        self.empleado = empleado
+        self.sueldo_centavos = sueldo
+        self.bono_centavos = bono
+        self.tot_ing_centavos = sueldo + bono
+        self.iess_centavos = aplicar_tasa(sueldo, TASA_IESS) if iess is None else iess
+        self.prestamo_centavos = prestamo
+        self.tot_des_centavos = self.iess_centavos + prestamo
+        self.neto_centavos = self.tot_ing_centavos - self.tot_des_centavos
+    
+    @property
+    def sueldo(self) -> float:
+        return a_monto(self.sueldo_centavos)
+    
+    @property
+    def bono(self) -> float:
+        return a_monto(self.bono_centavos)
+    
+    @property
+    def tot_ing(self) -> float:
+        return a_monto(self.tot_ing_centavos)
+    
+    @property
+    def iess(self) -> float:
+        return a_monto(self.iess_centavos)
+    
+    @property
+    def prestamo(self) -> float:
+        return a_monto(self.prestamo_centavos)
+    
+    @property
+    def tot_des(self) -> float:
+        return a_monto(self.tot_des_centavos)
+    
+    @property
+    def neto(self) -> float:
+        return a_monto(self.neto_centavos)
     
     def to_dict(self) -> Dict:
         """
@@ -35,6 +86,17 @@ class DetalleNomina:
             'neto': self.neto
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict, empleado) -> 'DetalleNomina':
+        """
+        Crea un detalle desde su diccionario y el empleado ya reconstruido.
+        El IESS guardado se conserva (un período ya emitido no se recalcula
+        con otra regla de redondeo); solo se calcula si el registro no lo trae.
+        """
+        iess = data.get('iess')
+        return cls.desde_centavos(data['id'], empleado, a_centavos(data['sueldo']), a_centavos(data['bono']),
+                                  a_centavos(data['prestamo']), None if iess is None else a_centavos(iess))
+    
     def __str__(self):
         return (f"Detalle {self.id}: {self.empleado.nombre} - "
                 f"Sueldo: ${self.sueldo} + Bono: ${self.bono} - "
@@ -0,0 +1,336 @@
+from array import array
+from typing import Dict, Iterable, Iterator, List, Sequence
+import operator
+
+from modelos.detalle_nomina import DetalleNomina
+from utils.dinero import CENTAVOS_POR_UNIDAD, a_monto
+
+# NumPy se importa recién cuando una operación lo necesita: es opcional y
+# su import cuesta más que el arranque de todo el sistema
+_numpy = False
+
+def cargar_numpy():
+    """
+    Importa NumPy la primera vez que se llama
+    Returns: El módulo numpy o None si no está instalado
+    """
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:  # NumPy es opcional: sin él se usan array y funciones nativas
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+# Columnas de montos que se guardan como arreglos contiguos de centavos (int64)
+COLUMNAS = ('sueldo', 'bono', 'iess', 'prestamo', 'tot_ing', 'tot_des', 'neto')
+_ATRIBUTOS = tuple((nombre, f"{nombre}_centavos") for nombre in COLUMNAS)
+
+_OPERADORES = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq
+}
+
+class DetallesColumnares:
+    """
+    Almacenamiento columnar de los detalles de una nómina.
+    Cada monto vive en un arreglo contiguo de centavos enteros (array('q'),
+    sumas exactas) y los datos del empleado
+    (cédula y departamento) van en columnas paralelas. Las filas como
+    DetalleNomina se construyen solo cuando se piden.
+    """
+
+    def __init__(self):
+        self.ids = array('q')
+        self.cedulas: List[str] = []
+        self.empleados: List = []
+        self.nombres_departamento: List[str] = []
+        self._codigos_departamento = array('l')
+        self._indice_departamentos: Dict[str, int] = {}
+        self._columnas: Dict[str, array] = {nombre: array('q') for nombre in COLUMNAS}
+        self._vistas: Dict[str, object] = {}
+
+    @classmethod
+    def desde_detalles(cls, detalles: Iterable[DetalleNomina]) -> 'DetallesColumnares':
+        """
+        Crea el almacenamiento columnar a partir de detalles ya construidos
+        """
+        columnar = cls()
+        columnar.extend(detalles)
+        return columnar
+
+    @classmethod
+    def desde_columnas(cls, ids: array, empleados: List, columnas: Dict[str, array]) -> 'DetallesColumnares':
+        """
+        Crea el almacenamiento a partir de columnas ya armadas: ids, empleado
+        de cada fila y un array('q') de centavos por cada monto de COLUMNAS
+        (los arreglos se usan tal cual, sin copiarlos)
+        """
+        faltantes = [nombre for nombre in COLUMNAS if nombre not in columnas]
+        if faltantes:
+            raise ValueError(f"Faltan columnas de montos: {', '.join(faltantes)}")
+        if any(len(columnas[nombre]) != len(ids) for nombre in COLUMNAS) or len(empleados) != len(ids):
+            raise ValueError("Las columnas deben tener la misma cantidad de filas")
+
+        columnar = cls()
+        columnar.ids = ids
+        columnar.empleados = list(empleados)
+        columnar.cedulas = [empleado.cedula for empleado in columnar.empleados]
+        indice, nombres = columnar._indice_departamentos, columnar.nombres_departamento
+        codigos = array('l')
+        for empleado in columnar.empleados:
+            codigo = indice.get(empleado.departamento)
+            if codigo is None:
+                codigo = indice[empleado.departamento] = len(nombres)
+                nombres.append(empleado.departamento)
+            codigos.append(codigo)
+        columnar._codigos_departamento = codigos
+        columnar._columnas = {nombre: columnas[nombre] for nombre in COLUMNAS}
+        return columnar
+
+    # --- CONSTRUCCIÓN ---
+    def append(self, detalle: DetalleNomina) -> None:
+        """
+        Agrega un detalle copiando sus montos a las columnas
+        """
+        empleado = detalle.empleado
+        self.ids.append(detalle.id)
+        self.empleados.append(empleado)
+        self.cedulas.append(empleado.cedula)
+
+        departamento = empleado.departamento
+        codigo = self._indice_departamentos.get(departamento)
+        if codigo is None:
+            codigo = len(self.nombres_departamento)
+            self._indice_departamentos[departamento] = codigo
+            self.nombres_departamento.append(departamento)
+        self._codigos_departamento.append(codigo)
+
+        columnas = self._columnas
+        for nombre, atributo in _ATRIBUTOS:
+            columnas[nombre].append(getattr(detalle, atributo))
+        self._vistas.clear()
+
+    def extend(self, detalles: Iterable[DetalleNomina]) -> None:
+        """
+        Agrega varios detalles
+        """
+        for detalle in detalles:
+            self.append(detalle)
+
+    # --- VISTA DE OBJETOS (perezosa) ---
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, indice: int) -> DetalleNomina:
+        return DetalleNomina.desde_centavos(
+            self.ids[indice],
+            self.empleados[indice],
+            self._columnas['sueldo'][indice],
+            self._columnas['bono'][indice],
+            self._columnas['prestamo'][indice],
+            self._columnas['iess'][indice]
+        )
+
+    def __iter__(self) -> Iterator[DetalleNomina]:
+        return (self[i] for i in range(len(self)))
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def departamento(self, indice: int) -> str:
+        """
+        Departamento del empleado de la fila indicada
+        """
+        return self.nombres_departamento[self._codigos_departamento[indice]]
+
+    # --- OPERACIONES VECTORIZADAS ---
+    def centavos(self, nombre: str):
+        """
+        Columna en centavos como ndarray int64 (si NumPy está disponible) o como array('q')
+        """
+        np = cargar_numpy()
+        if np is None:
+            return self._columnas[nombre]
+        if nombre not in self._vistas:
+            self._vistas[nombre] = np.array(self._columnas[nombre], dtype=np.int64)
+        return self._vistas[nombre]
+
+    def columna(self, nombre: str):
+        """
+        Columna en unidades monetarias (float) como ndarray o array('d')
+        """
+        centavos = self.centavos(nombre)
+        if cargar_numpy() is None:
+            return array('d', map(a_monto, centavos))
+        return centavos / CENTAVOS_POR_UNIDAD
+
+    def total_centavos(self, nombre: str) -> int:
+        """
+        Suma exacta de una columna en centavos
+        """
+        if cargar_numpy() is None:
+            return sum(self._columnas[nombre])
+        return int(self.centavos(nombre).sum())
+
+    def total(self, nombre: str) -> float:
+        """
+        Suma de una columna
+        """
+        return a_monto(self.total_centavos(nombre))
+
+    def promedio(self, nombre: str) -> float:
+        """
+        Promedio de una columna (0 si no hay filas)
+        """
+        return self.total(nombre) / len(self) if len(self) else 0
+
+    def minimo(self, nombre: str) -> float:
+        return a_monto(int(min(self.centavos(nombre))) if cargar_numpy() is None
+                       else int(self.centavos(nombre).min()))
+
+    def maximo(self, nombre: str) -> float:
+        return a_monto(int(max(self.centavos(nombre))) if cargar_numpy() is None
+                       else int(self.centavos(nombre).max()))
+
+    def indice_maximo(self, nombre: str) -> int:
+        """
+        Posición de la primera fila con el valor máximo de la columna
+        """
+        if cargar_numpy() is not None:
+            return int(self.centavos(nombre).argmax())
+        columna = self._columnas[nombre]
+        return max(range(len(columna)), key=columna.__getitem__)
+
+    def indice_minimo(self, nombre: str) -> int:
+        """
+        Posición de la primera fila con el valor mínimo de la columna
+        """
+        if cargar_numpy() is not None:
+            return int(self.centavos(nombre).argmin())
+        columna = self._columnas[nombre]
+        return min(range(len(columna)), key=columna.__getitem__)
+
+    def indices(self, nombre: str, operador: str, valor: float) -> Sequence[int]:
+        """
+        Posiciones de las filas que cumplen 'columna <operador> valor'
+        """
+        # Se compara en centavos contra el valor escalado (sin redondearlo)
+        comparar, valor = _OPERADORES[operador], valor * CENTAVOS_POR_UNIDAD
+        np = cargar_numpy()
+        if np is not None:
+            return np.flatnonzero(comparar(self.centavos(nombre), valor)).tolist()
+        return [i for i, v in enumerate(self._columnas[nombre]) if comparar(v, valor)]
+
+    def contar(self, nombre: str, operador: str, valor: float) -> int:
+        """
+        Cantidad de filas que cumplen 'columna <operador> valor'
+        """
+        comparar, valor = _OPERADORES[operador], valor * CENTAVOS_POR_UNIDAD
+        np = cargar_numpy()
+        if np is not None:
+            return int(np.count_nonzero(comparar(self.centavos(nombre), valor)))
+        return sum(1 for v in self._columnas[nombre] if comparar(v, valor))
+
+    def filtrar(self, nombre: str, operador: str, valor: float) -> 'DetallesColumnares':
+        """
+        Nuevo almacenamiento columnar solo con las filas que cumplen la condición
+        """
+        return self.seleccionar(self.indices(nombre, operador, valor))
+
+    def seleccionar(self, indices: Iterable[int]) -> 'DetallesColumnares':
+        """
+        Nuevo almacenamiento columnar con las filas indicadas (en ese orden)
+        """
+        indices = list(indices)
+        seleccion = DetallesColumnares()
+        seleccion.ids = array('q', (self.ids[i] for i in indices))
+        seleccion.empleados = [self.empleados[i] for i in indices]
+        seleccion.cedulas = [self.cedulas[i] for i in indices]
+        seleccion.nombres_departamento = list(self.nombres_departamento)
+        seleccion._indice_departamentos = dict(self._indice_departamentos)
+        seleccion._codigos_departamento = array('l', (self._codigos_departamento[i] for i in indices))
+        for nombre, columna in self._columnas.items():
+            seleccion._columnas[nombre] = array('q', (columna[i] for i in indices))
+        return seleccion
+
+    def ordenar_por(self, nombre: str, descendente: bool = True) -> List[int]:
+        """
+        Posiciones de las filas ordenadas por una columna (orden estable)
+        """
+        np = cargar_numpy()
+        if np is not None:
+            valores = self.centavos(nombre)
+            return np.argsort(-valores if descendente else valores, kind='stable').tolist()
+        columna = self._columnas[nombre]
+        return sorted(range(len(columna)), key=columna.__getitem__, reverse=descendente)
+
+    def totales(self) -> Dict[str, float]:
+        """
+        Totales de ingresos, descuentos y neto
+        """
+        return {
+            'tot_ing': self.total('tot_ing'),
+            'tot_des': self.total('tot_des'),
+            'neto': self.total('neto')
+        }
+
+    def agrupar_por_departamento(self) -> Dict[str, Dict]:
+        """
+        Cantidad de empleados, neto total y promedio, IESS y bonos totales y
+        fila de mayor neto por departamento
+        """
+        cantidad_grupos = len(self.nombres_departamento)
+
+        np = cargar_numpy()
+        if np is not None:
+            codigos = np.array(self._codigos_departamento, dtype=np.int64)
+            netos = self.centavos('neto')
+            conteos = np.bincount(codigos, minlength=cantidad_grupos).tolist()
+
+            def sumar_por_grupo(columna):
+                # Sumas enteras por grupo (bincount con pesos acumula en float)
+                totales = np.zeros(cantidad_grupos, dtype=np.int64)
+                np.add.at(totales, codigos, columna)
+                return totales.tolist()
+            sumas = sumar_por_grupo(netos)
+            iess = sumar_por_grupo(self.centavos('iess'))
+            bonos = sumar_por_grupo(self.centavos('bono'))
+            # Orden por departamento, neto descendente y posición: el primero de
+            # cada grupo es la primera fila con el mayor neto
+            orden = np.lexsort((np.arange(len(self)), -netos, codigos))
+            _, primeros = np.unique(codigos[orden], return_index=True)
+            mayores = dict(zip(codigos[orden][primeros].tolist(), orden[primeros].tolist()))
+        else:
+            conteos = [0] * cantidad_grupos
+            sumas = [0] * cantidad_grupos
+            iess = [0] * cantidad_grupos
+            bonos = [0] * cantidad_grupos
+            mayores = {}
+            netos = self._columnas['neto']
+            columna_iess, columna_bonos = self._columnas['iess'], self._columnas['bono']
+            for i, codigo in enumerate(self._codigos_departamento):
+                conteos[codigo] += 1
+                sumas[codigo] += netos[i]
+                iess[codigo] += columna_iess[i]
+                bonos[codigo] += columna_bonos[i]
+                if codigo not in mayores or netos[i] > netos[mayores[codigo]]:
+                    mayores[codigo] = i
+
+        metricas = {}
+        for codigo, departamento in enumerate(self.nombres_departamento):
+            if not conteos[codigo]:
+                continue
+            metricas[departamento] = {
+                'empleados': conteos[codigo],
+                'total_neto': a_monto(sumas[codigo]),
+                'promedio_neto': a_monto(sumas[codigo]) / conteos[codigo],
+                'total_iess': a_monto(iess[codigo]),
+                'total_bonos': a_monto(bonos[codigo]),
+                'empleado_mayor_neto': self[mayores[codigo]]
+            }
+        return metricas
@@ -1,15 +1,25 @@
 from typing import Dict
+import sys
 #from utils.decoradores import validar_empleado_completo
 
+def _internar(valor):
+    """
+    Interna cadenas muy repetidas (departamento, cargo) para compartir una sola copia
+    """
+    return sys.intern(valor) if type(valor) is str else valor
+
 class Empleado:
+    # Sin __dict__ por instancia: cada empleado ocupa solo sus cinco referencias
+    __slots__ = ('cedula', 'nombre', 'sueldo', 'departamento', 'cargo')
+    
     #@validar_empleado_completo
     def __init__(self, cedula: str, nombre: str, sueldo: float, 
                  departamento: str, cargo: str):
         self.cedula = cedula
         self.nombre = nombre
         self.sueldo = sueldo
-        self.departamento = departamento
-        self.cargo = cargo
+        self.departamento = _internar(departamento)
+        self.cargo = _internar(cargo)
     
     def to_dict(self) -> Dict:
         """
@@ -1,6 +1,9 @@
-from typing import List, Dict
+from typing import List, Dict, Iterable, Union
 from functools import reduce
 from modelos.detalle_nomina import DetalleNomina
+from modelos.detalles_columnares import DetallesColumnares
+from utils.acumulador import acumular_estadisticas
+from utils.dinero import a_centavos, a_monto
 
 class Nomina:
     """
@@ -12,34 +15,97 @@ class Nomina:
     BONO = 50.0
     PRESTAMO = 20.0
     
-    def __init__(self, id: int, aniomes: str):
+    # Valor de la clave 'formato' en archivos con tabla de empleados
+    FORMATO_NORMALIZADO = "normalizado"
+    
+    def __init__(self, id: int, aniomes: str, columnar: bool = False):
         self.id = id
         self.aniomes = aniomes
-        self.detalles: List[DetalleNomina] = []
-        self.tot_ing = 0.0
-        self.tot_des = 0.0
-        self.neto = 0.0
+        # Con columnar=True los detalles se guardan en arreglos por columna
+        # y se ven como DetalleNomina solo al recorrerlos
+        self.detalles: Union[List[DetalleNomina], DetallesColumnares] = (
+            DetallesColumnares() if columnar else []
+        )
+        # Totales en centavos enteros (exactos con cualquier cantidad de detalles)
+        self.tot_ing_centavos = 0
+        self.tot_des_centavos = 0
+        self.neto_centavos = 0
+    
+    # Vistas en float de los totales; al asignarles un monto (por ejemplo
+    # leído de un archivo) se guarda redondeado al centavo
+    @property
+    def tot_ing(self) -> float:
+        return a_monto(self.tot_ing_centavos)
+    
+    @tot_ing.setter
+    def tot_ing(self, valor: float) -> None:
+        self.tot_ing_centavos = a_centavos(valor)
+    
+    @property
+    def tot_des(self) -> float:
+        return a_monto(self.tot_des_centavos)
+    
+    @tot_des.setter
+    def tot_des(self, valor: float) -> None:
+        self.tot_des_centavos = a_centavos(valor)
+    
+    @property
+    def neto(self) -> float:
+        return a_monto(self.neto_centavos)
+    
+    @neto.setter
+    def neto(self, valor: float) -> None:
+        self.neto_centavos = a_centavos(valor)
     
     def agregar_detalle(self, detalle: DetalleNomina) -> None:
         """
-        Agrega un detalle a la nómina y actualiza los totales
+        Agrega un detalle a la nómina y actualiza los totales en O(1)
         """
         self.detalles.append(detalle)
+        self.tot_ing_centavos += detalle.tot_ing_centavos
+        self.tot_des_centavos += detalle.tot_des_centavos
+        self.neto_centavos += detalle.neto_centavos
+    
+    def agregar_detalles(self, detalles: Iterable[DetalleNomina]) -> None:
+        """
+        Agrega varios detalles de una sola vez sumando los totales en
+        centavos en la misma pasada
+        """
+        ingresos, descuentos, neto = self.tot_ing_centavos, self.tot_des_centavos, self.neto_centavos
+        for detalle in detalles:
+            self.detalles.append(detalle)
+            ingresos += detalle.tot_ing_centavos
+            descuentos += detalle.tot_des_centavos
+            neto += detalle.neto_centavos
+        
+        self.tot_ing_centavos = ingresos
+        self.tot_des_centavos = descuentos
+        self.neto_centavos = neto
+    
+    def recalcular(self) -> None:
+        """
+        Recalcula los totales desde cero recorriendo todos los detalles
+        """
+        if isinstance(self.detalles, DetallesColumnares):
+            self.tot_ing_centavos = self.detalles.total_centavos('tot_ing')
+            self.tot_des_centavos = self.detalles.total_centavos('tot_des')
+            self.neto_centavos = self.detalles.total_centavos('neto')
+            return
         self._actualizar_totales()
     
     def _actualizar_totales(self) -> None:
         """
         Actualiza los totales usando reduce y lambdas (como requiere el proyecto)
         """
-        # Usando REDUCE y LAMBDAS para cumplir con el requerimiento
-        self.tot_ing = reduce(lambda acumulado, detalle: acumulado + detalle.tot_ing, 
-                            self.detalles, 0.0)
+        # Usando REDUCE y LAMBDAS para cumplir con el requerimiento (en centavos)
+        self.tot_ing_centavos = reduce(lambda acumulado, detalle: acumulado + detalle.tot_ing_centavos,
+                                       self.detalles, 0)
         
-        self.tot_des = reduce(lambda acumulado, detalle: acumulado + detalle.tot_des, 
-                            self.detalles, 0.0)
+        self.tot_des_centavos = reduce(lambda acumulado, detalle: acumulado + detalle.tot_des_centavos,
+                                       self.detalles, 0)
         
-        self.neto = reduce(lambda acumulado, detalle: acumulado + detalle.neto, 
-                         self.detalles, 0.0)
+        self.neto_centavos = reduce(lambda acumulado, detalle: acumulado + detalle.neto_centavos,
+                                    self.detalles, 0)
     
     def to_dict(self) -> Dict:
         """
@@ -54,26 +120,70 @@ class Nomina:
             'detalles': [detalle.to_dict() for detalle in self.detalles]
         }
     
+    def to_dict_normalizado(self) -> Dict:
+        """
+        Convierte la nómina a diccionario con una tabla de empleados sin repetir;
+        cada detalle referencia a su empleado por su posición en esa tabla
+        """
+        empleados = []
+        indices = {}
+        detalles = []
+        for detalle in self.detalles:
+            emp_data = detalle.empleado.to_dict()
+            clave = tuple(emp_data.values())
+            indice = indices.get(clave)
+            if indice is None:
+                indice = indices[clave] = len(empleados)
+                empleados.append(emp_data)
+            detalle_data = detalle.to_dict()
+            detalle_data['empleado'] = indice
+            detalles.append(detalle_data)
+        
+        return {
+            'id': self.id,
+            'aniomes': self.aniomes,
+            'formato': self.FORMATO_NORMALIZADO,
+            'tot_ing': self.tot_ing,
+            'tot_des': self.tot_des,
+            'neto': self.neto,
+            'empleados': empleados,
+            'detalles': detalles
+        }
+    
     def generar_estadisticas(self) -> Dict:
         """
         Genera estadísticas usando funciones de orden superior
         """
-        # Usando LAMBDAS, MAP, FILTER y REDUCE como requiere el proyecto
-        
-        # Lista de netos usando comprehension
-        netos = [detalle.neto for detalle in self.detalles]
+        if isinstance(self.detalles, DetallesColumnares):
+            return self._generar_estadisticas_columnares()
         
-        # Lista de sueldos usando map
-        sueldos = list(map(lambda d: d.sueldo, self.detalles))
+        # Una sola pasada sobre los detalles
+        stats = acumular_estadisticas(self.detalles)
         
         return {
-            'total_empleados': len(self.detalles),
-            'total_neto': reduce(lambda a, b: a + b, netos, 0.0),
-            'promedio_sueldos': reduce(lambda a, b: a + b, sueldos, 0.0) / len(sueldos) if sueldos else 0,
-            'empleados_alto_sueldo': list(filter(lambda d: d.sueldo > 1000, self.detalles)),
-            'empleado_mayor_neto': max(self.detalles, key=lambda d: d.neto) if self.detalles else None,
-            'empleado_menor_neto': min(self.detalles, key=lambda d: d.neto) if self.detalles else None,
-            'total_aporte_iess': reduce(lambda a, b: a + b.iess, self.detalles, 0.0)
+            'total_empleados': stats.cantidad,
+            'total_neto': stats.total_neto,
+            'promedio_sueldos': stats.promedio_sueldo,
+            'empleados_alto_sueldo': stats.alto_sueldo,
+            'empleado_mayor_neto': stats.mayor_neto,
+            'empleado_menor_neto': stats.menor_neto,
+            'total_aporte_iess': stats.total_iess
+        }
+    
+    def _generar_estadisticas_columnares(self) -> Dict:
+        """
+        Mismas estadísticas que generar_estadisticas, calculadas sobre columnas
+        """
+        columnas = self.detalles
+        hay_detalles = len(columnas) > 0
+        return {
+            'total_empleados': len(columnas),
+            'total_neto': columnas.total('neto'),
+            'promedio_sueldos': columnas.promedio('sueldo'),
+            'empleados_alto_sueldo': list(columnas.filtrar('sueldo', '>', 1000)),
+            'empleado_mayor_neto': columnas[columnas.indice_maximo('neto')] if hay_detalles else None,
+            'empleado_menor_neto': columnas[columnas.indice_minimo('neto')] if hay_detalles else None,
+            'total_aporte_iess': columnas.total('iess')
         }
     
     def __str__(self):
@@ -1,9 +1,33 @@
-from .base import Repositorio
-from .empleados__json import RepositorioEmpleadosJSON
-from .nominas__json import RepositorioNominasJSON
+import importlib
+
+from .base import Repositorio, RepositorioNominas
+
+# Cada backend se importa al pedir su clase (PEP 562): usar solo JSON no
+# carga sqlite3, mmap ni asyncio
+_EXPORTACIONES = {
+    'RepositorioEmpleadosJSON': 'empleados__json',
+    'RepositorioEmpleadosIndexado': 'empleados__indexado',
+    'RepositorioEmpleadosSQLite': 'empleados__sqlite',
+    'RepositorioNominasJSON': 'nominas__json',
+    'RepositorioNominasSQLite': 'nominas__sqlite',
+    'RepositorioNominasBinario': 'nominas__binario',
+    'NominaBinaria': 'nominas__binario',
+    'RepositorioNominasCache': 'nominas__cache',
+    'RepositorioNominasAsync': 'nominas__async',
+}
 
 __all__ = [
     'Repositorio',
-    'RepositorioEmpleadosJSON',
-    'RepositorioNominasJSON'
-]
\ No newline at end of file
+    'RepositorioNominas',
+    *_EXPORTACIONES
+]
+
+def __getattr__(nombre: str):
+    if nombre not in _EXPORTACIONES:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f'.{_EXPORTACIONES[nombre]}', __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from modelos.empleado import Empleado
+from modelos.nomina import Nomina
+from modelos.detalle_nomina import DetalleNomina
+from utils.estadisticas import calcular_metricas_departamento, serializar_metricas_departamento
+from utils.series import sumar_detalles
 
 class Repositorio(ABC):
     """
@@ -37,4 +41,144 @@ class Repositorio(ABC):
         Elimina un empleado por su cédula
         Returns: True si se eliminó, False si no existía
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def iterar_todos(self) -> Iterator[Empleado]:
+        """
+        Recorre los empleados uno por uno sin construir la lista completa.
+        Las implementaciones pueden sobrescribirlo para leer de forma incremental.
+        """
+        return iter(self.obtener_todos())
+    
+    def guardar_varios(self, empleados: Iterable[Empleado]) -> None:
+        """
+        Guarda o actualiza varios empleados.
+        Las implementaciones pueden sobrescribirlo para hacerlo en una sola escritura.
+        """
+        for empleado in empleados:
+            self.guardar(empleado)
+
+class RepositorioNominas(ABC):
+    """
+    Clase abstracta que define la interfaz para los repositorios de nóminas
+    """
+    
+    @abstractmethod
+    def guardar(self, nomina: Nomina) -> None:
+        """
+        Guarda o reemplaza la nómina de un período
+        """
+        pass
+    
+    @abstractmethod
+    def obtener(self, aniomes: str) -> Optional[Nomina]:
+        """
+        Obtiene una nómina por año-mes con todos sus detalles
+        Returns: Nomina o None si no existe
+        """
+        pass
+    
+    @abstractmethod
+    def listar_nominas(self) -> List[str]:
+        """
+        Lista los períodos disponibles
+        Returns: Lista de strings aniomes (YYYYMM) ordenada
+        """
+        pass
+    
+    def firma(self, aniomes: str) -> Optional[Tuple]:
+        """
+        Valor que cambia cuando cambian los datos guardados del período
+        (por ejemplo fecha y tamaño del archivo). None si el repositorio no
+        puede detectarlo; las cachés solo se invalidan al guardar.
+        """
+        return None
+    
+    def iterar_detalles(self, aniomes: str) -> Iterator[DetalleNomina]:
+        """
+        Recorre los detalles de un período. Las implementaciones pueden
+        leerlos de a uno sin cargar la nómina; por defecto la carga completa.
+        """
+        nomina = self.obtener(aniomes)
+        return iter(nomina.detalles) if nomina is not None else iter(())
+    
+    def obtener_resumenes(self, verificar: bool = False) -> List[Dict]:
+        """
+        Resumen (id, aniomes, empleados y totales) de cada período.
+        Las implementaciones con un índice lo sobrescriben para no cargar
+        los detalles; por defecto carga cada nómina.
+        Returns: Lista de resúmenes ordenada por aniomes
+        """
+        resumenes = []
+        for aniomes in self.listar_nominas():
+            nomina = self.obtener(aniomes)
+            if nomina is not None:
+                resumenes.append({
+                    'id': nomina.id,
+                    'aniomes': nomina.aniomes,
+                    'empleados': len(nomina.detalles),
+                    'tot_ing': nomina.tot_ing,
+                    'tot_des': nomina.tot_des,
+                    'neto': nomina.neto
+                })
+        return resumenes
+    
+    def obtener_departamentos(self, aniomes: str) -> Optional[Dict[str, Dict]]:
+        """
+        Métricas por departamento del período (empleados, neto total y
+        promedio, IESS, bonos y empleado de mayor neto como diccionario).
+        Las implementaciones las guardan al guardar la nómina; por defecto
+        se calculan cargando el período.
+        Returns: Diccionario departamento -> métricas, o None si no existe
+        """
+        nomina = self.obtener(aniomes)
+        if nomina is None:
+            return None
+        return serializar_metricas_departamento(calcular_metricas_departamento(nomina.detalles))
+    
+    def sumar_periodo(self, aniomes: str, columnas: Sequence[str], cedula: Optional[str] = None,
+                      departamento: Optional[str] = None) -> Optional[Tuple[float, ...]]:
+        """
+        Suma las columnas indicadas de un período para un empleado, un
+        departamento o toda la nómina. Por defecto carga el período; las
+        implementaciones pueden leer solo esas columnas.
+        Returns: Tupla con una suma por columna, o None si el período no existe
+        """
+        nomina = self.obtener(aniomes)
+        if nomina is None:
+            return None
+        return sumar_detalles(nomina.detalles, columnas, cedula, departamento)
+    
+    def sumar_por_periodo(self, periodos: Sequence[str], columnas: Sequence[str],
+                          cedula: Optional[str] = None, departamento: Optional[str] = None,
+                          workers: Optional[int] = None) -> Dict[str, Tuple[float, ...]]:
+        """
+        sumar_periodo sobre varios períodos, cargándolos en paralelo con hilos
+        Returns: Diccionario aniomes -> sumas (sin los períodos inexistentes)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sumas = executor.map(lambda aniomes: self.sumar_periodo(aniomes, columnas, cedula, departamento),
+                                 periodos)
+            return {aniomes: suma for aniomes, suma in zip(periodos, sumas) if suma is not None}
+    
+    def guardar_streaming(self, id: int, aniomes: str,
+                          detalles: Iterable[DetalleNomina]) -> Dict:
+        """
+        Guarda una nómina a partir de un iterable de detalles.
+        Las implementaciones pueden sobrescribirlo para escribir fila por fila
+        con memoria constante; por defecto arma la Nomina completa.
+        Returns: Resumen con id, aniomes, empleados y totales
+        """
+        nomina = Nomina(id, aniomes)
+        for detalle in detalles:
+            nomina.agregar_detalle(detalle)
+        self.guardar(nomina)
+        return {
+            'id': nomina.id,
+            'aniomes': nomina.aniomes,
+            'empleados': len(nomina.detalles),
+            'tot_ing': nomina.tot_ing,
+            'tot_des': nomina.tot_des,
+            'neto': nomina.neto
+        }
@@ -0,0 +1,17 @@
+import os
+import sqlite3
+
+def conectar(archivo_db: str) -> sqlite3.Connection:
+    """
+    Abre la base SQLite en modo WAL (lectores concurrentes sin bloquear al escritor)
+    """
+    directorio = os.path.dirname(archivo_db)
+    if directorio and not os.path.exists(directorio):
+        os.makedirs(directorio)
+    
+    # check_same_thread=False: quien comparta la conexión entre hilos debe serializar su uso
+    conexion = sqlite3.connect(archivo_db, check_same_thread=False)
+    conexion.execute("PRAGMA journal_mode=WAL")
+    conexion.execute("PRAGMA synchronous=NORMAL")
+    conexion.execute("PRAGMA foreign_keys=ON")
+    return conexion
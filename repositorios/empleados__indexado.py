@@ -0,0 +1,182 @@
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from modelos.empleado import Empleado
+from repositorios.empleados__json import RepositorioEmpleadosJSON
+from utils.metricas import instrumentar
+
+class RepositorioEmpleadosIndexado(RepositorioEmpleadosJSON):
+    """
+    Repositorio de empleados en memoria sobre el mismo archivo JSON.
+    Carga el archivo una sola vez, mantiene un índice hash por cédula y uno
+    secundario por departamento, y detecta cambios externos del archivo
+    comparando su fecha de modificación y tamaño.
+    """
+
+    def __init__(self, archivo: str = "archivos/empleados.json", escritura_diferida: bool = False,
+                 journal: bool = False, umbral_compactacion: int = 1024 * 1024):
+        """
+        escritura_diferida=False escribe cada cambio al archivo (write-through).
+        escritura_diferida=True acumula los cambios hasta llamar a flush().
+        journal=True persiste cada cambio como un registro en el journal.
+        """
+        super().__init__(archivo, journal, umbral_compactacion)
+        self.escritura_diferida = escritura_diferida
+        self._por_cedula: Dict[str, dict] = {}
+        self._por_departamento: Dict[str, Dict[str, None]] = {}
+        self._firma: Optional[Tuple] = None
+        self._pendiente = False
+        self._registros_pendientes: List[dict] = []
+        self._cargar()
+
+    # --- ÍNDICES ---
+    def _firma_archivo(self) -> Tuple:
+        """
+        Fecha de modificación y tamaño del archivo y del journal (None si no existen)
+        """
+        firma = []
+        for ruta in (self.archivo, self.archivo_journal):
+            try:
+                estado = os.stat(ruta)
+            except FileNotFoundError:
+                firma.append(None)
+                continue
+            firma.append((estado.st_mtime_ns, estado.st_size))
+        return tuple(firma)
+
+    @instrumentar
+    def _cargar(self) -> None:
+        """
+        Lee el archivo y reconstruye los índices. Se arman aparte y se
+        reemplazan al final para que una consulta concurrente no vea un
+        índice a medio cargar.
+        """
+        self._firma = self._firma_archivo()
+        por_cedula = {emp_data['cedula']: emp_data for emp_data in self._leer_datos()}
+        por_departamento: Dict[str, Dict[str, None]] = {}
+        for cedula, emp_data in por_cedula.items():
+            por_departamento.setdefault(emp_data['departamento'], {})[cedula] = None
+        self._por_cedula, self._por_departamento = por_cedula, por_departamento
+        self._pendiente = False
+        self._registros_pendientes = []
+
+    def _indexar(self, emp_data: dict) -> None:
+        anterior = self._por_cedula.get(emp_data['cedula'])
+        if anterior is not None:
+            self._desindexar_departamento(anterior)
+        self._por_cedula[emp_data['cedula']] = emp_data
+        self._por_departamento.setdefault(emp_data['departamento'], {})[emp_data['cedula']] = None
+
+    def _desindexar_departamento(self, emp_data: dict) -> None:
+        cedulas = self._por_departamento.get(emp_data['departamento'])
+        if cedulas is not None:
+            cedulas.pop(emp_data['cedula'], None)
+            if not cedulas:
+                del self._por_departamento[emp_data['departamento']]
+
+    def _sincronizar(self) -> None:
+        """
+        Recarga los índices si el archivo cambió fuera de este repositorio.
+        Con cambios diferidos sin guardar se conserva el estado en memoria.
+        """
+        if not self._pendiente and self._firma_archivo() != self._firma:
+            self._cargar()
+
+    def _persistir(self, registro: dict) -> None:
+        self._pendiente = True
+        if self.journal:
+            self._registros_pendientes.append(registro)
+        if not self.escritura_diferida:
+            self.flush()
+
+    @instrumentar
+    def flush(self) -> None:
+        """
+        Escribe al archivo los cambios pendientes
+        """
+        if not self._pendiente:
+            return
+        if self.journal:
+            self._anotar(self._registros_pendientes)
+            self._registros_pendientes = []
+        else:
+            self._escribir_datos(list(self._por_cedula.values()))
+        self._firma = self._firma_archivo()
+        self._pendiente = False
+
+    # --- INTERFAZ Repositorio ---
+    @instrumentar
+    def guardar(self, empleado: Empleado) -> None:
+        """
+        Guarda o actualiza un empleado en O(1) sobre los índices
+        """
+        self._sincronizar()
+        emp_data = empleado.to_dict()
+        self._indexar(emp_data)
+        self._persistir({'op': 'upsert', 'empleado': emp_data})
+
+    @instrumentar
+    def guardar_varios(self, empleados: Iterable[Empleado]) -> None:
+        """
+        Guarda o actualiza varios empleados con una sola escritura al archivo
+        """
+        self._sincronizar()
+        diferida, self.escritura_diferida = self.escritura_diferida, True
+        try:
+            for empleado in empleados:
+                emp_data = empleado.to_dict()
+                self._indexar(emp_data)
+                self._persistir({'op': 'upsert', 'empleado': emp_data})
+        finally:
+            self.escritura_diferida = diferida
+        if not diferida:
+            self.flush()
+
+    @instrumentar
+    def obtener(self, cedula: str) -> Optional[Empleado]:
+        """
+        Obtiene un empleado por su cédula en O(1)
+        """
+        self._sincronizar()
+        emp_data = self._por_cedula.get(cedula)
+        return Empleado.from_dict(emp_data) if emp_data is not None else None
+
+    @instrumentar
+    def obtener_todos(self) -> List[Empleado]:
+        """
+        Obtiene todos los empleados en el orden del archivo
+        """
+        self._sincronizar()
+        return [Empleado.from_dict(emp_data) for emp_data in self._por_cedula.values()]
+
+    @instrumentar
+    def iterar_todos(self) -> Iterator[Empleado]:
+        """
+        Recorre los empleados del índice creando cada objeto solo cuando se pide.
+        Se copian solo las referencias a los registros, para poder guardar
+        mientras se recorre.
+        """
+        self._sincronizar()
+        return (Empleado.from_dict(emp_data) for emp_data in list(self._por_cedula.values()))
+
+    @instrumentar
+    def obtener_por_departamento(self, departamento: str) -> List[Empleado]:
+        """
+        Obtiene los empleados de un departamento usando el índice secundario
+        """
+        self._sincronizar()
+        cedulas = self._por_departamento.get(departamento, {})
+        return [Empleado.from_dict(self._por_cedula[cedula]) for cedula in cedulas]
+
+    @instrumentar
+    def eliminar(self, cedula: str) -> bool:
+        """
+        Elimina un empleado por su cédula
+        Returns: True si se eliminó, False si no existía
+        """
+        self._sincronizar()
+        emp_data = self._por_cedula.pop(cedula, None)
+        if emp_data is None:
+            return False
+        self._desindexar_departamento(emp_data)
+        self._persistir({'op': 'delete', 'cedula': cedula})
+        return True
@@ -1,16 +1,27 @@
 import json
 import os
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 from modelos.empleado import Empleado
 from repositorios.base import Repositorio
+from utils.metricas import instrumentar, registrar_io
 
 class RepositorioEmpleadosJSON(Repositorio):
     """
-    Implementación concreta del repositorio usando JSON como persistencia
+    Implementación concreta del repositorio usando JSON como persistencia.
+    Con journal=True cada cambio se agrega como una línea JSONL a un registro
+    junto al archivo principal, en lugar de reescribir todo el archivo.
     """
     
-    def __init__(self, archivo: str = "archivos/empleados.json"):
+    def __init__(self, archivo: str = "archivos/empleados.json", journal: bool = False,
+                 umbral_compactacion: int = 1024 * 1024):
+        """
+        umbral_compactacion: tamaño en bytes del journal a partir del cual
+        se integra automáticamente al archivo principal
+        """
         self.archivo = archivo
+        self.journal = journal
+        self.archivo_journal = f"{os.path.splitext(archivo)[0]}.journal.jsonl"
+        self.umbral_compactacion = umbral_compactacion
         self._crear_directorio_si_no_existe()
     
     def _crear_directorio_si_no_existe(self) -> None:
@@ -19,28 +30,116 @@ class RepositorioEmpleadosJSON(Repositorio):
         if directorio and not os.path.exists(directorio):
             os.makedirs(directorio)
     
-    def _leer_datos(self) -> List[dict]:
+    def _leer_snapshot(self) -> List[dict]:
         """
-        Lee todos los datos del archivo JSON
-        Returns: Lista de diccionarios con datos de empleados
+        Lee el archivo JSON principal (sin aplicar el journal)
         """
         try:
             with open(self.archivo, 'r', encoding='utf-8') as f:
+                registrar_io(leidos=os.fstat(f.fileno()).st_size)
                 return json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
             return []
     
+    def _leer_datos(self) -> List[dict]:
+        """
+        Lee todos los datos: el archivo principal más los cambios del journal
+        Returns: Lista de diccionarios con datos de empleados
+        """
+        datos = self._leer_snapshot()
+        if not os.path.exists(self.archivo_journal):
+            return datos
+        
+        por_cedula = {emp_data['cedula']: emp_data for emp_data in datos}
+        with open(self.archivo_journal, 'r', encoding='utf-8') as f:
+            registrar_io(leidos=os.fstat(f.fileno()).st_size)
+            for numero, linea in enumerate(f, 1):
+                # Solo la última línea puede quedar sin '\n' (caída a mitad de
+                # escritura); ese registro nunca se confirmó y se ignora
+                if not linea.endswith("\n"):
+                    break
+                try:
+                    registro = json.loads(linea)
+                except json.JSONDecodeError:
+                    raise ValueError(f"Journal dañado en la línea {numero}: {self.archivo_journal}")
+                if registro['op'] == 'upsert':
+                    por_cedula[registro['empleado']['cedula']] = registro['empleado']
+                elif registro['op'] == 'delete':
+                    por_cedula.pop(registro['cedula'], None)
+        return list(por_cedula.values())
+    
     def _escribir_datos(self, datos: List[dict]) -> None:
         """
-        Escribe datos al archivo JSON
+        Escribe datos al archivo JSON de forma atómica (archivo temporal + rename)
+        y descarta el journal, cuyos cambios ya quedan incluidos
         """
-        with open(self.archivo, 'w', encoding='utf-8') as f:
+        temporal = f"{self.archivo}.tmp"
+        with open(temporal, 'w', encoding='utf-8') as f:
             json.dump(datos, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+            registrar_io(escritos=f.tell())
+        os.replace(temporal, self.archivo)
+        
+        if os.path.exists(self.archivo_journal):
+            os.remove(self.archivo_journal)
+    
+    def _descartar_linea_incompleta(self) -> None:
+        """
+        Recorta el journal hasta su último '\n' para que el siguiente registro
+        no se pegue a una línea que quedó a medias
+        """
+        try:
+            f = open(self.archivo_journal, 'rb+')
+        except FileNotFoundError:
+            return
+        with f:
+            fin = f.seek(0, os.SEEK_END)
+            posicion = fin
+            while posicion > 0:
+                inicio = max(0, posicion - 4096)
+                f.seek(inicio)
+                bloque = f.read(posicion - inicio)
+                salto = bloque.rfind(b"\n")
+                if salto != -1:
+                    posicion = inicio + salto + 1
+                    break
+                posicion = inicio
+            if posicion != fin:
+                f.truncate(posicion)
+    
+    def _anotar(self, registros: List[dict]) -> None:
+        """
+        Agrega registros (upsert o delete) al final del journal y compacta
+        si superó el umbral
+        """
+        self._descartar_linea_incompleta()
+        with open(self.archivo_journal, 'a', encoding='utf-8') as f:
+            inicio = f.tell()
+            f.writelines(json.dumps(registro, ensure_ascii=False) + "\n" for registro in registros)
+            f.flush()
+            os.fsync(f.fileno())
+            registrar_io(escritos=f.tell() - inicio)
+        
+        if os.path.getsize(self.archivo_journal) >= self.umbral_compactacion:
+            self.compactar()
+    
+    @instrumentar
+    def compactar(self) -> None:
+        """
+        Integra el journal en un nuevo archivo principal
+        """
+        self._escribir_datos(self._leer_datos())
     
+    @instrumentar
     def guardar(self, empleado: Empleado) -> None:
         """
         Guarda o actualiza un empleado en el archivo JSON
         """
+        if self.journal:
+            self._anotar([{'op': 'upsert', 'empleado': empleado.to_dict()}])
+            return
+        
         datos = self._leer_datos()
         empleado_encontrado = False
         
@@ -57,6 +156,21 @@ class RepositorioEmpleadosJSON(Repositorio):
         
         self._escribir_datos(datos)
     
+    @instrumentar
+    def guardar_varios(self, empleados: Iterable[Empleado]) -> None:
+        """
+        Guarda o actualiza varios empleados con una sola lectura y una sola escritura
+        """
+        if self.journal:
+            self._anotar([{'op': 'upsert', 'empleado': empleado.to_dict()} for empleado in empleados])
+            return
+        
+        por_cedula = {emp_data['cedula']: emp_data for emp_data in self._leer_datos()}
+        for empleado in empleados:
+            por_cedula[empleado.cedula] = empleado.to_dict()
+        self._escribir_datos(list(por_cedula.values()))
+    
+    @instrumentar
     def obtener(self, cedula: str) -> Optional[Empleado]:
         """
         Obtiene un empleado por su cédula
@@ -67,6 +181,7 @@ class RepositorioEmpleadosJSON(Repositorio):
                 return Empleado.from_dict(emp_data)
         return None
     
+    @instrumentar
     def obtener_todos(self) -> List[Empleado]:
         """
         Obtiene todos los empleados del archivo JSON
@@ -74,11 +189,25 @@ class RepositorioEmpleadosJSON(Repositorio):
         datos = self._leer_datos()
         return [Empleado.from_dict(emp_data) for emp_data in datos]
     
+    @instrumentar
+    def iterar_todos(self) -> Iterator[Empleado]:
+        """
+        Recorre los empleados del archivo creando cada objeto solo cuando se pide
+        """
+        return (Empleado.from_dict(emp_data) for emp_data in self._leer_datos())
+    
+    @instrumentar
     def eliminar(self, cedula: str) -> bool:
         """
-        Elimina un empleado por su cédula
+        Elimina un empleado por su cédula. En modo journal solo se agrega el
+        registro de borrado, sin leer los datos: no se sabe si la cédula
+        existía y se devuelve True (borrar una cédula inexistente no cambia nada)
         Returns: True si se eliminó, False si no existía
         """
+        if self.journal:
+            self._anotar([{'op': 'delete', 'cedula': cedula}])
+            return True
+        
         datos = self._leer_datos()
         nuevos_datos = [emp for emp in datos if emp['cedula'] != cedula]
         
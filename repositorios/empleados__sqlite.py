@@ -0,0 +1,96 @@
+from typing import Iterable, Iterator, List, Optional
+from modelos.empleado import Empleado
+from repositorios.base import Repositorio
+from repositorios.conexion_sqlite import conectar
+
+# Sentencias parametrizadas: sqlite3 las prepara una vez y las reutiliza de su caché
+_CREAR_TABLA = """
+    CREATE TABLE IF NOT EXISTS empleados (
+        cedula TEXT PRIMARY KEY,
+        nombre TEXT NOT NULL,
+        sueldo REAL NOT NULL,
+        departamento TEXT NOT NULL,
+        cargo TEXT NOT NULL
+    )
+"""
+_CREAR_INDICE_DEPARTAMENTO = (
+    "CREATE INDEX IF NOT EXISTS idx_empleados_departamento ON empleados (departamento)"
+)
+_UPSERT = """
+    INSERT INTO empleados (cedula, nombre, sueldo, departamento, cargo)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (cedula) DO UPDATE SET
+        nombre = excluded.nombre,
+        sueldo = excluded.sueldo,
+        departamento = excluded.departamento,
+        cargo = excluded.cargo
+"""
+_COLUMNAS = "cedula, nombre, sueldo, departamento, cargo"
+_OBTENER = f"SELECT {_COLUMNAS} FROM empleados WHERE cedula = ?"
+_OBTENER_TODOS = f"SELECT {_COLUMNAS} FROM empleados ORDER BY rowid"
+_OBTENER_POR_DEPARTAMENTO = f"SELECT {_COLUMNAS} FROM empleados WHERE departamento = ? ORDER BY rowid"
+_ELIMINAR = "DELETE FROM empleados WHERE cedula = ?"
+
+def _fila(empleado: Empleado) -> tuple:
+    return (empleado.cedula, empleado.nombre, empleado.sueldo,
+            empleado.departamento, empleado.cargo)
+
+class RepositorioEmpleadosSQLite(Repositorio):
+    """
+    Implementación concreta del repositorio de empleados usando SQLite
+    """
+    
+    def __init__(self, archivo_db: str = "archivos/nominas.db"):
+        self.archivo_db = archivo_db
+        self._conexion = conectar(archivo_db)
+        with self._conexion:
+            self._conexion.execute(_CREAR_TABLA)
+            self._conexion.execute(_CREAR_INDICE_DEPARTAMENTO)
+    
+    def guardar(self, empleado: Empleado) -> None:
+        """
+        Guarda o actualiza un empleado
+        """
+        with self._conexion:
+            self._conexion.execute(_UPSERT, _fila(empleado))
+    
+    def guardar_varios(self, empleados: Iterable[Empleado]) -> None:
+        """
+        Guarda o actualiza varios empleados en una sola transacción
+        """
+        with self._conexion:
+            self._conexion.executemany(_UPSERT, (_fila(empleado) for empleado in empleados))
+    
+    def obtener(self, cedula: str) -> Optional[Empleado]:
+        """
+        Obtiene un empleado por su cédula
+        """
+        fila = self._conexion.execute(_OBTENER, (cedula,)).fetchone()
+        return Empleado(*fila) if fila else None
+    
+    def obtener_todos(self) -> List[Empleado]:
+        """
+        Obtiene todos los empleados en orden de inserción
+        """
+        return [Empleado(*fila) for fila in self._conexion.execute(_OBTENER_TODOS)]
+    
+    def iterar_todos(self) -> Iterator[Empleado]:
+        """
+        Recorre los empleados directamente desde el cursor, sin cargarlos todos
+        """
+        return (Empleado(*fila) for fila in self._conexion.execute(_OBTENER_TODOS))
+    
+    def obtener_por_departamento(self, departamento: str) -> List[Empleado]:
+        """
+        Obtiene los empleados de un departamento usando su índice
+        """
+        return [Empleado(*fila) for fila in self._conexion.execute(_OBTENER_POR_DEPARTAMENTO, (departamento,))]
+    
+    def eliminar(self, cedula: str) -> bool:
+        """
+        Elimina un empleado por su cédula
+        Returns: True si se eliminó, False si no existía
+        """
+        with self._conexion:
+            cursor = self._conexion.execute(_ELIMINAR, (cedula,))
+        return cursor.rowcount > 0
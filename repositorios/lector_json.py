@@ -0,0 +1,124 @@
+import json
+from typing import Any, Dict, Iterator
+
+# Caracteres que pueden seguir a un valor completo dentro de la nómina
+_SEPARADORES = frozenset(' \t\r\n,:]}')
+
+class LectorNominaJSON:
+    """
+    Lector incremental de un archivo nomina_YYYYMM.json.
+    Lee el archivo por bloques y decodifica con raw_decode un valor a la vez:
+    los detalles se entregan de a uno y nunca se arma el documento completo.
+    Las demás claves del objeto (id, aniomes, totales, tabla de empleados)
+    se guardan en 'cabecera' a medida que aparecen.
+    """
+
+    def __init__(self, archivo: str, tamano_bloque: int = 64 * 1024):
+        self.archivo = archivo
+        self.tamano_bloque = tamano_bloque
+        self.cabecera: Dict[str, Any] = {}
+        self._decodificador = json.JSONDecoder()
+        self._f = None
+        self._texto = ''
+        self._posicion = 0
+        self._fin = False
+
+    # --- TOKENIZADOR ---
+    def _leer_bloque(self, tamano: int = 0) -> bool:
+        """
+        Agrega un bloque (de al menos 'tamano' caracteres) al texto pendiente,
+        descartando lo ya consumido
+        Returns: False si el archivo terminó
+        """
+        if self._fin:
+            return False
+        bloque = self._f.read(max(tamano, self.tamano_bloque))
+        if not bloque:
+            self._fin = True
+            return False
+        self._texto = self._texto[self._posicion:] + bloque
+        self._posicion = 0
+        return True
+
+    def _caracter(self) -> str:
+        """
+        Siguiente carácter que no sea espacio (sin consumirlo); '' al final del archivo
+        """
+        while True:
+            texto, posicion = self._texto, self._posicion
+            while posicion < len(texto) and texto[posicion] in ' \t\r\n':
+                posicion += 1
+            self._posicion = posicion
+            if posicion < len(texto):
+                return texto[posicion]
+            if not self._leer_bloque():
+                return ''
+
+    def _esperar(self, esperado: str) -> None:
+        caracter = self._caracter()
+        if caracter != esperado:
+            raise ValueError(f"JSON de nómina no válido: se esperaba '{esperado}' y llegó '{caracter}' "
+                             f"en {self.archivo}")
+        self._posicion += 1
+
+    def _valor(self) -> Any:
+        """
+        Decodifica el siguiente valor completo, leyendo más bloques si hace falta
+        """
+        self._caracter()
+        while True:
+            try:
+                valor, fin = self._decodificador.raw_decode(self._texto, self._posicion)
+            except json.JSONDecodeError:
+                # Valor incompleto: se duplica lo pendiente para que un valor
+                # grande (la tabla de empleados) no se decodifique muchas veces
+                if self._leer_bloque(len(self._texto) - self._posicion):
+                    continue
+                raise
+            # Un número cortado por el bloque ("2700." o "1e") puede seguir en el
+            # próximo: solo se acepta si después viene un separador
+            if (fin < len(self._texto) and self._texto[fin] in _SEPARADORES) or not self._leer_bloque():
+                self._posicion = fin
+                return valor
+
+    # --- RECORRIDO DEL DOCUMENTO ---
+    def detalles(self) -> Iterator[Dict]:
+        """
+        Recorre el objeto de la nómina y entrega cada detalle como diccionario
+        """
+        with open(self.archivo, 'r', encoding='utf-8') as self._f:
+            self._texto, self._posicion, self._fin = '', 0, False
+            self._esperar('{')
+            if self._caracter() == '}':
+                return
+            while True:
+                clave = self._valor()
+                self._esperar(':')
+                if clave == 'detalles':
+                    yield from self._elementos()
+                else:
+                    self.cabecera[clave] = self._valor()
+                if self._caracter() == '}':
+                    return
+                self._esperar(',')
+
+    def _elementos(self) -> Iterator[Any]:
+        self._esperar('[')
+        if self._caracter() == ']':
+            self._posicion += 1
+            return
+        while True:
+            yield self._valor()
+            if self._caracter() == ']':
+                self._posicion += 1
+                return
+            self._esperar(',')
+
+    def leer_cabecera(self) -> Dict[str, Any]:
+        """
+        Recorre todo el archivo descartando los detalles
+        Returns: Las demás claves del objeto
+        """
+        for _ in self.detalles():
+            pass
+        return self.cabecera
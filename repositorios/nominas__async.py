@@ -0,0 +1,66 @@
+import asyncio
+import weakref
+from typing import Dict, List, Optional, Sequence
+
+from modelos.nomina import Nomina
+from repositorios.base import RepositorioNominas
+
+class RepositorioNominasAsync:
+    """
+    Versión asíncrona de un repositorio de nóminas.
+    Cada lectura bloqueante (open + json.load, consultas SQLite, mmap) se
+    ejecuta en un hilo con asyncio.to_thread, así varias lecturas de disco
+    se solapan; un semáforo limita cuántas corren a la vez.
+    """
+
+    def __init__(self, repositorio: RepositorioNominas, max_concurrencia: int = 8):
+        self.repositorio = repositorio
+        self.max_concurrencia = max_concurrencia
+        # Un semáforo por event loop: queda ligado al loop que lo usa primero y
+        # cada asyncio.run() crea uno nuevo
+        self._semaforos = weakref.WeakKeyDictionary()
+
+    def _semaforo(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaforo = self._semaforos.get(loop)
+        if semaforo is None:
+            semaforo = self._semaforos[loop] = asyncio.Semaphore(self.max_concurrencia)
+        return semaforo
+
+    async def _en_hilo(self, funcion, *args):
+        async with self._semaforo():
+            return await asyncio.to_thread(funcion, *args)
+
+    async def obtener(self, aniomes: str) -> Optional[Nomina]:
+        """
+        Obtiene una nómina por año-mes sin bloquear el event loop
+        Returns: Nomina o None si no existe
+        """
+        return await self._en_hilo(self.repositorio.obtener, aniomes)
+
+    async def obtener_varios(self, periodos: Sequence[str]) -> Dict[str, Optional[Nomina]]:
+        """
+        Carga varios períodos de forma concurrente (hasta max_concurrencia a la vez)
+        Returns: Diccionario aniomes -> Nomina (None si no existe), en el orden pedido
+        """
+        nominas = await asyncio.gather(*(self.obtener(aniomes) for aniomes in periodos))
+        return dict(zip(periodos, nominas))
+
+    async def listar_nominas(self) -> List[str]:
+        """
+        Lista los períodos disponibles
+        Returns: Lista de strings aniomes (YYYYMM) ordenada
+        """
+        return await self._en_hilo(self.repositorio.listar_nominas)
+
+    async def obtener_resumenes(self, verificar: bool = False) -> List[Dict]:
+        """
+        Resúmenes (id, aniomes, empleados y totales) de todos los períodos
+        """
+        return await self._en_hilo(self.repositorio.obtener_resumenes, verificar)
+
+    async def obtener_departamentos(self, aniomes: str) -> Optional[Dict[str, Dict]]:
+        """
+        Métricas por departamento guardadas con el período
+        """
+        return await self._en_hilo(self.repositorio.obtener_departamentos, aniomes)
@@ -0,0 +1,425 @@
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import json
+import mmap
+import os
+import struct
+import sys
+
+from modelos.nomina import Nomina
+from modelos.detalle_nomina import DetalleNomina
+from modelos.detalles_columnares import DetallesColumnares, cargar_numpy
+from modelos.empleado import Empleado
+from repositorios.base import RepositorioNominas
+from utils.dinero import a_centavos, a_monto
+from utils.estadisticas import calcular_metricas_departamento, serializar_metricas_departamento
+
+# Formato del archivo nomina_YYYYMM.bin (enteros y floats de 8 bytes, little-endian):
+#   cabecera    magic, versión, orden de bytes, aniomes, id, filas, empleados,
+#               tot_ing, tot_des, neto en centavos (q)                   (64 bytes)
+#   columnas    id (q), empleado (q) y COLUMNAS_BINARIAS en centavos (q),
+#               'filas' valores c/u
+#   empleados   sueldo (d) por empleado
+#   cadenas     desplazamientos (Q, 4 por empleado + 1) y bytes UTF-8 de
+#               cedula, nombre, departamento y cargo de cada empleado
+#   departamentos  SECCION_DEPARTAMENTOS, largo (q) y las métricas por
+#               departamento en JSON UTF-8, calculadas al guardar (opcional:
+#               los archivos anteriores no la tienen)
+# La versión 1 guardaba los montos y totales como floats (d); se sigue leyendo.
+MAGIC = b'NOMB'
+VERSION = 2
+CABECERA = struct.Struct('<4sHH8sqqqqqq')
+CABECERA_V1 = struct.Struct('<4sHH8sqqqddd')
+_CABECERAS = {1: CABECERA_V1, VERSION: CABECERA}
+COLUMNAS_BINARIAS = ('sueldo', 'bono', 'iess', 'prestamo', 'tot_ing', 'tot_des', 'neto')
+_CAMPOS_TEXTO = ('cedula', 'nombre', 'departamento', 'cargo')
+_LITTLE_ENDIAN = 1
+SECCION_DEPARTAMENTOS = b'DEPT'
+_LARGO_SECCION = struct.Struct('<4sq')
+
+def _leer_cabecera(datos) -> Optional[tuple]:
+    """
+    Interpreta la cabecera de cualquier versión conocida
+    Returns: (versión, orden, aniomes, id, filas, empleados, tot_ing, tot_des,
+    neto en centavos) o None si no es un archivo de nómina binario
+    """
+    if len(datos) < CABECERA.size or bytes(datos[:4]) != MAGIC:
+        return None
+    version = struct.unpack_from('<H', datos, 4)[0]
+    if version not in _CABECERAS:
+        return None
+    _, version, orden, aniomes, id, filas, empleados, *totales = _CABECERAS[version].unpack_from(datos)
+    if version == 1:
+        totales = [a_centavos(total) for total in totales]
+    return (version, orden, aniomes, id, filas, empleados, *totales)
+
+class NominaBinaria:
+    """
+    Vista de solo lectura de un archivo binario de nómina mapeado en memoria.
+    Las columnas son memoryviews sobre el archivo (sin copias ni objetos por
+    fila); los montos están en centavos. Debe cerrarse con close() o usarse
+    con 'with'.
+    """
+
+    def __init__(self, archivo: str):
+        with open(archivo, 'rb') as f:
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._vista = memoryview(self._mapa)
+
+        cabecera = _leer_cabecera(self._vista)
+        if cabecera is None:
+            self.close()
+            raise ValueError(f"Archivo de nómina binario no válido: {archivo}")
+        (self.version, orden, aniomes, self.id, self.filas, self.cantidad_empleados,
+         self.tot_ing_centavos, self.tot_des_centavos, self.neto_centavos) = cabecera
+        if orden != _LITTLE_ENDIAN or sys.byteorder != 'little':
+            self.close()
+            raise ValueError("El formato binario de nómina solo se lee en equipos little-endian")
+        self.aniomes = aniomes.rstrip(b'\0').decode('ascii')
+
+        posicion = CABECERA.size
+        tipo_montos = 'd' if self.version == 1 else 'q'
+        self._columnas: Dict[str, memoryview] = {}
+        for nombre, tipo in [('id', 'q'), ('empleado', 'q')] + [(c, tipo_montos) for c in COLUMNAS_BINARIAS]:
+            self._columnas[nombre] = self._vista[posicion:posicion + 8 * self.filas].cast(tipo)
+            posicion += 8 * self.filas
+        # Montos de la versión 1 convertidos a centavos la primera vez que se piden
+        self._convertidas: Dict[str, array] = {}
+
+        m = self.cantidad_empleados
+        self._sueldos_empleado = self._vista[posicion:posicion + 8 * m].cast('d')
+        posicion += 8 * m
+        self._desplazamientos = self._vista[posicion:posicion + 8 * (4 * m + 1)].cast('Q')
+        posicion += 8 * (4 * m + 1)
+        fin_cadenas = posicion + self._desplazamientos[-1]
+        self._cadenas = self._vista[posicion:fin_cadenas]
+        self._inicio_secciones = fin_cadenas
+        self._empleados: Optional[List[Empleado]] = None
+
+    def __enter__(self) -> 'NominaBinaria':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Libera las vistas y el mapeo del archivo
+        """
+        for vista in getattr(self, '_columnas', {}).values():
+            vista.release()
+        for nombre in ('_sueldos_empleado', '_desplazamientos', '_cadenas', '_vista'):
+            vista = getattr(self, nombre, None)
+            if vista is not None:
+                vista.release()
+        self._mapa.close()
+
+    def __len__(self) -> int:
+        return self.filas
+
+    def departamentos(self) -> Optional[Dict[str, Dict]]:
+        """
+        Métricas por departamento guardadas en el archivo
+        Returns: Diccionario departamento -> métricas, o None si el archivo no las tiene
+        """
+        posicion = self._inicio_secciones
+        if len(self._vista) < posicion + _LARGO_SECCION.size:
+            return None
+        marca, largo = _LARGO_SECCION.unpack_from(self._vista, posicion)
+        if marca != SECCION_DEPARTAMENTOS:
+            return None
+        posicion += _LARGO_SECCION.size
+        return json.loads(bytes(self._vista[posicion:posicion + largo]))
+
+    @property
+    def tot_ing(self) -> float:
+        return a_monto(self.tot_ing_centavos)
+
+    @property
+    def tot_des(self) -> float:
+        return a_monto(self.tot_des_centavos)
+
+    @property
+    def neto(self) -> float:
+        return a_monto(self.neto_centavos)
+
+    def columna(self, nombre: str):
+        """
+        Columna ('id', 'empleado' o un monto en centavos); en la versión
+        actual es una memoryview sobre el archivo
+        """
+        if self.version == 1 and nombre in COLUMNAS_BINARIAS:
+            if nombre not in self._convertidas:
+                self._convertidas[nombre] = array('q', map(a_centavos, self._columnas[nombre]))
+            return self._convertidas[nombre]
+        return self._columnas[nombre]
+
+    def total_centavos(self, nombre: str) -> int:
+        np = cargar_numpy()
+        if np is not None:
+            return int(np.frombuffer(self.columna(nombre), dtype=np.int64).sum())
+        return sum(self.columna(nombre))
+
+    def total(self, nombre: str) -> float:
+        return a_monto(self.total_centavos(nombre))
+
+    def promedio(self, nombre: str) -> float:
+        return self.total(nombre) / self.filas if self.filas else 0
+
+    def maximo(self, nombre: str) -> float:
+        return a_monto(max(self.columna(nombre)))
+
+    def minimo(self, nombre: str) -> float:
+        return a_monto(min(self.columna(nombre)))
+
+    def sumar(self, columnas: Sequence[str], cedula: Optional[str] = None,
+              departamento: Optional[str] = None) -> Tuple[float, ...]:
+        """
+        Suma columnas sobre las filas de un empleado o departamento (o todas)
+        leyendo solo esas columnas del archivo
+        """
+        if cedula is None and departamento is None:
+            return tuple(self.total(columna) for columna in columnas)
+        elegidos = {
+            i for i, empleado in enumerate(self.empleados())
+            if (cedula is None or empleado.cedula == cedula)
+            and (departamento is None or empleado.departamento == departamento)
+        }
+        np = cargar_numpy()
+        if np is not None:
+            referencias = np.frombuffer(self._columnas['empleado'], dtype=np.int64)
+            filas = np.isin(referencias, list(elegidos))
+            return tuple(a_monto(int(np.frombuffer(self.columna(columna), dtype=np.int64)[filas].sum()))
+                         for columna in columnas)
+        filas = [i for i, referencia in enumerate(self._columnas['empleado']) if referencia in elegidos]
+        return tuple(a_monto(sum(self.columna(columna)[i] for i in filas)) for columna in columnas)
+
+    def empleados(self) -> List[Empleado]:
+        """
+        Tabla de empleados (un objeto por empleado, creada una sola vez)
+        """
+        if self._empleados is None:
+            textos = bytes(self._cadenas)
+            d = self._desplazamientos
+            self._empleados = []
+            for i in range(self.cantidad_empleados):
+                cedula, nombre, departamento, cargo = (
+                    textos[d[4 * i + k]:d[4 * i + k + 1]].decode('utf-8') for k in range(4)
+                )
+                self._empleados.append(
+                    Empleado(cedula, nombre, self._sueldos_empleado[i], departamento, cargo)
+                )
+        return self._empleados
+
+    def a_columnar(self) -> DetallesColumnares:
+        """
+        Copia los datos a un DetallesColumnares independiente del archivo
+        """
+        tabla = self.empleados()
+        return DetallesColumnares.desde_columnas(
+            array('q', self._columnas['id'].tobytes()),
+            [tabla[i] for i in self._columnas['empleado']],
+            {nombre: array('q', self.columna(nombre).tobytes()) for nombre in COLUMNAS_BINARIAS}
+        )
+
+    def detalles(self):
+        """
+        Recorre los detalles como DetalleNomina (objetos creados por fila)
+        """
+        tabla = self.empleados()
+        ids, referencias = self._columnas['id'], self._columnas['empleado']
+        sueldos, bonos, prestamos, aportes = (self.columna(nombre)
+                                              for nombre in ('sueldo', 'bono', 'prestamo', 'iess'))
+        for i in range(self.filas):
+            yield DetalleNomina.desde_centavos(ids[i], tabla[referencias[i]],
+                                               sueldos[i], bonos[i], prestamos[i], aportes[i])
+
+class RepositorioNominasBinario(RepositorioNominas):
+    """
+    Repositorio de nóminas en formato binario columnar (nomina_YYYYMM.bin)
+    """
+
+    def __init__(self, directorio: str = "archivos/nominas/", columnar: bool = False):
+        self.directorio = directorio
+        self.columnar = columnar
+        if not os.path.exists(self.directorio):
+            os.makedirs(self.directorio)
+
+    def _archivo(self, aniomes: str) -> str:
+        return f"{self.directorio}nomina_{aniomes}.bin"
+
+    def guardar(self, nomina: Nomina) -> None:
+        """
+        Guarda la nómina como columnas empaquetadas más la tabla de empleados
+        y las métricas por departamento
+        """
+        ids, referencias = array('q'), array('q')
+        columnas = {nombre: array('q') for nombre in COLUMNAS_BINARIAS}
+        atributos = [(columnas[nombre], f"{nombre}_centavos") for nombre in COLUMNAS_BINARIAS]
+        tabla: List[Empleado] = []
+        indices: Dict[tuple, int] = {}
+
+        for detalle in nomina.detalles:
+            empleado = detalle.empleado
+            clave = (empleado.cedula, empleado.nombre, empleado.sueldo, empleado.departamento, empleado.cargo)
+            if clave not in indices:
+                indices[clave] = len(tabla)
+                tabla.append(empleado)
+            ids.append(detalle.id)
+            referencias.append(indices[clave])
+            for columna, atributo in atributos:
+                columna.append(getattr(detalle, atributo))
+
+        sueldos = array('d', (float(empleado.sueldo) for empleado in tabla))
+        desplazamientos = array('Q', [0])
+        cadenas = bytearray()
+        for empleado in tabla:
+            for campo in _CAMPOS_TEXTO:
+                cadenas += str(getattr(empleado, campo)).encode('utf-8')
+                desplazamientos.append(len(cadenas))
+
+        if sys.byteorder != 'little':
+            for arreglo in (ids, referencias, sueldos, desplazamientos, *columnas.values()):
+                arreglo.byteswap()
+        departamentos = json.dumps(serializar_metricas_departamento(
+            calcular_metricas_departamento(nomina.detalles)), ensure_ascii=False).encode('utf-8')
+
+        archivo = self._archivo(nomina.aniomes)
+        temporal = f"{archivo}.tmp"
+        with open(temporal, 'wb') as f:
+            f.write(CABECERA.pack(MAGIC, VERSION, _LITTLE_ENDIAN, nomina.aniomes.encode('ascii'),
+                                  nomina.id, len(ids), len(tabla),
+                                  nomina.tot_ing_centavos, nomina.tot_des_centavos,
+                                  nomina.neto_centavos))
+            ids.tofile(f)
+            referencias.tofile(f)
+            for nombre in COLUMNAS_BINARIAS:
+                columnas[nombre].tofile(f)
+            sueldos.tofile(f)
+            desplazamientos.tofile(f)
+            f.write(cadenas)
+            f.write(_LARGO_SECCION.pack(SECCION_DEPARTAMENTOS, len(departamentos)))
+            f.write(departamentos)
+        os.replace(temporal, archivo)
+
+    def abrir(self, aniomes: str) -> Optional[NominaBinaria]:
+        """
+        Abre la nómina mapeada en memoria para consultas sin copiar datos
+        Returns: NominaBinaria (cerrarla al terminar) o None si no existe
+        """
+        archivo = self._archivo(aniomes)
+        if not os.path.exists(archivo):
+            return None
+        return NominaBinaria(archivo)
+
+    def obtener(self, aniomes: str) -> Optional[Nomina]:
+        """
+        Obtiene una nómina por año-mes con todos sus detalles
+        Returns: Nomina completa o None si no existe
+        """
+        try:
+            vista = self.abrir(aniomes)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return None
+        if vista is None:
+            print(f"⚠️ Archivo no encontrado: {self._archivo(aniomes)}")
+            return None
+
+        with vista:
+            nomina = Nomina(vista.id, vista.aniomes, columnar=self.columnar)
+            if self.columnar:
+                nomina.detalles = vista.a_columnar()
+            else:
+                nomina.detalles.extend(vista.detalles())
+            nomina.tot_ing_centavos = vista.tot_ing_centavos
+            nomina.tot_des_centavos = vista.tot_des_centavos
+            nomina.neto_centavos = vista.neto_centavos
+        return nomina
+
+    def firma(self, aniomes: str) -> Optional[Tuple]:
+        """
+        Fecha de modificación y tamaño del archivo del período (() si no existe)
+        """
+        try:
+            estado = os.stat(self._archivo(aniomes))
+        except FileNotFoundError:
+            return ()
+        return (estado.st_mtime_ns, estado.st_size)
+
+    def iterar_detalles(self, aniomes: str) -> Iterator[DetalleNomina]:
+        """
+        Recorre los detalles sobre el archivo mapeado, sin cargar la nómina
+        """
+        try:
+            vista = self.abrir(aniomes)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        if vista is None:
+            return
+        with vista:
+            yield from vista.detalles()
+
+    def sumar_periodo(self, aniomes: str, columnas: Sequence[str], cedula: Optional[str] = None,
+                      departamento: Optional[str] = None) -> Optional[Tuple[float, ...]]:
+        """
+        Suma columnas del período sobre el archivo mapeado (sin crear detalles)
+        """
+        try:
+            vista = self.abrir(aniomes)
+        except ValueError:
+            return None
+        if vista is None:
+            return None
+        with vista:
+            return vista.sumar(columnas, cedula, departamento)
+
+    def obtener_departamentos(self, aniomes: str) -> Optional[Dict[str, Dict]]:
+        """
+        Métricas por departamento guardadas en el archivo al generar el
+        período; los archivos anteriores a la sección se calculan cargándolos
+        Returns: Diccionario departamento -> métricas, o None si no existe
+        """
+        try:
+            vista = self.abrir(aniomes)
+        except ValueError:
+            return None
+        if vista is None:
+            return None
+        with vista:
+            departamentos = vista.departamentos()
+        if departamentos is None:
+            return super().obtener_departamentos(aniomes)
+        return departamentos
+
+    def obtener_resumenes(self, verificar: bool = False) -> List[Dict]:
+        """
+        Resúmenes de todos los períodos leyendo solo la cabecera de cada archivo
+        Returns: Lista de resúmenes ordenada por aniomes
+        """
+        resumenes = []
+        for aniomes in self.listar_nominas():
+            with open(self._archivo(aniomes), 'rb') as f:
+                datos = f.read(CABECERA.size)
+            cabecera = _leer_cabecera(datos)
+            if cabecera is None:
+                continue
+            _, _, _, id, filas, _, tot_ing, tot_des, neto = cabecera
+            resumenes.append({'id': id, 'aniomes': aniomes, 'empleados': filas,
+                              'tot_ing': a_monto(tot_ing), 'tot_des': a_monto(tot_des),
+                              'neto': a_monto(neto)})
+        return resumenes
+    
+    def listar_nominas(self) -> List[str]:
+        """
+        Lista todas las nóminas binarias disponibles
+        Returns: Lista de strings aniomes (YYYYMM)
+        """
+        if not os.path.exists(self.directorio):
+            return []
+        return sorted(
+            archivo[len("nomina_"):-len(".bin")]
+            for archivo in os.listdir(self.directorio)
+            if archivo.startswith("nomina_") and archivo.endswith(".bin")
+        )
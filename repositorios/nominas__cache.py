@@ -0,0 +1,195 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import threading
+
+from modelos.nomina import Nomina
+from modelos.detalle_nomina import DetalleNomina
+from repositorios.base import RepositorioNominas
+
+# Memoria aproximada de un detalle cargado (DetalleNomina + Empleado con __slots__),
+# medida con benchmarks/memoria_modelos.py
+BYTES_POR_DETALLE = 500
+
+class RepositorioNominasCache(RepositorioNominas):
+    """
+    Caché LRU acotada de nóminas cargadas delante de otro repositorio.
+    Una nómina se vuelve a leer si cambió la firma del período en el
+    repositorio (fecha y tamaño del archivo) o si se guardó por aquí.
+    Las nóminas se comparten entre llamadas: tratarlas como solo lectura.
+    """
+
+    def __init__(self, repositorio: RepositorioNominas, max_nominas: int = 8,
+                 max_bytes: Optional[int] = None):
+        """
+        max_nominas: cantidad máxima de períodos en memoria.
+        max_bytes: presupuesto aproximado de memoria (None = sin límite).
+        """
+        self.repositorio = repositorio
+        self.max_nominas = max_nominas
+        self.max_bytes = max_bytes
+        self._entradas: "OrderedDict[str, Tuple[Nomina, Optional[Tuple], int]]" = OrderedDict()
+        self._bytes = 0
+        self._departamentos: Dict[str, Tuple[Optional[Tuple], Dict]] = {}
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def __getattr__(self, nombre: str):
+        # Operaciones propias del repositorio envuelto (obtener_detalle, abrir,
+        # verificar_nomina, normalizado, ...); las que escriben invalidan la caché
+        if nombre == 'repositorio':
+            raise AttributeError(nombre)
+        atributo = getattr(self.repositorio, nombre)
+        if nombre in ('guardar_fragmentos', 'convertir_a_normalizado'):
+            def escribir_e_invalidar(*args, **kwargs):
+                try:
+                    return atributo(*args, **kwargs)
+                finally:
+                    self.limpiar()
+            return escribir_e_invalidar
+        return atributo
+
+    # --- CACHÉ ---
+    def _tamano(self, nomina: Nomina) -> int:
+        return len(nomina.detalles) * BYTES_POR_DETALLE
+
+    def _quitar(self, aniomes: str) -> None:
+        _, _, tamano = self._entradas.pop(aniomes)
+        self._bytes -= tamano
+
+    def _desalojar(self) -> None:
+        """
+        Quita las nóminas menos usadas hasta respetar los límites
+        """
+        while self._entradas and (
+            len(self._entradas) > self.max_nominas
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            aniomes = next(iter(self._entradas))
+            self._quitar(aniomes)
+            self.desalojos += 1
+
+    def invalidar(self, aniomes: str) -> None:
+        """
+        Descarta la nómina de un período de la caché
+        """
+        with self._lock:
+            if aniomes in self._entradas:
+                self._quitar(aniomes)
+            self._departamentos.pop(aniomes, None)
+
+    def limpiar(self) -> None:
+        """
+        Descarta todas las nóminas de la caché
+        """
+        with self._lock:
+            self._entradas.clear()
+            self._departamentos.clear()
+            self._bytes = 0
+
+    def estadisticas(self) -> Dict:
+        """
+        Contadores de aciertos, fallos y desalojos, y ocupación actual
+        """
+        with self._lock:
+            consultas = self.aciertos + self.fallos
+            return {
+                'aciertos': self.aciertos,
+                'fallos': self.fallos,
+                'desalojos': self.desalojos,
+                'tasa_aciertos': self.aciertos / consultas if consultas else 0,
+                'nominas': len(self._entradas),
+                'bytes': self._bytes
+            }
+
+    # --- INTERFAZ RepositorioNominas ---
+    def obtener(self, aniomes: str) -> Optional[Nomina]:
+        """
+        Obtiene la nómina desde memoria si sigue vigente; si no, la carga
+        """
+        firma = self.repositorio.firma(aniomes)
+        with self._lock:
+            entrada = self._entradas.get(aniomes)
+            if entrada is not None and entrada[1] == firma:
+                self._entradas.move_to_end(aniomes)
+                self.aciertos += 1
+                return entrada[0]
+            self.fallos += 1
+
+        nomina = self.repositorio.obtener(aniomes)
+
+        with self._lock:
+            if aniomes in self._entradas:
+                self._quitar(aniomes)
+            if nomina is not None:
+                tamano = self._tamano(nomina)
+                self._entradas[aniomes] = (nomina, firma, tamano)
+                self._bytes += tamano
+                self._desalojar()
+        return nomina
+
+    def iterar_detalles(self, aniomes: str) -> Iterator[DetalleNomina]:
+        """
+        Recorre los detalles desde memoria si la nómina está en la caché; si
+        no, los lee del repositorio sin cargarla (no la agrega a la caché)
+        """
+        firma = self.repositorio.firma(aniomes)
+        with self._lock:
+            entrada = self._entradas.get(aniomes)
+            if entrada is not None and entrada[1] == firma:
+                self._entradas.move_to_end(aniomes)
+                return iter(entrada[0].detalles)
+        return self.repositorio.iterar_detalles(aniomes)
+
+    def guardar(self, nomina: Nomina) -> None:
+        try:
+            self.repositorio.guardar(nomina)
+        finally:
+            self.invalidar(nomina.aniomes)
+
+    def guardar_streaming(self, id: int, aniomes: str,
+                          detalles: Iterable[DetalleNomina]) -> Dict:
+        try:
+            return self.repositorio.guardar_streaming(id, aniomes, detalles)
+        finally:
+            self.invalidar(aniomes)
+
+    def listar_nominas(self) -> List[str]:
+        return self.repositorio.listar_nominas()
+
+    def obtener_resumenes(self, verificar: bool = False) -> List[Dict]:
+        return self.repositorio.obtener_resumenes(verificar)
+
+    def obtener_departamentos(self, aniomes: str) -> Optional[Dict[str, Dict]]:
+        """
+        Métricas por departamento guardadas, recordadas mientras no cambie la firma
+        """
+        firma = self.repositorio.firma(aniomes)
+        with self._lock:
+            entrada = self._departamentos.get(aniomes)
+            if entrada is not None and entrada[0] == firma:
+                return entrada[1]
+        departamentos = self.repositorio.obtener_departamentos(aniomes)
+        if departamentos is not None:
+            with self._lock:
+                self._departamentos[aniomes] = (firma, departamentos)
+        return departamentos
+
+    def sumar_periodo(self, aniomes: str, columnas: Sequence[str], cedula: Optional[str] = None,
+                      departamento: Optional[str] = None) -> Optional[Tuple[float, ...]]:
+        # Si el repositorio sabe proyectar columnas se usa eso; si no, la
+        # nómina se carga a través de la caché
+        if type(self.repositorio).sumar_periodo is not RepositorioNominas.sumar_periodo:
+            return self.repositorio.sumar_periodo(aniomes, columnas, cedula, departamento)
+        return super().sumar_periodo(aniomes, columnas, cedula, departamento)
+
+    def sumar_por_periodo(self, periodos: Sequence[str], columnas: Sequence[str],
+                          cedula: Optional[str] = None, departamento: Optional[str] = None,
+                          workers: Optional[int] = None) -> Dict[str, Tuple[float, ...]]:
+        if type(self.repositorio).sumar_por_periodo is not RepositorioNominas.sumar_por_periodo:
+            return self.repositorio.sumar_por_periodo(periodos, columnas, cedula, departamento, workers)
+        return super().sumar_por_periodo(periodos, columnas, cedula, departamento, workers)
+
+    def firma(self, aniomes: str) -> Optional[Tuple]:
+        return self.repositorio.firma(aniomes)
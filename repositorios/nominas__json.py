@@ -1,17 +1,102 @@
 import json
 import os
-from typing import Optional, List
+import re
+import threading
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
 from modelos.nomina import Nomina
 from modelos.detalle_nomina import DetalleNomina
 from modelos.empleado import Empleado
+from repositorios.base import RepositorioNominas
+from repositorios.lector_json import LectorNominaJSON
+from utils.acumulador import AcumuladorEstadisticas
+from utils.dinero import a_monto
+from utils.metricas import instrumentar, registrar_error, registrar_io
+from utils.estadisticas import calcular_metricas_departamento, serializar_metricas_departamento
 
-class RepositorioNominasJSON:
+def serializar_detalle(detalle: DetalleNomina) -> str:
     """
-    Repositorio para guardar y cargar nóminas en archivos JSON
+    Serializa un detalle con la misma indentación que tiene dentro del archivo de nómina
     """
+    return _serializar(detalle.to_dict())
+
+def _serializar(detalle_data: Dict) -> str:
+    return json.dumps(detalle_data, indent=2, ensure_ascii=False).replace('\n', '\n    ')
+
+def _empleado_legado(nombre: str, detalle_data: Dict) -> Dict:
+    """
+    Datos de empleado para el formato antiguo, donde 'empleado' era solo el nombre
+    """
+    return {'cedula': '', 'nombre': nombre, 'sueldo': detalle_data['sueldo'],
+            'departamento': '', 'cargo': ''}
+
+def _empleado_de_detalle(detalle_data: Dict, tabla: List[Empleado]) -> Empleado:
+    """
+    Reconstruye el empleado de un detalle en cualquiera de los formatos:
+    referencia a la tabla (normalizado), diccionario embebido o solo el nombre
+    """
+    referencia = detalle_data['empleado']
+    if isinstance(referencia, int):
+        return tabla[referencia]
+    if isinstance(referencia, str):
+        return Empleado.from_dict(_empleado_legado(referencia, detalle_data))
+    return Empleado.from_dict(referencia)
+
+# Solo nomina_YYYYMM.json (excluye temporales y el índice)
+_PATRON_ARCHIVO = re.compile(r'^nomina_(\d{6})\.json$')
+
+# Errores de un detalle mal formado: falta un campo o una referencia
+# (LookupError), no es un objeto (AttributeError) o un monto no es numérico
+# (TypeError, ValueError con NaN, decimal.InvalidOperation y OverflowError)
+_ERRORES_DETALLE = (LookupError, AttributeError, TypeError, ValueError, ArithmeticError)
+
+def _checksum_archivo(archivo: str) -> str:
+    """
+    SHA-256 del contenido de un archivo, leído por bloques
+    """
+    import hashlib  # Solo al escribir o resumir: las consultas no lo cargan
+    suma = hashlib.sha256()
+    with open(archivo, 'rb') as f:
+        for bloque in iter(lambda: f.read(1024 * 1024), b''):
+            suma.update(bloque)
+    return suma.hexdigest()
+
+class _EscrituraConChecksum:
+    """
+    Envuelve un archivo de texto y calcula el SHA-256 y la cantidad de bytes
+    de lo que se escribe
+    """
+    
+    def __init__(self, archivo):
+        import hashlib  # Solo al escribir o resumir: las consultas no lo cargan
+        self._archivo = archivo
+        self._suma = hashlib.sha256()
+        self.bytes = 0
+    
+    def write(self, texto: str) -> None:
+        self._archivo.write(texto)
+        codificado = texto.encode('utf-8')
+        self._suma.update(codificado)
+        self.bytes += len(codificado)
+    
+    def checksum(self) -> str:
+        return self._suma.hexdigest()
+
+class RepositorioNominasJSON(RepositorioNominas):
+    """
+    Repositorio para guardar y cargar nóminas en archivos JSON.
+    Mantiene un índice (indice_nominas.json) con el resumen de cada período
+    para listar y totalizar sin abrir los archivos de detalle.
+    """
+    
+    ARCHIVO_INDICE = "indice_nominas.json"
     
-    def __init__(self, directorio: str = "archivos/nominas/"):
+    def __init__(self, directorio: str = "archivos/nominas/", columnar: bool = False,
+                 normalizado: bool = False):
         self.directorio = directorio
+        # Si es True, las nóminas se cargan con almacenamiento columnar
+        self.columnar = columnar
+        # Si es True, se guarda una tabla de empleados y los detalles la referencian
+        self.normalizado = normalizado
         self._crear_directorio_si_no_existe()
     
     def _crear_directorio_si_no_existe(self) -> None:
@@ -19,15 +104,141 @@ class RepositorioNominasJSON:
         if not os.path.exists(self.directorio):
             os.makedirs(self.directorio)
     
+    @instrumentar
     def guardar(self, nomina: Nomina) -> None:
         """
         Guarda una nómina en un archivo JSON
         El archivo se nombra: nomina_YYYYMM.json
         """
         archivo = f"{self.directorio}nomina_{nomina.aniomes}.json"
-        with open(archivo, 'w', encoding='utf-8') as f:
-            json.dump(nomina.to_dict(), f, indent=2, ensure_ascii=False)
+        data = nomina.to_dict_normalizado() if self.normalizado else nomina.to_dict()
+        checksum = self._escribir_json(archivo, data)
+        self._registrar_en_indice(nomina.aniomes, {
+            'id': nomina.id,
+            'empleados': len(nomina.detalles),
+            'tot_ing': nomina.tot_ing,
+            'tot_des': nomina.tot_des,
+            'neto': nomina.neto,
+            'departamentos': serializar_metricas_departamento(calcular_metricas_departamento(nomina.detalles))
+        }, checksum)
+    
+    def _escribir_json(self, archivo: str, data: Dict) -> str:
+        """
+        Escribe el archivo de forma atómica (archivo temporal + rename). El
+        temporal es propio del hilo: las consultas concurrentes pueden
+        reescribir el índice a la vez.
+        Returns: SHA-256 del contenido escrito
+        """
+        temporal = f"{archivo}.{threading.get_ident()}.tmp"
+        with open(temporal, 'w', encoding='utf-8', newline='\n') as f:
+            escritura = _EscrituraConChecksum(f)
+            json.dump(data, escritura, indent=2, ensure_ascii=False)
+        os.replace(temporal, archivo)
+        registrar_io(escritos=escritura.bytes)
+        return escritura.checksum()
     
+    @instrumentar
+    def guardar_streaming(self, id: int, aniomes: str,
+                          detalles: Iterable[DetalleNomina]) -> Dict:
+        """
+        Escribe la nómina detalle por detalle sin mantenerla en memoria.
+        Los totales se acumulan mientras se escribe y van al final del objeto,
+        así el archivo sigue siendo el mismo JSON que lee obtener().
+        En modo normalizado la tabla de empleados se arma durante la escritura
+        y se agrega después de los detalles.
+        Returns: Resumen con id, aniomes, empleados y totales
+        """
+        # Métricas por departamento para el índice, calculadas en la misma pasada
+        acumulador = AcumuladorEstadisticas(conservar_filas=False)
+        
+        if not self.normalizado:
+            def fragmentos():
+                for d in detalles:
+                    acumulador.agregar(d)
+                    yield d.tot_ing_centavos, d.tot_des_centavos, d.neto_centavos, serializar_detalle(d)
+            return self.guardar_fragmentos(id, aniomes, fragmentos(), acumulador=acumulador)
+        
+        tabla: List[Dict] = []
+        indices: Dict[tuple, int] = {}
+        
+        def fragmentos_normalizados():
+            for detalle in detalles:
+                acumulador.agregar(detalle)
+                emp_data = detalle.empleado.to_dict()
+                clave = tuple(emp_data.values())
+                if clave not in indices:
+                    indices[clave] = len(tabla)
+                    tabla.append(emp_data)
+                detalle_data = detalle.to_dict()
+                detalle_data['empleado'] = indices[clave]
+                yield (detalle.tot_ing_centavos, detalle.tot_des_centavos, detalle.neto_centavos,
+                       _serializar(detalle_data))
+        
+        return self.guardar_fragmentos(id, aniomes, fragmentos_normalizados(),
+                                       empleados=tabla, acumulador=acumulador)
+    
+    @instrumentar
+    def guardar_fragmentos(self, id: int, aniomes: str,
+                           fragmentos: Iterable[Tuple[int, int, int, str]],
+                           empleados: Optional[List[Dict]] = None,
+                           acumulador: Optional[AcumuladorEstadisticas] = None) -> Dict:
+        """
+        Igual que guardar_streaming, pero recibe los detalles ya serializados
+        con serializar_detalle como tuplas (tot_ing, tot_des, neto, texto), con
+        los montos en centavos para que los totales sean exactos.
+        empleados: tabla del formato normalizado; se escribe después de los
+        detalles, así puede llenarse mientras se consumen los fragmentos.
+        acumulador: alimentado con los mismos detalles; sus métricas por
+        departamento se guardan en el índice (si falta, se calculan la primera
+        vez que se piden).
+        Returns: Resumen con id, aniomes, empleados y totales
+        """
+        archivo = f"{self.directorio}nomina_{aniomes}.json"
+        temporal = f"{archivo}.tmp"
+        cantidad = 0
+        tot_ing = tot_des = neto = 0
+        
+        with open(temporal, 'w', encoding='utf-8', newline='\n') as archivo_temporal:
+            f = _EscrituraConChecksum(archivo_temporal)
+            f.write('{\n')
+            f.write(f'  "id": {json.dumps(id)},\n')
+            f.write(f'  "aniomes": {json.dumps(aniomes, ensure_ascii=False)},\n')
+            if empleados is not None:
+                f.write(f'  "formato": "{Nomina.FORMATO_NORMALIZADO}",\n')
+            f.write('  "detalles": [')
+            for ingresos, descuentos, neto_detalle, texto in fragmentos:
+                f.write(',\n    ' if cantidad else '\n    ')
+                f.write(texto)
+                cantidad += 1
+                tot_ing += ingresos
+                tot_des += descuentos
+                neto += neto_detalle
+            f.write('\n  ],\n' if cantidad else '],\n')
+            if empleados is not None:
+                tabla = json.dumps(empleados, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+                f.write(f'  "empleados": {tabla},\n')
+            f.write(f'  "tot_ing": {json.dumps(a_monto(tot_ing))},\n')
+            f.write(f'  "tot_des": {json.dumps(a_monto(tot_des))},\n')
+            f.write(f'  "neto": {json.dumps(a_monto(neto))}\n')
+            f.write('}')
+        os.replace(temporal, archivo)
+        registrar_io(escritos=f.bytes)
+        
+        resumen = {
+            'id': id,
+            'aniomes': aniomes,
+            'empleados': cantidad,
+            'tot_ing': a_monto(tot_ing),
+            'tot_des': a_monto(tot_des),
+            'neto': a_monto(neto)
+        }
+        entrada = dict(resumen)
+        if acumulador is not None:
+            entrada['departamentos'] = serializar_metricas_departamento(acumulador.departamentos())
+        self._registrar_en_indice(aniomes, entrada, f.checksum())
+        return resumen
+    
+    @instrumentar
     def obtener(self, aniomes: str) -> Optional[Nomina]:
         """
         Obtiene una nómina por año-mes con todos sus detalles
@@ -40,71 +251,291 @@ class RepositorioNominasJSON:
                 return None
                 
             with open(archivo, 'r', encoding='utf-8') as f:
+                registrar_io(leidos=os.fstat(f.fileno()).st_size)
                 data = json.load(f)
                 
                 # Reconstruir la nómina completa
-                nomina = Nomina(data['id'], data['aniomes'])
-                nomina.tot_ing = data['tot_ing']
-                nomina.tot_des = data['tot_des']
-                nomina.neto = data['neto']
+                nomina = Nomina(data['id'], data['aniomes'], columnar=self.columnar)
+                
+                # Formato normalizado: un solo Empleado por fila de la tabla,
+                # compartido por todos los detalles que lo referencian
+                tabla = [Empleado.from_dict(emp_data) for emp_data in data.get('empleados', [])]
                 
                 # Reconstruir los detalles de la nómina
                 for detalle_data in data['detalles']:
                     try:
-                        # Reconstruir el empleado
-                        emp_data = detalle_data['empleado']
-                        empleado = Empleado(
-                            emp_data['cedula'],
-                            emp_data['nombre'],
-                            emp_data['sueldo'],
-                            emp_data['departamento'],
-                            emp_data['cargo']
-                        )
-                        
-                        # Reconstruir el detalle
-                        detalle = DetalleNomina(
-                            detalle_data['id'],
-                            empleado,
-                            detalle_data['sueldo'],
-                            detalle_data['bono'],
-                            detalle_data['prestamo']
-                        )
+                        # Reconstruir el empleado y el detalle
+                        empleado = _empleado_de_detalle(detalle_data, tabla)
+                        detalle = DetalleNomina.from_dict(detalle_data, empleado)
                         
                         # Agregar el detalle a la nómina
                         nomina.agregar_detalle(detalle)
                         
-                    except KeyError as e:
-                        print(f"❌ Error en estructura de detalle: {e}")
+                    except _ERRORES_DETALLE as e:
+                        print(f"❌ Error en estructura de detalle: {type(e).__name__}: {e}")
                         continue
-                        
-                print(f"✅ Nómina {aniomes} cargada con {len(nomina.detalles)} empleados")
+                
+                # Sin detalles se conservan los totales guardados en el archivo
+                if not nomina.detalles:
+                    nomina.tot_ing = data['tot_ing']
+                    nomina.tot_des = data['tot_des']
+                    nomina.neto = data['neto']
+                
                 return nomina
                 
         except FileNotFoundError:
             print(f"❌ Nómina {aniomes} no encontrada")
             return None
         except json.JSONDecodeError:
+            registrar_error()
             print(f"❌ Error decodificando JSON de nómina {aniomes}")
             return None
         except Exception as e:
+            registrar_error()
             print(f"❌ Error inesperado cargando nómina {aniomes}: {e}")
             return None
     
-    def listar_nominas(self) -> List[str]:
+    def iterar_detalles(self, aniomes: str) -> Iterator[DetalleNomina]:
         """
-        Lista todas las nóminas disponibles
-        Returns: Lista de strings aniomes (YYYYMM)
+        Recorre los detalles leyendo el archivo de forma incremental, con
+        memoria constante sin importar su tamaño. Acepta los tres formatos:
+        empleado embebido, solo el nombre (antiguo) o referencia a la tabla
+        de empleados (normalizado; si la tabla va después de los detalles se
+        lee antes con una pasada adicional).
         """
-        if not os.path.exists(self.directorio):
-            return []
+        archivo = f"{self.directorio}nomina_{aniomes}.json"
+        if not os.path.exists(archivo):
+            print(f"⚠️ Archivo no encontrado: {archivo}")
+            return
         
-        nominas = []
-        for archivo in os.listdir(self.directorio):
-            if archivo.startswith("nomina_") and archivo.endswith(".json"):
-                aniomes = archivo.replace("nomina_", "").replace(".json", "")
-                nominas.append(aniomes)
+        # Generador: no pasa por instrumentar, la E/S se anota con su nombre
+        registrar_io(leidos=os.path.getsize(archivo), operacion='RepositorioNominasJSON.iterar_detalles')
+        lector = LectorNominaJSON(archivo)
+        tabla: Optional[List[Empleado]] = None
+        try:
+            for detalle_data in lector.detalles():
+                if tabla is None and isinstance(detalle_data, dict) and isinstance(detalle_data.get('empleado'), int):
+                    datos_tabla = lector.cabecera.pop('empleados', None)
+                    if datos_tabla is None:
+                        datos_tabla = LectorNominaJSON(archivo).leer_cabecera().get('empleados', [])
+                    tabla = [Empleado.from_dict(emp_data) for emp_data in datos_tabla]
+                try:
+                    empleado = _empleado_de_detalle(detalle_data, tabla or [])
+                    detalle = DetalleNomina.from_dict(detalle_data, empleado)
+                except _ERRORES_DETALLE as e:
+                    # Se informa y se sigue: un registro malo no corta el recorrido
+                    print(f"❌ Error en estructura de detalle: {type(e).__name__}: {e}")
+                    continue
+                yield detalle
+        except ValueError:
+            print(f"❌ Error decodificando JSON de nómina {aniomes}")
+    
+    @instrumentar
+    def convertir_a_normalizado(self, aniomes: Optional[str] = None) -> List[str]:
+        """
+        Reescribe archivos existentes al formato normalizado conservando sus
+        montos y totales tal como están guardados.
+        aniomes: período a convertir (por defecto todos)
+        Returns: Lista de períodos convertidos
+        """
+        periodos = [aniomes] if aniomes else self.listar_nominas()
+        convertidos = []
+        for periodo in periodos:
+            archivo = f"{self.directorio}nomina_{periodo}.json"
+            try:
+                with open(archivo, 'r', encoding='utf-8') as f:
+                    registrar_io(leidos=os.fstat(f.fileno()).st_size)
+                    data = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError) as e:
+                print(f"⚠️ No se pudo convertir la nómina {periodo}: {e}")
+                continue
+            
+            if data.get('formato') == Nomina.FORMATO_NORMALIZADO:
+                continue
+            
+            tabla = []
+            indices = {}
+            for detalle_data in data['detalles']:
+                emp_data = detalle_data['empleado']
+                if isinstance(emp_data, str):
+                    emp_data = _empleado_legado(emp_data, detalle_data)
+                clave = tuple(emp_data.values())
+                if clave not in indices:
+                    indices[clave] = len(tabla)
+                    tabla.append(emp_data)
+                detalle_data['empleado'] = indices[clave]
+            
+            data['formato'] = Nomina.FORMATO_NORMALIZADO
+            data['empleados'] = tabla
+            checksum = self._escribir_json(archivo, data)
+            entrada = self._leer_indice().get(periodo)
+            if entrada:
+                self._registrar_en_indice(periodo, entrada, checksum)
+            convertidos.append(periodo)
         
-        return sorted(nominas)
+        return convertidos
+    
+    def firma(self, aniomes: str) -> Optional[Tuple]:
+        """
+        Fecha de modificación y tamaño del archivo del período (() si no existe)
+        """
+        try:
+            estado = os.stat(f"{self.directorio}nomina_{aniomes}.json")
+        except FileNotFoundError:
+            return ()
+        return (estado.st_mtime_ns, estado.st_size)
+    
+    # --- ÍNDICE DE RESÚMENES ---
+    def _ruta_indice(self) -> str:
+        return f"{self.directorio}{self.ARCHIVO_INDICE}"
+    
+    def _estados_en_directorio(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Tamaño y fecha de modificación de cada nomina_YYYYMM.json del
+        directorio (un listdir y un stat por archivo, sin abrirlos)
+        """
+        if not os.path.exists(self.directorio):
+            return {}
+        estados = {}
+        with os.scandir(self.directorio) as entradas:
+            for entrada in entradas:
+                coincidencia = _PATRON_ARCHIVO.match(entrada.name)
+                if coincidencia:
+                    estado = entrada.stat()
+                    estados[coincidencia.group(1)] = (estado.st_size, estado.st_mtime)
+        return estados
+    
+    def _leer_indice(self, sincronizar: bool = True) -> Dict[str, Dict]:
+        """
+        Lee el índice de resúmenes; si no existe o está dañado lo reconstruye.
+        Con sincronizar=True compara el directorio con el índice: resume los
+        períodos nuevos o cuyo tamaño o fecha cambió (copiados o reemplazados
+        a mano) y quita los borrados.
+        Returns: Diccionario aniomes -> resumen
+        """
+        try:
+            with open(self._ruta_indice(), 'r', encoding='utf-8') as f:
+                registrar_io(leidos=os.fstat(f.fileno()).st_size)
+                entradas = json.load(f)['nominas']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return self.reconstruir_indice()
+        if sincronizar:
+            estados = self._estados_en_directorio()
+            cambios = False
+            for aniomes in entradas.keys() - estados.keys():
+                del entradas[aniomes]
+                cambios = True
+            for aniomes, estado in estados.items():
+                entrada = entradas.get(aniomes)
+                if entrada is None or (entrada.get('tamano'), entrada.get('mtime')) != estado:
+                    entradas[aniomes] = self._resumir_archivo(aniomes)
+                    cambios = True
+            if cambios:
+                self._escribir_indice(entradas)
+        return entradas
+    
+    def _escribir_indice(self, entradas: Dict[str, Dict]) -> None:
+        """
+        Escribe el índice de forma atómica, ordenado por período
+        """
+        self._escribir_json(self._ruta_indice(), {
+            'version': 1,
+            'nominas': {aniomes: entradas[aniomes] for aniomes in sorted(entradas)}
+        })
+    
+    def _entrada_indice(self, aniomes: str, resumen: Dict, checksum: str) -> Dict:
+        estado = os.stat(f"{self.directorio}nomina_{aniomes}.json")
+        entrada = {
+            'id': resumen['id'],
+            'aniomes': aniomes,
+            'empleados': resumen['empleados'],
+            'tot_ing': resumen['tot_ing'],
+            'tot_des': resumen['tot_des'],
+            'neto': resumen['neto'],
+            'tamano': estado.st_size,
+            'checksum': checksum,
+            'mtime': estado.st_mtime,
+            'valida': resumen.get('valida', True)
+        }
+        if 'departamentos' in resumen:
+            entrada['departamentos'] = resumen['departamentos']
+        return entrada
+    
+    def _registrar_en_indice(self, aniomes: str, resumen: Dict, checksum: str) -> None:
+        """
+        Agrega o reemplaza el resumen de un período en el índice
+        """
+        # Sin sincronizar: el archivo del período ya existe y se registra aquí
+        entradas = self._leer_indice(sincronizar=False)
+        entradas[aniomes] = self._entrada_indice(aniomes, resumen, checksum)
+        self._escribir_indice(entradas)
+    
+    def _resumir_archivo(self, aniomes: str) -> Dict:
+        """
+        Carga un período completo y arma su entrada de índice
+        """
+        archivo = f"{self.directorio}nomina_{aniomes}.json"
+        nomina = self.obtener(aniomes)
+        if nomina is None:
+            # Archivo ilegible: se lista igual, pero no suma en los totales
+            resumen = {'id': None, 'empleados': 0, 'tot_ing': 0.0, 'tot_des': 0.0,
+                       'neto': 0.0, 'valida': False}
+        else:
+            resumen = {'id': nomina.id, 'empleados': len(nomina.detalles), 'tot_ing': nomina.tot_ing,
+                       'tot_des': nomina.tot_des, 'neto': nomina.neto,
+                       'departamentos': serializar_metricas_departamento(
+                           calcular_metricas_departamento(nomina.detalles))}
+        return self._entrada_indice(aniomes, resumen, _checksum_archivo(archivo))
+    
+    @instrumentar
+    def reconstruir_indice(self) -> Dict[str, Dict]:
+        """
+        Reconstruye el índice desde cero leyendo todos los archivos de nómina
+        Returns: Diccionario aniomes -> resumen
+        """
+        entradas = {aniomes: self._resumir_archivo(aniomes) for aniomes in self._estados_en_directorio()}
+        self._escribir_indice(entradas)
+        return entradas
+    
+    @instrumentar
+    def obtener_resumenes(self, verificar: bool = False) -> List[Dict]:
+        """
+        Resúmenes de todos los períodos desde el índice, sin abrir los archivos.
+        El índice ya se compara con el tamaño y la fecha de cada archivo al
+        leerlo; verificar se mantiene por compatibilidad.
+        Returns: Lista de resúmenes ordenada por aniomes
+        """
+        entradas = self._leer_indice()
+        return [entradas[aniomes] for aniomes in sorted(entradas)]
+    
+    @instrumentar
+    def obtener_departamentos(self, aniomes: str) -> Optional[Dict[str, Dict]]:
+        """
+        Métricas por departamento guardadas en el índice al generar el período.
+        Si la entrada no las tiene (nómina guardada por fragmentos sin
+        acumulador) se calculan una vez y se agregan al índice.
+        Returns: Diccionario departamento -> métricas, o None si no existe
+        """
+        entradas = self._leer_indice()
+        entrada = entradas.get(aniomes)
+        if entrada is None or not entrada.get('valida', True):
+            return None
+        if 'departamentos' not in entrada:
+            nomina = self.obtener(aniomes)
+            if nomina is None:
+                return None
+            entrada['departamentos'] = serializar_metricas_departamento(
+                calcular_metricas_departamento(nomina.detalles))
+            self._escribir_indice(entradas)
+        return entrada['departamentos']
+    
+    @instrumentar
+    def listar_nominas(self) -> List[str]:
+        """
+        Lista todas las nóminas disponibles (desde el índice)
+        Returns: Lista de strings aniomes (YYYYMM)
+        """
+        return sorted(self._leer_indice())
     
     def verificar_nomina(self, aniomes: str) -> bool:
         """
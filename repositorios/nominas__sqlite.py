@@ -0,0 +1,290 @@
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from modelos.nomina import Nomina
+from modelos.detalle_nomina import DetalleNomina
+from modelos.empleado import Empleado
+from repositorios.base import RepositorioNominas
+from repositorios.conexion_sqlite import conectar
+from utils.dinero import a_centavos, a_monto
+from utils.series import validar_columnas
+
+# Todos los montos se guardan en centavos enteros (columnas *_centavos):
+# las sumas de SQLite sobre INTEGER son exactas
+_CREAR_TABLAS = """
+    CREATE TABLE IF NOT EXISTS nominas (
+        aniomes TEXT PRIMARY KEY,
+        id INTEGER NOT NULL,
+        tot_ing_centavos INTEGER NOT NULL,
+        tot_des_centavos INTEGER NOT NULL,
+        neto_centavos INTEGER NOT NULL,
+        departamentos_listos INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS detalles_nomina (
+        aniomes TEXT NOT NULL REFERENCES nominas (aniomes) ON DELETE CASCADE,
+        id INTEGER NOT NULL,
+        cedula TEXT NOT NULL,
+        nombre TEXT NOT NULL,
+        sueldo_empleado_centavos INTEGER NOT NULL,
+        departamento TEXT NOT NULL,
+        cargo TEXT NOT NULL,
+        sueldo_centavos INTEGER NOT NULL,
+        bono_centavos INTEGER NOT NULL,
+        tot_ing_centavos INTEGER NOT NULL,
+        iess_centavos INTEGER NOT NULL,
+        prestamo_centavos INTEGER NOT NULL,
+        tot_des_centavos INTEGER NOT NULL,
+        neto_centavos INTEGER NOT NULL,
+        PRIMARY KEY (aniomes, id)
+    );
+    CREATE INDEX IF NOT EXISTS idx_detalles_aniomes_cedula ON detalles_nomina (aniomes, cedula);
+    CREATE INDEX IF NOT EXISTS idx_detalles_departamento_aniomes ON detalles_nomina (departamento, aniomes);
+    CREATE TABLE IF NOT EXISTS departamentos_nomina (
+        aniomes TEXT NOT NULL REFERENCES nominas (aniomes) ON DELETE CASCADE,
+        departamento TEXT NOT NULL,
+        orden INTEGER NOT NULL,
+        empleados INTEGER NOT NULL,
+        total_neto_centavos INTEGER NOT NULL,
+        total_iess_centavos INTEGER NOT NULL,
+        total_bonos_centavos INTEGER NOT NULL,
+        id_mayor_neto INTEGER NOT NULL,
+        PRIMARY KEY (aniomes, departamento)
+    );
+"""
+_GUARDAR_NOMINA = """
+    INSERT INTO nominas (aniomes, id, tot_ing_centavos, tot_des_centavos, neto_centavos)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (aniomes) DO UPDATE SET
+        id = excluded.id,
+        tot_ing_centavos = excluded.tot_ing_centavos,
+        tot_des_centavos = excluded.tot_des_centavos,
+        neto_centavos = excluded.neto_centavos
+"""
+_BORRAR_DETALLES = "DELETE FROM detalles_nomina WHERE aniomes = ?"
+_INSERTAR_DETALLE = """
+    INSERT INTO detalles_nomina (aniomes, id, cedula, nombre, sueldo_empleado_centavos, departamento,
+                                 cargo, sueldo_centavos, bono_centavos, tot_ing_centavos, iess_centavos,
+                                 prestamo_centavos, tot_des_centavos, neto_centavos)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_OBTENER_NOMINA = "SELECT id, tot_ing_centavos, tot_des_centavos, neto_centavos FROM nominas WHERE aniomes = ?"
+_COLUMNAS_DETALLE = ("id, cedula, nombre, sueldo_empleado_centavos, departamento, cargo, "
+                     "sueldo_centavos, bono_centavos, prestamo_centavos, iess_centavos")
+_OBTENER_DETALLES = f"SELECT {_COLUMNAS_DETALLE} FROM detalles_nomina WHERE aniomes = ? ORDER BY id"
+_OBTENER_DETALLE = f"SELECT {_COLUMNAS_DETALLE} FROM detalles_nomina WHERE aniomes = ? AND cedula = ?"
+_LISTAR = "SELECT aniomes FROM nominas ORDER BY aniomes"
+_BORRAR_DEPARTAMENTOS = "DELETE FROM departamentos_nomina WHERE aniomes = ?"
+# departamentos_listos marca el período como materializado aunque no tenga filas
+_MARCAR_DEPARTAMENTOS = "UPDATE nominas SET departamentos_listos = 1 WHERE aniomes = ?"
+_DEPARTAMENTOS_LISTOS = "SELECT departamentos_listos FROM nominas WHERE aniomes = ?"
+
+# orden = primer detalle del departamento; el mayor neto es el primero por id en caso de empate
+_MATERIALIZAR_DEPARTAMENTOS = """
+    INSERT INTO departamentos_nomina (aniomes, departamento, orden, empleados, total_neto_centavos,
+                                      total_iess_centavos, total_bonos_centavos, id_mayor_neto)
+    SELECT d.aniomes, d.departamento, MIN(d.id), COUNT(*),
+           SUM(d.neto_centavos), SUM(d.iess_centavos), SUM(d.bono_centavos),
+           (SELECT m.id FROM detalles_nomina m
+            WHERE m.aniomes = d.aniomes AND m.departamento = d.departamento
+            ORDER BY m.neto_centavos DESC, m.id LIMIT 1)
+    FROM detalles_nomina d WHERE d.aniomes = ? GROUP BY d.departamento
+"""
+_OBTENER_DEPARTAMENTOS = f"""
+    SELECT dn.departamento, dn.empleados, dn.total_neto_centavos, dn.total_iess_centavos,
+           dn.total_bonos_centavos, {', '.join('d.' + columna for columna in _COLUMNAS_DETALLE.split(', '))}
+    FROM departamentos_nomina dn
+    JOIN detalles_nomina d ON d.aniomes = dn.aniomes AND d.id = dn.id_mayor_neto
+    WHERE dn.aniomes = ? ORDER BY dn.orden
+"""
+_RESUMENES = """
+    SELECT n.id, n.aniomes, COUNT(d.id), n.tot_ing_centavos, n.tot_des_centavos, n.neto_centavos
+    FROM nominas n LEFT JOIN detalles_nomina d ON d.aniomes = n.aniomes
+    GROUP BY n.aniomes ORDER BY n.aniomes
+"""
+
+def _fila(aniomes: str, detalle: DetalleNomina) -> tuple:
+    empleado = detalle.empleado
+    return (aniomes, detalle.id, empleado.cedula, empleado.nombre, a_centavos(empleado.sueldo),
+            empleado.departamento, empleado.cargo, detalle.sueldo_centavos, detalle.bono_centavos,
+            detalle.tot_ing_centavos, detalle.iess_centavos, detalle.prestamo_centavos,
+            detalle.tot_des_centavos, detalle.neto_centavos)
+
+def _detalle(fila: tuple) -> DetalleNomina:
+    id, cedula, nombre, sueldo_empleado, departamento, cargo, sueldo, bono, prestamo, iess = fila
+    empleado = Empleado(cedula, nombre, a_monto(sueldo_empleado), departamento, cargo)
+    # Se conserva el IESS guardado (no se recalcula un período ya emitido)
+    return DetalleNomina.desde_centavos(id, empleado, sueldo, bono, prestamo, iess)
+
+class RepositorioNominasSQLite(RepositorioNominas):
+    """
+    Repositorio de nóminas sobre SQLite: una fila por nómina y una por detalle,
+    con índice por (aniomes, cedula) para consultas entre períodos
+    """
+    
+    def __init__(self, archivo_db: str = "archivos/nominas.db", columnar: bool = False):
+        self.archivo_db = archivo_db
+        self.columnar = columnar
+        self._conexion = conectar(archivo_db)
+        # Serializa la materialización diferida, que ocurre durante una consulta
+        self._bloqueo = threading.Lock()
+        with self._conexion:
+            self._conexion.executescript(_CREAR_TABLAS)
+    
+    def guardar(self, nomina: Nomina) -> None:
+        """
+        Guarda o reemplaza la nómina y sus detalles en una sola transacción
+        """
+        with self._conexion:
+            self._conexion.execute(_GUARDAR_NOMINA, (nomina.aniomes, nomina.id, nomina.tot_ing_centavos,
+                                                     nomina.tot_des_centavos, nomina.neto_centavos))
+            self._conexion.execute(_BORRAR_DETALLES, (nomina.aniomes,))
+            self._conexion.executemany(_INSERTAR_DETALLE,
+                                       (_fila(nomina.aniomes, detalle) for detalle in nomina.detalles))
+            self._materializar_departamentos(nomina.aniomes)
+    
+    def guardar_streaming(self, id: int, aniomes: str,
+                          detalles: Iterable[DetalleNomina]) -> Dict:
+        """
+        Inserta los detalles a medida que llegan (executemany sobre un generador)
+        y actualiza los totales al final, todo en una sola transacción
+        Returns: Resumen con id, aniomes, empleados y totales
+        """
+        resumen = {'id': id, 'aniomes': aniomes, 'empleados': 0}
+        # Totales en centavos mientras se insertan los detalles
+        totales = [0, 0, 0]
+        
+        def filas():
+            for detalle in detalles:
+                resumen['empleados'] += 1
+                totales[0] += detalle.tot_ing_centavos
+                totales[1] += detalle.tot_des_centavos
+                totales[2] += detalle.neto_centavos
+                yield _fila(aniomes, detalle)
+        
+        with self._conexion:
+            self._conexion.execute(_GUARDAR_NOMINA, (aniomes, id, 0, 0, 0))
+            self._conexion.execute(_BORRAR_DETALLES, (aniomes,))
+            self._conexion.executemany(_INSERTAR_DETALLE, filas())
+            resumen['tot_ing'], resumen['tot_des'], resumen['neto'] = map(a_monto, totales)
+            self._conexion.execute(_GUARDAR_NOMINA, (aniomes, id, *totales))
+            self._materializar_departamentos(aniomes)
+        return resumen
+    
+    def _materializar_departamentos(self, aniomes: str) -> None:
+        """
+        Recalcula las métricas por departamento del período (dentro de la transacción del guardado)
+        """
+        self._conexion.execute(_BORRAR_DEPARTAMENTOS, (aniomes,))
+        self._conexion.execute(_MATERIALIZAR_DEPARTAMENTOS, (aniomes,))
+        self._conexion.execute(_MARCAR_DEPARTAMENTOS, (aniomes,))
+    
+    def obtener(self, aniomes: str) -> Optional[Nomina]:
+        """
+        Obtiene una nómina por año-mes con todos sus detalles
+        Returns: Nomina completa o None si no existe
+        """
+        fila = self._conexion.execute(_OBTENER_NOMINA, (aniomes,)).fetchone()
+        if fila is None:
+            print(f"⚠️ Nómina no encontrada: {aniomes}")
+            return None
+        
+        id, tot_ing, tot_des, neto = fila
+        nomina = Nomina(id, aniomes, columnar=self.columnar)
+        for fila_detalle in self._conexion.execute(_OBTENER_DETALLES, (aniomes,)):
+            nomina.agregar_detalle(_detalle(fila_detalle))
+        
+        # Sin detalles se conservan los totales guardados
+        if not nomina.detalles:
+            nomina.tot_ing_centavos, nomina.tot_des_centavos, nomina.neto_centavos = tot_ing, tot_des, neto
+        return nomina
+    
+    def iterar_detalles(self, aniomes: str) -> Iterator[DetalleNomina]:
+        """
+        Recorre los detalles del período directamente desde el cursor
+        """
+        return (_detalle(fila) for fila in self._conexion.execute(_OBTENER_DETALLES, (aniomes,)))
+    
+    def obtener_detalle(self, aniomes: str, cedula: str) -> Optional[DetalleNomina]:
+        """
+        Obtiene el detalle de un empleado en un período usando el índice (aniomes, cedula)
+        """
+        fila = self._conexion.execute(_OBTENER_DETALLE, (aniomes, cedula)).fetchone()
+        return _detalle(fila) if fila else None
+    
+    def obtener_departamentos(self, aniomes: str) -> Optional[Dict[str, Dict]]:
+        """
+        Métricas por departamento guardadas en departamentos_nomina; los
+        períodos guardados antes de existir la tabla se materializan una vez
+        Returns: Diccionario departamento -> métricas, o None si no existe
+        """
+        fila = self._conexion.execute(_DEPARTAMENTOS_LISTOS, (aniomes,)).fetchone()
+        if fila is None:
+            return None
+        if not fila[0]:
+            with self._bloqueo, self._conexion:
+                self._materializar_departamentos(aniomes)
+        filas = self._conexion.execute(_OBTENER_DEPARTAMENTOS, (aniomes,)).fetchall()
+        
+        departamentos = {}
+        for departamento, empleados, total_neto, total_iess, total_bonos, *detalle in filas:
+            departamentos[departamento] = {
+                'empleados': empleados,
+                'total_neto': a_monto(total_neto),
+                'promedio_neto': a_monto(total_neto) / empleados,
+                'total_iess': a_monto(total_iess),
+                'total_bonos': a_monto(total_bonos),
+                'empleado_mayor_neto': _detalle(tuple(detalle)).to_dict()
+            }
+        return departamentos
+    
+    def listar_nominas(self) -> List[str]:
+        """
+        Lista todas las nóminas disponibles
+        Returns: Lista de strings aniomes (YYYYMM)
+        """
+        return [aniomes for (aniomes,) in self._conexion.execute(_LISTAR)]
+    
+    def sumar_por_periodo(self, periodos: Sequence[str], columnas: Sequence[str],
+                          cedula: Optional[str] = None, departamento: Optional[str] = None,
+                          workers: Optional[int] = None) -> Dict[str, Tuple[float, ...]]:
+        """
+        Sumas por período con una sola consulta agrupada que lee solo las
+        columnas pedidas (workers no aplica: la base hace todo el trabajo)
+        Returns: Diccionario aniomes -> sumas (sin los períodos inexistentes)
+        """
+        validar_columnas(columnas)
+        existentes = set(self.listar_nominas())
+        resultado = {aniomes: (0.0,) * len(columnas) for aniomes in periodos if aniomes in existentes}
+        if not resultado:
+            return resultado
+        
+        condiciones, parametros = ["aniomes BETWEEN ? AND ?"], [min(resultado), max(resultado)]
+        if cedula is not None:
+            condiciones.append("cedula = ?")
+            parametros.append(cedula)
+        if departamento is not None:
+            condiciones.append("departamento = ?")
+            parametros.append(departamento)
+        consulta = (f"SELECT aniomes, {', '.join(f'SUM({columna}_centavos)' for columna in columnas)} "
+                    f"FROM detalles_nomina WHERE {' AND '.join(condiciones)} GROUP BY aniomes")
+        for aniomes, *sumas in self._conexion.execute(consulta, parametros):
+            if aniomes in resultado:
+                resultado[aniomes] = tuple(map(a_monto, sumas))
+        return resultado
+    
+    def firma(self, aniomes: str) -> Optional[Tuple]:
+        """
+        Versión de la base: cambia cuando otra conexión confirma cambios
+        (los de esta conexión pasan por guardar)
+        """
+        return self._conexion.execute("PRAGMA data_version").fetchone()
+    
+    def obtener_resumenes(self, verificar: bool = False) -> List[Dict]:
+        """
+        Resúmenes de todos los períodos con una sola consulta
+        Returns: Lista de resúmenes ordenada por aniomes
+        """
+        return [
+            {'id': id, 'aniomes': aniomes, 'empleados': empleados,
+             'tot_ing': a_monto(tot_ing), 'tot_des': a_monto(tot_des), 'neto': a_monto(neto)}
+            for id, aniomes, empleados, tot_ing, tot_des, neto in self._conexion.execute(_RESUMENES)
+        ]
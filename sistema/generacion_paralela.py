@@ -0,0 +1,59 @@
+from typing import Dict, Iterable, List, Tuple
+
+from modelos import Empleado, DetalleNomina
+from repositorios.nominas__json import serializar_detalle
+from utils.dinero import a_monto
+
+# Un shard es una lista de (id del detalle, datos del empleado); el id es la
+# posición global del empleado, así el resultado no depende del reparto
+Shard = List[Tuple[int, dict]]
+
+def repartir_por_departamento(empleados: Iterable[Empleado]) -> List[Shard]:
+    """
+    Agrupa los empleados por departamento, numerándolos en el orden original
+    """
+    shards: Dict[str, Shard] = {}
+    for i, empleado in enumerate(empleados, 1):
+        shards.setdefault(empleado.departamento, []).append((i, empleado.to_dict()))
+    return list(shards.values())
+
+def repartir_en_bloques(empleados: Iterable[Empleado], tamano_bloque: int) -> List[Shard]:
+    """
+    Divide los empleados en bloques consecutivos de tamaño fijo
+    """
+    shards: List[Shard] = []
+    for i, empleado in enumerate(empleados, 1):
+        if (i - 1) % tamano_bloque == 0:
+            shards.append([])
+        shards[-1].append((i, empleado.to_dict()))
+    return shards
+
+def procesar_shard(shard: Shard, bono: float, prestamo: float,
+                   serializar: bool) -> Tuple[List[tuple], Dict]:
+    """
+    Calcula (en un proceso aparte) los detalles de un shard y sus totales parciales.
+    Con serializar=True cada fila es (id, tot_ing, tot_des, neto, texto JSON),
+    con los montos en centavos;
+    si no, (id, DetalleNomina).
+    Returns: (filas ordenadas por id, totales parciales del shard)
+    """
+    filas = []
+    ingresos = descuentos = netos = 0
+    for id, emp_data in shard:
+        detalle = DetalleNomina(id, Empleado.from_dict(emp_data), emp_data['sueldo'], bono, prestamo)
+        if serializar:
+            filas.append((id, detalle.tot_ing_centavos, detalle.tot_des_centavos,
+                          detalle.neto_centavos, serializar_detalle(detalle)))
+        else:
+            filas.append((id, detalle))
+        ingresos += detalle.tot_ing_centavos
+        descuentos += detalle.tot_des_centavos
+        netos += detalle.neto_centavos
+
+    parcial = {
+        'empleados': len(filas),
+        'tot_ing': a_monto(ingresos),
+        'tot_des': a_monto(descuentos),
+        'neto': a_monto(netos)
+    }
+    return filas, parcial
@@ -1,26 +1,139 @@
-from typing import List, Dict, Optional
-from functools import reduce
+from typing import List, Dict, Optional, Iterable, Iterator, Sequence, Tuple
+from array import array
+from functools import cached_property, reduce
+from itertools import chain, islice, repeat
+import csv
+import heapq
+import json
+import os
+import time
 
-from modelos import Empleado, Nomina, DetalleNomina
-from repositorios import RepositorioEmpleadosJSON, RepositorioNominasJSON
+from modelos import Empleado, Nomina, DetalleNomina, DetallesColumnares
+from repositorios import RepositorioNominasCache
+from utils.dinero import a_centavos, a_monto
+from utils.series import COLUMNAS_SERIE, acumulado_anual, validar_columnas, variaciones
 from utils import (
     log_operacion, 
     manejar_errores,
+    instrumentar,
     calcular_total_neto,
     generar_estadisticas_avanzadas,
-    calcular_metricas_departamento
+    deserializar_metricas_departamento,
+    ESQUEMA_EMPLEADO,
+    acumular_estadisticas,
+    AcumuladorEstadisticas
 )
 
+# Columnas esperadas en los archivos de importación de empleados
+CAMPOS_EMPLEADO = ('cedula', 'nombre', 'sueldo', 'departamento', 'cargo')
+
+def _filas_csv(archivo) -> Iterator[Tuple[int, Optional[dict]]]:
+    """
+    Recorre un CSV con encabezado y devuelve (número de línea, fila)
+    """
+    lector = csv.DictReader(archivo)
+    for fila in lector:
+        yield lector.line_num, fila
+
+def _filas_jsonl(archivo) -> Iterator[Tuple[int, Optional[dict]]]:
+    """
+    Recorre un archivo JSONL y devuelve (número de línea, objeto); None si la línea no es JSON válido
+    """
+    for linea, texto in enumerate(archivo, 1):
+        if not texto.strip():
+            continue
+        try:
+            yield linea, json.loads(texto)
+        except json.JSONDecodeError:
+            yield linea, None
+
+def _normalizar_fila(fila: Optional[dict]) -> Optional[dict]:
+    """
+    Deja solo los campos del empleado, sin espacios a los extremos y con el
+    sueldo convertido a número cuando es posible (None si la fila no es un objeto)
+    """
+    if not isinstance(fila, dict):
+        return None
+    
+    datos = {campo: fila.get(campo) for campo in CAMPOS_EMPLEADO}
+    for campo, valor in datos.items():
+        if isinstance(valor, str):
+            datos[campo] = valor.strip()
+    
+    if isinstance(datos['sueldo'], str):
+        try:
+            datos['sueldo'] = float(datos['sueldo'])
+        except ValueError:
+            pass  # La regla de sueldo reporta el error
+    return datos
+
 class SistemaNominas:
     """
     Sistema principal que coordina todas las operaciones de nómina
     Usa lambdas, map, filter, reduce y comprehensions para cumplir con los requisitos
     """
     
-    def __init__(self):
-        self.repo_empleados = RepositorioEmpleadosJSON()
-        self.repo_nominas = RepositorioNominasJSON()
+    # Backends de persistencia disponibles
+    BACKENDS = ('json', 'sqlite', 'binario')
     
+    def __init__(self, columnar: bool = False, backend: str = "json",
+                 archivo_db: Optional[str] = None, normalizado: bool = False,
+                 cache_nominas: int = 8, cache_bytes: Optional[int] = None,
+                 directorio: str = "archivos", journal: bool = False):
+        """
+        backend='json' usa los archivos JSON de 'directorio' (archivos/).
+        backend='sqlite' usa la base SQLite indicada en archivo_db
+        (por defecto nominas.db dentro de 'directorio').
+        backend='binario' guarda las nóminas en formato binario columnar
+        (los empleados siguen en JSON).
+        normalizado=True guarda las nóminas JSON con tabla de empleados.
+        cache_nominas/cache_bytes limitan la caché LRU de nóminas cargadas
+        (cache_nominas=0 la desactiva).
+        journal=True guarda cada cambio de empleados como una línea del
+        journal en lugar de reescribir empleados.json (backends json y binario).
+        """
+        archivo_empleados = os.path.join(directorio, "empleados.json")
+        directorio_nominas = os.path.join(directorio, "nominas") + os.sep
+        archivo_db = archivo_db or os.path.join(directorio, "nominas.db")
+        
+        # Solo se importa el backend elegido (sqlite3 y mmap no se cargan con JSON)
+        if backend == "json":
+            from repositorios import RepositorioEmpleadosIndexado, RepositorioNominasJSON
+            self.repo_empleados = RepositorioEmpleadosIndexado(archivo_empleados, journal=journal)
+            self.repo_nominas = RepositorioNominasJSON(directorio_nominas, columnar=columnar,
+                                                       normalizado=normalizado)
+        elif backend == "binario":
+            from repositorios import RepositorioEmpleadosIndexado, RepositorioNominasBinario
+            self.repo_empleados = RepositorioEmpleadosIndexado(archivo_empleados, journal=journal)
+            self.repo_nominas = RepositorioNominasBinario(directorio_nominas, columnar=columnar)
+        elif backend == "sqlite":
+            from repositorios import RepositorioEmpleadosSQLite, RepositorioNominasSQLite
+            self.repo_empleados = RepositorioEmpleadosSQLite(archivo_db)
+            self.repo_nominas = RepositorioNominasSQLite(archivo_db, columnar=columnar)
+        else:
+            raise ValueError(f"Backend no soportado: {backend}. Opciones: {', '.join(self.BACKENDS)}")
+        
+        if cache_nominas > 0:
+            self.repo_nominas = RepositorioNominasCache(self.repo_nominas, cache_nominas, cache_bytes)
+    
+    @cached_property
+    def repo_nominas_async(self):
+        """
+        Acceso asíncrono al mismo repositorio (con la caché incluida); se
+        crea al primer uso para no importar asyncio en cada arranque
+        """
+        from repositorios import RepositorioNominasAsync
+        return RepositorioNominasAsync(self.repo_nominas)
+
+    def perfilado(self, directorio: str = "perfiles", resumen: bool = False):
+        """
+        Vista del sistema que perfila cada llamada a un método público con
+        cProfile y tracemalloc (ver utils.perfilado.Perfilador)
+        Returns: Proxy utilizable en lugar del sistema
+        """
+        from utils.perfilado import Perfilador
+        return Perfilador(directorio, resumen).envolver(self)
+
     # --- CRUD EMPLEADOS ---
     @manejar_errores
     @log_operacion
@@ -33,18 +146,21 @@ class SistemaNominas:
         self.repo_empleados.guardar(empleado)
         return empleado
     
+    @instrumentar
     def obtener_empleado(self, cedula: str) -> Optional[Empleado]:
         """
         Obtiene un empleado por cédula
         """
         return self.repo_empleados.obtener(cedula)
     
+    @instrumentar
     def listar_empleados(self) -> List[Empleado]:
         """
         Obtiene todos los empleados
         """
         return self.repo_empleados.obtener_todos()
     
+    @instrumentar
     def actualizar_empleado(self, cedula: str, **kwargs) -> Optional[Empleado]:
         """
         Actualiza los datos de un empleado
@@ -58,14 +174,68 @@ class SistemaNominas:
             return empleado
         return None
     
+    @instrumentar
     def eliminar_empleado(self, cedula: str) -> bool:
         """
         Elimina un empleado
         """
         return self.repo_empleados.eliminar(cedula)
     
+    # --- IMPORTACIÓN MASIVA ---
+    @manejar_errores
+    @instrumentar
+    def importar_empleados(self, ruta: str, formato: Optional[str] = None,
+                           tamano_lote: int = 1000) -> Optional[Dict]:
+        """
+        Importa empleados desde un archivo CSV o JSONL leyéndolo fila por fila.
+        Valida cada lote en una pasada con ESQUEMA_EMPLEADO, registra los
+        errores de cada fila sin detenerse y guarda todas las filas válidas en
+        una sola escritura al repositorio.
+        formato: 'csv' o 'jsonl' (por defecto se deduce de la extensión)
+        """
+        formato = (formato or os.path.splitext(ruta)[1].lstrip('.')).lower()
+        if formato not in ('csv', 'jsonl'):
+            raise ValueError(f"Formato no soportado: {formato}. Use 'csv' o 'jsonl'")
+        
+        inicio = time.perf_counter()
+        validos: List[Empleado] = []
+        errores: List[Dict] = []
+        procesadas = 0
+        
+        with open(ruta, 'r', encoding='utf-8', newline='') as f:
+            filas = _filas_csv(f) if formato == 'csv' else _filas_jsonl(f)
+            while True:
+                lote = list(islice(filas, tamano_lote))
+                if not lote:
+                    break
+                procesadas += len(lote)
+                filas_lote = [_normalizar_fila(fila) for _, fila in lote]
+                fallos = ESQUEMA_EMPLEADO.validar_lote(filas_lote).errores
+                for indice, ((linea, _), datos) in enumerate(zip(lote, filas_lote)):
+                    if indice in fallos:
+                        errores.append({'linea': linea,
+                                        'errores': [error.mensaje for error in fallos[indice]]})
+                    else:
+                        validos.append(Empleado(**datos))
+        
+        if validos:
+            self.repo_empleados.guardar_varios(validos)
+        
+        segundos = time.perf_counter() - inicio
+        resultado = {
+            'procesadas': procesadas,
+            'importadas': len(validos),
+            'errores': errores,
+            'segundos': segundos,
+            'filas_por_segundo': procesadas / segundos if segundos else 0.0
+        }
+        print(f"✅ Importados {len(validos)} de {procesadas} empleados "
+              f"({len(errores)} con errores, {resultado['filas_por_segundo']:,.0f} filas/s)")
+        return resultado
+    
     # --- OPERACIONES DE NÓMINA ---
     @manejar_errores
+    @instrumentar
     def generar_nomina_mensual(self, aniomes: str) -> Optional[Nomina]:
         """
         Genera una nómina mensual con manejo de errores
@@ -80,20 +250,105 @@ class SistemaNominas:
         nomina = Nomina(self._obtener_proximo_id(), aniomes)
         
         # Generar detalles para cada empleado
+        for detalle in self._generar_detalles(empleados):
+            nomina.agregar_detalle(detalle)
+        
+        # Guardar nómina
+        self.repo_nominas.guardar(nomina)
+        print(f"✅ Nómina {aniomes} generada con {len(empleados)} empleados")
+        return nomina
+    
+    @manejar_errores
+    @instrumentar
+    def generar_nomina_streaming(self, aniomes: str) -> Optional[Dict]:
+        """
+        Genera la nómina mensual como un flujo empleado -> detalle -> archivo:
+        no arma la lista de objetos Empleado ni la de detalles. La fuente sí
+        es O(empleados): el repositorio de empleados tiene sus registros en
+        memoria (índice o JSON leído completo).
+        Returns: Resumen con id, aniomes, empleados y totales
+        """
+        empleados = self.repo_empleados.iterar_todos()
+        primero = next(empleados, None)
+        if primero is None:
+            print("⚠️ No hay empleados para generar nómina")
+            return None
+        
+        detalles = self._generar_detalles(chain([primero], empleados))
+        resumen = self.repo_nominas.guardar_streaming(self._obtener_proximo_id(), aniomes, detalles)
+        print(f"✅ Nómina {aniomes} generada con {resumen['empleados']} empleados")
+        return resumen
+    
+    @manejar_errores
+    @instrumentar
+    def generar_nomina_paralela(self, aniomes: str, workers: Optional[int] = None,
+                                particion: str = "departamento",
+                                tamano_bloque: int = 10000) -> Optional[Dict]:
+        """
+        Genera la nómina mensual repartiendo los empleados en shards que se
+        procesan en un ProcessPoolExecutor.
+        particion: 'departamento' (un shard por departamento) o 'bloques'
+        (shards consecutivos de tamano_bloque empleados).
+        Los ids de los detalles son la posición del empleado, y los resultados
+        se combinan en ese orden, así el archivo y los totales son idénticos
+        a los de la generación secuencial.
+        Returns: Resumen con id, aniomes, empleados, totales y totales parciales por shard
+        """
+        # Solo la generación paralela usa el reparto en shards
+        from sistema.generacion_paralela import (
+            procesar_shard,
+            repartir_en_bloques,
+            repartir_por_departamento
+        )
+        empleados = self.repo_empleados.iterar_todos()
+        if particion == "departamento":
+            shards = repartir_por_departamento(empleados)
+        elif particion == "bloques":
+            shards = repartir_en_bloques(empleados, tamano_bloque)
+        else:
+            raise ValueError(f"Partición no soportada: {particion}. Use 'departamento' o 'bloques'")
+        
+        if not shards:
+            print("⚠️ No hay empleados para generar nómina")
+            return None
+        
+        # Si el repositorio acepta detalles ya serializados, la serialización
+        # también se hace en los procesos
+        # (el formato normalizado necesita la tabla de empleados, así que va por guardar_streaming)
+        guardar_fragmentos = getattr(self.repo_nominas, 'guardar_fragmentos', None)
+        serializar = guardar_fragmentos is not None and not getattr(self.repo_nominas, 'normalizado', False)
+        
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            resultados = list(executor.map(procesar_shard, shards, repeat(Nomina.BONO),
+                                           repeat(Nomina.PRESTAMO), repeat(serializar)))
+        
+        filas = heapq.merge(*(filas for filas, _ in resultados), key=lambda fila: fila[0])
+        proximo_id = self._obtener_proximo_id()
+        if serializar:
+            resumen = guardar_fragmentos(proximo_id, aniomes, (fila[1:] for fila in filas))
+        else:
+            resumen = self.repo_nominas.guardar_streaming(proximo_id, aniomes,
+                                                          (detalle for _, detalle in filas))
+        
+        resumen['workers'] = workers or os.cpu_count()
+        resumen['shards'] = [parcial for _, parcial in resultados]
+        print(f"✅ Nómina {aniomes} generada con {resumen['empleados']} empleados "
+              f"en {len(shards)} shards")
+        return resumen
+    
+    def _generar_detalles(self, empleados: Iterable[Empleado]) -> Iterator[DetalleNomina]:
+        """
+        Crea el detalle de nómina de cada empleado, numerados desde 1
+        """
         for i, empleado in enumerate(empleados, 1):
-            detalle = DetalleNomina(
+            yield DetalleNomina(
                 id=i,
                 empleado=empleado,
                 sueldo=empleado.sueldo,
                 bono=Nomina.BONO,
                 prestamo=Nomina.PRESTAMO
             )
-            nomina.agregar_detalle(detalle)
-        
-        # Guardar nómina
-        self.repo_nominas.guardar(nomina)
-        print(f"✅ Nómina {aniomes} generada con {len(empleados)} empleados")
-        return nomina
     
     def _obtener_proximo_id(self) -> int:
         """
@@ -103,60 +358,79 @@ class SistemaNominas:
         return len(nominas_existentes) + 1
     
     # --- CONSULTAS Y ESTADÍSTICAS ---
+    @instrumentar
     def obtener_nomina(self, aniomes: str) -> Optional[Nomina]:
         """
         Obtiene una nómina por mes-año
         """
         return self.repo_nominas.obtener(aniomes)
     
+    @instrumentar
     def listar_nominas(self) -> List[str]:
         """
         Lista todas las nóminas disponibles
         """
         return self.repo_nominas.listar_nominas()
     
+    @instrumentar
     def generar_estadisticas_nomina(self, aniomes: str) -> Dict:
         """
         Genera estadísticas detalladas de una nómina usando funciones de orden superior
         """
-        nomina = self.repo_nominas.obtener(aniomes)
+        return self._estadisticas_de_nomina(aniomes, self.repo_nominas.obtener(aniomes))
+    
+    def _estadisticas_de_nomina(self, aniomes: str, nomina: Optional[Nomina]) -> Dict:
+        """
+        Estadísticas detalladas de una nómina ya cargada ({} si no existe)
+        """
         if not nomina:
             return {}
         
-        # Usando LAMBDAS, MAP, FILTER, REDUCE y COMPREHENSIONS
         detalles = nomina.detalles
+        if isinstance(detalles, DetallesColumnares):
+            return self._estadisticas_columnares(aniomes, detalles)
         
-        # Comprehensions para listas básicas
-        netos = [d.neto for d in detalles]
-        sueldos = [d.sueldo for d in detalles]
-        
-        # Usando map para transformaciones
-        nombres_empleados = list(map(lambda d: d.empleado.nombre, detalles))
-        
-        # Usando filter para filtros
-        empleados_altos_sueldos = list(filter(lambda d: d.sueldo > 1000, detalles))
-        empleados_bajos_sueldos = list(filter(lambda d: d.sueldo <= 1000, detalles))
-        
-        # Usando reduce para agregaciones
-        total_iess = reduce(lambda acc, d: acc + d.iess, detalles, 0.0)
-        total_bonos = reduce(lambda acc, d: acc + d.bono, detalles, 0.0)
+        # Una sola pasada sobre los detalles
+        stats = acumular_estadisticas(detalles)
         
         return {
             'periodo': aniomes,
-            'total_empleados': len(detalles),
-            'total_neto': reduce(lambda a, b: a + b, netos, 0.0),
-            'promedio_sueldo': reduce(lambda a, b: a + b, sueldos, 0.0) / len(sueldos) if sueldos else 0,
-            'promedio_neto': reduce(lambda a, b: a + b, netos, 0.0) / len(netos) if netos else 0,
-            'empleado_mayor_neto': max(detalles, key=lambda d: d.neto) if detalles else None,
-            'empleado_menor_neto': min(detalles, key=lambda d: d.neto) if detalles else None,
-            'empleado_mayor_sueldo': max(detalles, key=lambda d: d.sueldo) if detalles else None,
-            'total_aporte_iess': total_iess,
-            'total_bonos': total_bonos,
-            'empleados_alto_sueldo': empleados_altos_sueldos,
-            'empleados_bajo_sueldo': empleados_bajos_sueldos,
-            'nombres_empleados': nombres_empleados
+            'total_empleados': stats.cantidad,
+            'total_neto': stats.total_neto,
+            'promedio_sueldo': stats.promedio_sueldo,
+            'promedio_neto': stats.promedio_neto,
+            'empleado_mayor_neto': stats.mayor_neto,
+            'empleado_menor_neto': stats.menor_neto,
+            'empleado_mayor_sueldo': stats.mayor_sueldo,
+            'total_aporte_iess': stats.total_iess,
+            'total_bonos': stats.total_bonos,
+            'empleados_alto_sueldo': stats.alto_sueldo,
+            'empleados_bajo_sueldo': stats.bajo_sueldo,
+            'nombres_empleados': stats.nombres
         }
     
+    def _estadisticas_columnares(self, aniomes: str, columnas: DetallesColumnares) -> Dict:
+        """
+        Mismas estadísticas que generar_estadisticas_nomina, calculadas sobre columnas
+        """
+        cantidad = len(columnas)
+        return {
+            'periodo': aniomes,
+            'total_empleados': cantidad,
+            'total_neto': columnas.total('neto'),
+            'promedio_sueldo': columnas.promedio('sueldo'),
+            'promedio_neto': columnas.promedio('neto'),
+            'empleado_mayor_neto': columnas[columnas.indice_maximo('neto')] if cantidad else None,
+            'empleado_menor_neto': columnas[columnas.indice_minimo('neto')] if cantidad else None,
+            'empleado_mayor_sueldo': columnas[columnas.indice_maximo('sueldo')] if cantidad else None,
+            'total_aporte_iess': columnas.total('iess'),
+            'total_bonos': columnas.total('bono'),
+            'empleados_alto_sueldo': list(columnas.filtrar('sueldo', '>', 1000)),
+            'empleados_bajo_sueldo': list(columnas.filtrar('sueldo', '<=', 1000)),
+            'nombres_empleados': [empleado.nombre for empleado in columnas.empleados]
+        }
+    
+    @instrumentar
     def generar_reporte_completo(self, aniomes: str) -> str:
         """
         Genera un reporte completo en formato texto
@@ -210,6 +484,7 @@ class SistemaNominas:
             return f"❌ Error generando reporte: {e}"
     
     # --- MÉTODOS CON LAMBDAS AVANZADAS ---
+    @instrumentar
     def buscar_empleados_por(self, condicion) -> List[Empleado]:
         """
         Busca empleados usando una condición lambda
@@ -218,16 +493,65 @@ class SistemaNominas:
         empleados = self.repo_empleados.obtener_todos()
         return list(filter(condicion, empleados))
     
+    @instrumentar
     def calcular_total_nominas(self) -> float:
         """
-        Calcula el total de todas las nóminas usando reduce
+        Calcula el total de todas las nóminas usando reduce sobre los
+        resúmenes del repositorio (sin cargar los detalles)
+        """
+        resumenes = self.repo_nominas.obtener_resumenes()
+        total = reduce(lambda acc, resumen: acc + a_centavos(resumen['neto']), resumenes, 0)
+        return a_monto(total)
+    
+    # --- SERIES DE TIEMPO ---
+    def _serie(self, desde: Optional[str], hasta: Optional[str], columnas: Sequence[str],
+               workers: Optional[int], cedula: Optional[str] = None,
+               departamento: Optional[str] = None) -> Dict:
+        """
+        Sumas por período de las columnas pedidas, con su variación mensual
+        y su acumulado del año, como arreglos compactos array('d')
+        """
+        validar_columnas(columnas)
+        periodos = [
+            aniomes for aniomes in self.repo_nominas.listar_nominas()
+            if (desde is None or aniomes >= desde) and (hasta is None or aniomes <= hasta)
+        ]
+        sumas = self.repo_nominas.sumar_por_periodo(periodos, columnas, cedula, departamento, workers)
+        periodos = [aniomes for aniomes in periodos if aniomes in sumas]
+        
+        serie = {'periodos': periodos, 'variaciones': {}, 'acumulado_anual': {}}
+        for j, columna in enumerate(columnas):
+            valores = array('d', (sumas[aniomes][j] for aniomes in periodos))
+            serie[columna] = valores
+            serie['variaciones'][columna] = variaciones(valores)
+            serie['acumulado_anual'][columna] = acumulado_anual(periodos, valores)
+        return serie
+    
+    @instrumentar
+    def serie_empleado(self, cedula: str, desde: Optional[str] = None, hasta: Optional[str] = None,
+                       columnas: Sequence[str] = COLUMNAS_SERIE, workers: Optional[int] = None) -> Dict:
+        """
+        Serie de tiempo de un empleado entre desde y hasta (YYYYMM, inclusive).
+        Los períodos donde no aparece suman 0. Las variaciones están alineadas
+        con periodos[1:].
+        Ejemplo: sistema.serie_empleado('1234567890', '202101', '202512')['neto']
+        """
+        serie = self._serie(desde, hasta, columnas, workers, cedula=cedula)
+        serie['cedula'] = cedula
+        return serie
+    
+    @instrumentar
+    def serie_departamento(self, departamento: str, desde: Optional[str] = None,
+                           hasta: Optional[str] = None, columnas: Sequence[str] = COLUMNAS_SERIE,
+                           workers: Optional[int] = None) -> Dict:
+        """
+        Serie de tiempo de un departamento entre desde y hasta (YYYYMM, inclusive)
         """
-        nominas = self.listar_nominas()
-        total = reduce(lambda acc, aniomes: acc + (self.obtener_nomina(aniomes).neto 
-                      if self.obtener_nomina(aniomes) else 0.0), 
-                      nominas, 0.0)
-        return total
+        serie = self._serie(desde, hasta, columnas, workers, departamento=departamento)
+        serie['departamento'] = departamento
+        return serie
     
+    @instrumentar
     def generar_estadisticas_avanzadas(self, aniomes: str) -> Dict:
         """
         Genera estadísticas avanzadas usando las nuevas utilidades
@@ -238,12 +562,88 @@ class SistemaNominas:
         
         return generar_estadisticas_avanzadas(nomina.detalles)
     
-    def generar_metricas_departamento(self, aniomes: str) -> Dict:
+    # --- VERSIONES ASÍNCRONAS ---
+    async def calcular_total_nominas_async(self) -> float:
         """
-        Genera métricas por departamento
+        Igual que calcular_total_nominas, sin bloquear el event loop
         """
-        nomina = self.repo_nominas.obtener(aniomes)
+        resumenes = await self.repo_nominas_async.obtener_resumenes()
+        return a_monto(reduce(lambda acc, resumen: acc + a_centavos(resumen['neto']), resumenes, 0))
+    
+    async def generar_estadisticas_nomina_async(self, aniomes: str) -> Dict:
+        """
+        Igual que generar_estadisticas_nomina, con la carga en un hilo
+        """
+        return self._estadisticas_de_nomina(aniomes, await self.repo_nominas_async.obtener(aniomes))
+    
+    async def generar_estadisticas_avanzadas_async(self, aniomes: str) -> Dict:
+        """
+        Igual que generar_estadisticas_avanzadas, con la carga en un hilo
+        """
+        nomina = await self.repo_nominas_async.obtener(aniomes)
         if not nomina or not nomina.detalles:
             return {}
+        return generar_estadisticas_avanzadas(nomina.detalles)
+    
+    async def generar_metricas_departamento_async(self, aniomes: str) -> Dict:
+        """
+        Igual que generar_metricas_departamento, con la lectura en un hilo
+        """
+        departamentos = await self.repo_nominas_async.obtener_departamentos(aniomes)
+        if not departamentos:
+            return {}
+        return deserializar_metricas_departamento(departamentos)
+    
+    async def generar_estadisticas_periodos_async(self, desde: Optional[str] = None,
+                                                  hasta: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Estadísticas de todos los períodos entre desde y hasta (YYYYMM,
+        inclusive), cargándolos de forma concurrente
+        Returns: Diccionario aniomes -> estadísticas
+        """
+        periodos = [
+            aniomes for aniomes in await self.repo_nominas_async.listar_nominas()
+            if (desde is None or aniomes >= desde) and (hasta is None or aniomes <= hasta)
+        ]
+        nominas = await self.repo_nominas_async.obtener_varios(periodos)
+        return {aniomes: self._estadisticas_de_nomina(aniomes, nomina)
+                for aniomes, nomina in nominas.items() if nomina is not None}
+    
+    @instrumentar
+    def generar_estadisticas_streaming(self, aniomes: str) -> Dict:
+        """
+        Estadísticas de un período recorriendo sus detalles de a uno, con
+        memoria constante (sirve para archivos históricos muy grandes)
+        """
+        stats = AcumuladorEstadisticas(conservar_filas=False)
+        stats.agregar_todos(self.repo_nominas.iterar_detalles(aniomes))
+        if not stats.cantidad:
+            return {}
+        
+        return {
+            'periodo': aniomes,
+            'total_empleados': stats.cantidad,
+            'total_neto': stats.total_neto,
+            'promedio_sueldo': stats.promedio_sueldo,
+            'promedio_neto': stats.promedio_neto,
+            'empleado_mayor_neto': stats.mayor_neto,
+            'empleado_menor_neto': stats.menor_neto,
+            'empleado_mayor_sueldo': stats.mayor_sueldo,
+            'total_aporte_iess': stats.total_iess,
+            'total_bonos': stats.total_bonos,
+            'cantidad_alto_sueldo': stats.cantidad_alto_sueldo,
+            'cantidad_bajo_sueldo': stats.cantidad_bajo_sueldo,
+            'departamentos': stats.departamentos()
+        }
+    
+    @instrumentar
+    def generar_metricas_departamento(self, aniomes: str) -> Dict:
+        """
+        Genera métricas por departamento a partir de las guardadas con la
+        nómina (no vuelve a cargar ni agrupar los detalles)
+        """
+        departamentos = self.repo_nominas.obtener_departamentos(aniomes)
+        if not departamentos:
+            return {}
         
-        return calcular_metricas_departamento(nomina.detalles)
\ No newline at end of file
+        return deserializar_metricas_departamento(departamentos)
\ No newline at end of file
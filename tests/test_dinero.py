@@ -0,0 +1,63 @@
+"""
+Reglas de redondeo del motor en centavos y compatibilidad con nóminas
+guardadas por la versión con floats
+"""
+import os
+import shutil
+
+import pytest
+
+from modelos import DetalleNomina, Empleado, Nomina
+from repositorios.nominas__binario import RepositorioNominasBinario
+from repositorios.nominas__sqlite import RepositorioNominasSQLite
+from sistema.sistema_nominas import SistemaNominas
+
+# nomina_202401.json escrita por la versión con floats: IESS con
+# round(sueldo * 0.0945, 2), que en 1030, 1050 y 1090 da un centavo menos
+# que la regla actual (mitad hacia arriba)
+BASE = os.path.join(os.path.dirname(__file__), 'datos', 'nomina_202401.json')
+IESS_GUARDADO = [9733, 9922, 10300]
+NETO_GUARDADO = 300045
+
+@pytest.mark.parametrize('sueldo, bono, prestamo, esperado', [
+    # (sueldo, bono, préstamo) -> (sueldo, iess, neto) en centavos
+    (1.005, 0.0, 0.0, (101, 10, 91)),
+    (2.675, 0.005, 0.0, (268, 25, 244)),
+    (10.0, 0.0, 0.0, (1000, 95, 905)),
+    (30.0, 0.0, 0.015, (3000, 284, 2714)),
+])
+def test_redondeo_en_medio_centavo(sueldo, bono, prestamo, esperado):
+    empleado = Empleado("0000000001", "Ana Vera", sueldo, "Ventas", "Jefe")
+    detalle = DetalleNomina(1, empleado, sueldo, bono, prestamo)
+    assert (detalle.sueldo_centavos, detalle.iess_centavos, detalle.neto_centavos) == esperado
+
+    nomina = Nomina(1, "202501")
+    nomina.agregar_detalle(detalle)
+    assert nomina.neto_centavos == detalle.neto_centavos
+
+def _sistema_base(tmp_path, columnar: bool = False) -> SistemaNominas:
+    os.makedirs(tmp_path / 'nominas')
+    shutil.copy(BASE, tmp_path / 'nominas')
+    return SistemaNominas(directorio=str(tmp_path), columnar=columnar, cache_nominas=0)
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_nomina_guardada_con_floats_conserva_su_iess(tmp_path, columnar):
+    sistema = _sistema_base(tmp_path, columnar)
+
+    nomina = sistema.obtener_nomina("202401")
+    assert [detalle.iess_centavos for detalle in nomina.detalles] == IESS_GUARDADO
+    assert nomina.neto_centavos == NETO_GUARDADO
+    assert [detalle.iess_centavos for detalle in sistema.repo_nominas.iterar_detalles("202401")] == IESS_GUARDADO
+    assert sistema.generar_estadisticas_nomina("202401")['total_neto'] == 3000.45
+    assert sistema.repo_nominas.obtener_resumenes()[0]['neto'] == 3000.45
+    assert sistema.calcular_total_nominas() == 3000.45
+
+def test_nomina_guardada_con_floats_conserva_su_iess_en_otros_backends(tmp_path):
+    nomina = _sistema_base(tmp_path).obtener_nomina("202401")
+    binario = RepositorioNominasBinario(f"{tmp_path}{os.sep}binario{os.sep}", columnar=True)
+    sqlite = RepositorioNominasSQLite(str(tmp_path / 'nominas.db'))
+    for repo in (binario, sqlite):
+        repo.guardar(nomina)
+        copia = repo.obtener("202401")
+        assert [detalle.iess_centavos for detalle in copia.detalles] == IESS_GUARDADO
+        assert copia.neto_centavos == NETO_GUARDADO
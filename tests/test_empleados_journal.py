@@ -0,0 +1,33 @@
+"""
+Modo journal de los repositorios de empleados y del sistema
+"""
+import os
+
+from modelos import Empleado
+from repositorios import RepositorioEmpleadosJSON
+from sistema import SistemaNominas
+
+def _empleado(cedula: str) -> Empleado:
+    return Empleado(cedula, "Ana Vera", 800.0, "Ventas", "Jefe")
+
+def test_eliminar_solo_agrega_el_borrado(tmp_path):
+    archivo = str(tmp_path / "empleados.json")
+    RepositorioEmpleadosJSON(archivo).guardar_varios([_empleado("0912345678"), _empleado("0998765432")])
+    principal = os.path.getmtime(archivo), os.path.getsize(archivo)
+
+    repo = RepositorioEmpleadosJSON(archivo, journal=True)
+    assert repo.eliminar("0912345678")
+
+    assert (os.path.getmtime(archivo), os.path.getsize(archivo)) == principal
+    with open(repo.archivo_journal, encoding='utf-8') as f:
+        assert f.read() == '{"op": "delete", "cedula": "0912345678"}\n'
+    assert [empleado.cedula for empleado in repo.obtener_todos()] == ["0998765432"]
+
+def test_sistema_con_journal(tmp_path):
+    sistema = SistemaNominas(directorio=str(tmp_path), cache_nominas=0, journal=True)
+    sistema.crear_empleado("0912345678", "Ana Vera", 800.0, "Ventas", "Jefe")
+
+    assert not os.path.exists(tmp_path / "empleados.json")
+    assert sistema.eliminar_empleado("0912345678")
+    assert not sistema.eliminar_empleado("0912345678")
+    assert SistemaNominas(directorio=str(tmp_path), journal=True).repo_empleados.obtener_todos() == []
@@ -0,0 +1,62 @@
+"""
+Totales incrementales de Nomina contra un reduce sobre los detalles
+"""
+from functools import reduce
+
+import pytest
+
+from modelos import DetalleNomina, Empleado, Nomina
+
+# Montos en la mitad de un centavo (1.005, 2.675, 0.125 no son exactos en
+# float) y sueldos cuyo IESS cae justo en medio centavo (10.00 * 9.45 % = 0.945)
+SUELDOS = [460.0, 1.005, 2.675, 0.125, 10.0, 30.0, 1234.56, 4499.99, 0.1, 0.2]
+BONOS = [0.0, 50.0, 0.005, 0.1]
+PRESTAMOS = [0.0, 20.0, 0.015]
+
+def _detalles():
+    detalles = []
+    for i in range(300):
+        empleado = Empleado(f"{i:010d}", "Ana Vera", 500.0, "Ventas", "Jefe")
+        detalles.append(DetalleNomina(i + 1, empleado, SUELDOS[i % len(SUELDOS)],
+                                      BONOS[i % len(BONOS)], PRESTAMOS[i % len(PRESTAMOS)]))
+    return detalles
+
+def _totales_reduce(detalles):
+    return tuple(reduce(lambda acumulado, detalle: acumulado + getattr(detalle, atributo), detalles, 0)
+                 for atributo in ('tot_ing_centavos', 'tot_des_centavos', 'neto_centavos'))
+
+def _totales(nomina):
+    return nomina.tot_ing_centavos, nomina.tot_des_centavos, nomina.neto_centavos
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_agregar_detalle_igual_a_reduce(columnar):
+    detalles = _detalles()
+    nomina = Nomina(1, "202501", columnar=columnar)
+    for detalle in detalles:
+        nomina.agregar_detalle(detalle)
+    assert _totales(nomina) == _totales_reduce(detalles)
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_agregar_detalles_igual_a_reduce(columnar):
+    detalles = _detalles()
+    nomina = Nomina(1, "202501", columnar=columnar)
+    nomina.agregar_detalles(detalles[:100])
+    nomina.agregar_detalles(iter(detalles[100:]))
+    assert _totales(nomina) == _totales_reduce(detalles)
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_recalcular_igual_a_reduce(columnar):
+    detalles = _detalles()
+    nomina = Nomina(1, "202501", columnar=columnar)
+    nomina.agregar_detalles(detalles)
+    nomina.tot_ing = nomina.tot_des = nomina.neto = 0.0
+    nomina.recalcular()
+    assert _totales(nomina) == _totales_reduce(detalles)
+
+def test_totales_en_float_coinciden_con_reduce_redondeado():
+    detalles = _detalles()
+    nomina = Nomina(1, "202501")
+    nomina.agregar_detalles(detalles)
+    for atributo in ('tot_ing', 'tot_des', 'neto'):
+        esperado = reduce(lambda acumulado, detalle: acumulado + getattr(detalle, atributo), detalles, 0.0)
+        assert getattr(nomina, atributo) == round(esperado, 2)
@@ -0,0 +1,133 @@
+"""
+Ida y vuelta JSON -> binario -> JSON, lectura de archivos binarios versión 1
+y métricas por departamento guardadas en el archivo
+"""
+import os
+from array import array
+
+import pytest
+
+from modelos import DetalleNomina, DetallesColumnares, Empleado, Nomina
+from repositorios.nominas__binario import (CABECERA, CABECERA_V1, COLUMNAS_BINARIAS,
+                                           SECCION_DEPARTAMENTOS, NominaBinaria,
+                                           RepositorioNominasBinario)
+from repositorios.nominas__json import RepositorioNominasJSON
+
+DEPARTAMENTOS = ['Ventas', 'Sistemas', 'Bodega']
+
+def _nomina(aniomes: str = "202501") -> Nomina:
+    nomina = Nomina(1, aniomes)
+    for i in range(50):
+        sueldo = 460.0 + i * 37.255
+        empleado = Empleado(f"{i:010d}", "Ana Vera", sueldo, DEPARTAMENTOS[i % 3], "Jefe")
+        nomina.agregar_detalle(DetalleNomina(i + 1, empleado, sueldo, 50.0 if i % 2 else 0.0,
+                                             20.0 if i % 5 == 0 else 0.0))
+    return nomina
+
+def _directorio(tmp_path, nombre: str) -> str:
+    directorio = tmp_path / nombre
+    directorio.mkdir()
+    return f"{directorio}{os.sep}"
+
+def _totales(nomina: Nomina):
+    return nomina.tot_ing_centavos, nomina.tot_des_centavos, nomina.neto_centavos
+
+def _detalles(nomina: Nomina):
+    return [detalle.to_dict() for detalle in nomina.detalles]
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_ida_y_vuelta_json_binario_json(tmp_path, columnar):
+    original = _nomina()
+    repo_json = RepositorioNominasJSON(_directorio(tmp_path, 'json'))
+    repo_json.guardar(original)
+    desde_json = repo_json.obtener("202501")
+
+    repo_binario = RepositorioNominasBinario(_directorio(tmp_path, 'binario'), columnar=columnar)
+    repo_binario.guardar(desde_json)
+    desde_binario = repo_binario.obtener("202501")
+    assert isinstance(desde_binario.detalles, DetallesColumnares) == columnar
+
+    repo_vuelta = RepositorioNominasJSON(_directorio(tmp_path, 'vuelta'))
+    repo_vuelta.guardar(desde_binario)
+    vuelta = repo_vuelta.obtener("202501")
+
+    for nomina in (desde_json, desde_binario, vuelta):
+        assert _totales(nomina) == _totales(original)
+        assert _detalles(nomina) == _detalles(original)
+
+def test_a_columnar_conserva_filas_y_departamentos(tmp_path):
+    original = _nomina()
+    repo = RepositorioNominasBinario(_directorio(tmp_path, 'binario'))
+    repo.guardar(original)
+    with repo.abrir("202501") as vista:
+        columnar = vista.a_columnar()
+    assert [detalle.to_dict() for detalle in columnar] == _detalles(original)
+    assert columnar.total_centavos('neto') == original.neto_centavos
+    assert [columnar.departamento(i) for i in range(len(columnar))] == \
+        [detalle.empleado.departamento for detalle in original.detalles]
+
+def _convertir_a_version_1(archivo: str) -> None:
+    """
+    Reescribe un archivo de la versión actual con el formato de la versión 1
+    (montos y totales en float)
+    """
+    with open(archivo, 'rb') as f:
+        datos = f.read()
+    magic, _, orden, aniomes, id, filas, empleados, *totales = CABECERA.unpack_from(datos)
+    partes = [CABECERA_V1.pack(magic, 1, orden, aniomes, id, filas, empleados,
+                               *(total / 100 for total in totales))]
+    posicion = CABECERA.size
+    partes.append(datos[posicion:posicion + 16 * filas])  # id y empleado
+    posicion += 16 * filas
+    for _ in COLUMNAS_BINARIAS:
+        centavos = array('q', datos[posicion:posicion + 8 * filas])
+        partes.append(array('d', (valor / 100 for valor in centavos)).tobytes())
+        posicion += 8 * filas
+    partes.append(datos[posicion:])
+    with open(archivo, 'wb') as f:
+        f.write(b''.join(partes))
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_lee_archivos_version_1(tmp_path, columnar):
+    original = _nomina()
+    directorio = _directorio(tmp_path, 'binario')
+    repo = RepositorioNominasBinario(directorio, columnar=columnar)
+    repo.guardar(original)
+    archivo = f"{directorio}nomina_202501.bin"
+    _convertir_a_version_1(archivo)
+
+    with NominaBinaria(archivo) as vista:
+        assert vista.version == 1
+        assert (vista.tot_ing_centavos, vista.tot_des_centavos, vista.neto_centavos) == _totales(original)
+        assert vista.total_centavos('neto') == original.neto_centavos
+
+    nomina = repo.obtener("202501")
+    assert _totales(nomina) == _totales(original)
+    assert _detalles(nomina) == _detalles(original)
+    resumen, = repo.obtener_resumenes()
+    assert (resumen['tot_ing'], resumen['tot_des'], resumen['neto']) == \
+        (original.tot_ing, original.tot_des, original.neto)
+
+def test_departamentos_guardados_en_el_archivo(tmp_path):
+    original = _nomina()
+    repo_json = RepositorioNominasJSON(_directorio(tmp_path, 'json'))
+    repo_json.guardar(original)
+    directorio = _directorio(tmp_path, 'binario')
+    repo = RepositorioNominasBinario(directorio)
+    repo.guardar(original)
+
+    with repo.abrir("202501") as vista:
+        guardados = vista.departamentos()
+    assert guardados is not None
+    assert repo.obtener_departamentos("202501") == guardados == repo_json.obtener_departamentos("202501")
+
+    # Un archivo sin la sección (anterior a ella) se calcula al consultarlo
+    archivo = f"{directorio}nomina_202501.bin"
+    with open(archivo, 'rb') as f:
+        datos = f.read()
+    with open(archivo, 'wb') as f:
+        f.write(datos[:datos.rindex(SECCION_DEPARTAMENTOS)])
+    with repo.abrir("202501") as vista:
+        assert vista.departamentos() is None
+    assert repo.obtener_departamentos("202501") == guardados
+    assert repo.obtener_departamentos("202502") is None
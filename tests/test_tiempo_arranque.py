@@ -0,0 +1,17 @@
+"""
+Presupuesto de arranque de `main.py listar` medido con `python -X importtime`
+"""
+from benchmarks.tiempo_arranque import medir_arranque, preparar_datos
+
+PRESUPUESTO_MS = 100.0
+
+# Módulos que solo necesitan la escritura, la generación paralela o los
+# decoradores; listar no debe cargarlos
+DIFERIDOS = ('inspect', 'hashlib', 'sqlite3', 'concurrent.futures', 'sistema.generacion_paralela')
+
+def test_listar_dentro_del_presupuesto(tmp_path):
+    preparar_datos(str(tmp_path), 200)
+    imports, _, acumulados = medir_arranque(str(tmp_path), ['listar'], repeticiones=3)
+
+    assert not [modulo for modulo in DIFERIDOS if modulo in acumulados]
+    assert imports <= PRESUPUESTO_MS
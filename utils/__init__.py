@@ -1,39 +1,58 @@
-from .decoradores import (
-    validar_cedula,
-    validar_sueldo_positivo,
-    validar_nombre,
-    validar_departamento,
-    validar_empleado_completo,
-    log_operacion,
-    manejar_errores
-)
+import importlib
 
-from .calculos import (
-    calcular_total_neto,
-    calcular_promedio_sueldos,
-    filtrar_empleados_por_sueldo,
-    obtener_top_empleados,
-    calcular_distribucion_sueldos
-)
+# Los submódulos se importan recién al pedir uno de sus nombres (PEP 562):
+# `from utils import log_operacion` no carga las estadísticas ni los cálculos
+_EXPORTACIONES = {
+    'validar_cedula': 'decoradores',
+    'validar_sueldo_positivo': 'decoradores',
+    'validar_nombre': 'decoradores',
+    'validar_departamento': 'decoradores',
+    'validar_empleado_completo': 'decoradores',
+    'validar_datos_empleado': 'decoradores',
+    'log_operacion': 'decoradores',
+    'manejar_errores': 'decoradores',
+    'calcular_total_neto': 'calculos',
+    'calcular_promedio_sueldos': 'calculos',
+    'filtrar_empleados_por_sueldo': 'calculos',
+    'obtener_top_empleados': 'calculos',
+    'calcular_distribucion_sueldos': 'calculos',
+    'generar_estadisticas_avanzadas': 'estadisticas',
+    'calcular_metricas_departamento': 'estadisticas',
+    'serializar_metricas_departamento': 'estadisticas',
+    'deserializar_metricas_departamento': 'estadisticas',
+    'AcumuladorEstadisticas': 'acumulador',
+    'acumular_estadisticas': 'acumulador',
+    'convertir_a_json': 'serializacion',
+    'resumen_publico': 'serializacion',
+    'RegistroMetricas': 'metricas',
+    'REGISTRO': 'metricas',
+    'instrumentar': 'metricas',
+    'registrar_io': 'metricas',
+    'registrar_error': 'metricas',
+    'EsquemaValidacion': 'validacion',
+    'Campo': 'validacion',
+    'ErrorCampo': 'validacion',
+    'ErrorValidacion': 'validacion',
+    'ResultadoValidacion': 'validacion',
+    'ESQUEMA_EMPLEADO': 'validacion',
+    'Perfilador': 'perfilado',
+    'ObjetoPerfilado': 'perfilado',
+    'a_centavos': 'dinero',
+    'a_monto': 'dinero',
+    'aplicar_tasa': 'dinero',
+    'sumar_montos': 'dinero',
+    'formatear': 'dinero',
+    'TASA_IESS': 'dinero',
+}
 
-from .estadisticas import (
-    generar_estadisticas_avanzadas,
-    calcular_metricas_departamento
-)
+__all__ = list(_EXPORTACIONES)
 
-__all__ = [
-    'validar_cedula',
-    'validar_sueldo_positivo',
-    'validar_nombre',
-    'validar_departamento',
-    'validar_empleado_completo',
-    'log_operacion',
-    'manejar_errores',
-    'calcular_total_neto',
-    'calcular_promedio_sueldos',
-    'filtrar_empleados_por_sueldo',
-    'obtener_top_empleados',
-    'calcular_distribucion_sueldos',
-    'generar_estadisticas_avanzadas',
-    'calcular_metricas_departamento',
-]
\ No newline at end of file
+def __getattr__(nombre: str):
+    if nombre not in _EXPORTACIONES:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f'.{_EXPORTACIONES[nombre]}', __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,157 @@
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
+
+from utils.dinero import CENTAVOS_POR_UNIDAD, a_monto
+
+if TYPE_CHECKING:
+    from modelos.detalle_nomina import DetalleNomina
+
+class AcumuladorEstadisticas:
+    """
+    Calcula en una sola pasada todas las estadísticas de una nómina:
+    totales, promedios, extremos, conteos por umbral de sueldo y métricas
+    por departamento. Acepta cualquier iterable de detalles, incluidos
+    generadores que nunca forman una lista.
+
+    Las sumas son exactas en centavos (total_neto y demás son sus vistas en
+    float) y los extremos se quedan con el primer detalle que alcanza el
+    máximo o mínimo, igual que max y min.
+    """
+
+    def __init__(self, umbral_sueldo: float = 1000, conservar_filas: bool = True):
+        """
+        conservar_filas=False solo cuenta los empleados de alto y bajo sueldo
+        y no guarda los nombres (memoria constante sobre flujos grandes).
+        """
+        self.umbral_sueldo = umbral_sueldo
+        self.conservar_filas = conservar_filas
+        self.cantidad = 0
+        self.total_neto_centavos = 0
+        self.total_sueldos_centavos = 0
+        self.total_bonos_centavos = 0
+        self.total_iess_centavos = 0
+        self.mayor_neto: Optional['DetalleNomina'] = None
+        self.menor_neto: Optional['DetalleNomina'] = None
+        self.mayor_sueldo: Optional['DetalleNomina'] = None
+        self.cantidad_alto_sueldo = 0
+        self.cantidad_bajo_sueldo = 0
+        self.alto_sueldo: List['DetalleNomina'] = []
+        self.bajo_sueldo: List['DetalleNomina'] = []
+        self.nombres: List[str] = []
+        # departamento -> [empleados, total neto, detalle de mayor neto, total IESS, total bonos]
+        # (totales en centavos)
+        self._departamentos: Dict[str, list] = {}
+
+    def agregar(self, detalle: 'DetalleNomina') -> None:
+        """
+        Incorpora un detalle a todas las estadísticas
+        """
+        neto = detalle.neto_centavos
+        sueldo = detalle.sueldo_centavos
+        iess = detalle.iess_centavos
+        bono = detalle.bono_centavos
+
+        self.cantidad += 1
+        self.total_neto_centavos += neto
+        self.total_sueldos_centavos += sueldo
+        self.total_bonos_centavos += bono
+        self.total_iess_centavos += iess
+
+        if self.mayor_neto is None:
+            self.mayor_neto = self.menor_neto = self.mayor_sueldo = detalle
+        else:
+            if neto > self.mayor_neto.neto_centavos:
+                self.mayor_neto = detalle
+            if neto < self.menor_neto.neto_centavos:
+                self.menor_neto = detalle
+            if sueldo > self.mayor_sueldo.sueldo_centavos:
+                self.mayor_sueldo = detalle
+
+        if sueldo > self._umbral_centavos:
+            self.cantidad_alto_sueldo += 1
+            if self.conservar_filas:
+                self.alto_sueldo.append(detalle)
+        elif sueldo <= self._umbral_centavos:
+            self.cantidad_bajo_sueldo += 1
+            if self.conservar_filas:
+                self.bajo_sueldo.append(detalle)
+        if self.conservar_filas:
+            self.nombres.append(detalle.empleado.nombre)
+
+        grupo = self._departamentos.get(detalle.empleado.departamento)
+        if grupo is None:
+            self._departamentos[detalle.empleado.departamento] = [1, neto, detalle, iess, bono]
+        else:
+            grupo[0] += 1
+            grupo[1] += neto
+            if neto > grupo[2].neto_centavos:
+                grupo[2] = detalle
+            grupo[3] += iess
+            grupo[4] += bono
+
+    def agregar_todos(self, detalles: Iterable['DetalleNomina']) -> 'AcumuladorEstadisticas':
+        """
+        Incorpora todos los detalles del iterable
+        Returns: el mismo acumulador, para encadenar
+        """
+        agregar = self.agregar
+        for detalle in detalles:
+            agregar(detalle)
+        return self
+
+    @property
+    def umbral_sueldo(self) -> float:
+        return self._umbral_sueldo
+
+    @umbral_sueldo.setter
+    def umbral_sueldo(self, valor: float) -> None:
+        # Se compara en centavos contra el umbral escalado (sin redondearlo)
+        self._umbral_sueldo = valor
+        self._umbral_centavos = valor * CENTAVOS_POR_UNIDAD
+
+    @property
+    def total_neto(self) -> float:
+        return a_monto(self.total_neto_centavos)
+
+    @property
+    def total_sueldos(self) -> float:
+        return a_monto(self.total_sueldos_centavos)
+
+    @property
+    def total_bonos(self) -> float:
+        return a_monto(self.total_bonos_centavos)
+
+    @property
+    def total_iess(self) -> float:
+        return a_monto(self.total_iess_centavos)
+
+    @property
+    def promedio_neto(self) -> float:
+        return self.total_neto / self.cantidad if self.cantidad else 0
+
+    @property
+    def promedio_sueldo(self) -> float:
+        return self.total_sueldos / self.cantidad if self.cantidad else 0
+
+    def departamentos(self) -> Dict[str, Dict]:
+        """
+        Métricas por departamento en el orden en que aparecieron
+        """
+        return {
+            departamento: {
+                'empleados': empleados,
+                'total_neto': a_monto(total_neto),
+                'promedio_neto': a_monto(total_neto) / empleados,
+                'total_iess': a_monto(total_iess),
+                'total_bonos': a_monto(total_bonos),
+                'empleado_mayor_neto': mayor
+            }
+            for departamento, (empleados, total_neto, mayor, total_iess, total_bonos)
+            in self._departamentos.items()
+        }
+
+def acumular_estadisticas(detalles: Iterable['DetalleNomina'], umbral_sueldo: float = 1000,
+                          conservar_filas: bool = True) -> AcumuladorEstadisticas:
+    """
+    Recorre los detalles una sola vez y devuelve el acumulador con los resultados
+    """
+    return AcumuladorEstadisticas(umbral_sueldo, conservar_filas).agregar_todos(detalles)
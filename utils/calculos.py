@@ -1,33 +1,44 @@
 from typing import List, Dict, TYPE_CHECKING  
 from functools import reduce
+from modelos.detalles_columnares import DetallesColumnares
+from utils.dinero import a_monto
 
 if TYPE_CHECKING:
     from modelos.detalle_nomina import DetalleNomina
 
 def calcular_total_neto(detalles: List['DetalleNomina']) -> float:  
     """
-    Calcula el total neto usando reduce y lambda
+    Calcula el total neto usando reduce y lambda (exacto, en centavos)
     """
-    return reduce(lambda acc, detalle: acc + detalle.neto, detalles, 0.0)
+    if isinstance(detalles, DetallesColumnares):
+        return detalles.total('neto')
+    return a_monto(reduce(lambda acc, detalle: acc + detalle.neto_centavos, detalles, 0))
 
 def calcular_promedio_sueldos(detalles: List['DetalleNomina']) -> float:  
     """
     Calcula el promedio de sueldos usando map y reduce
     """
-    sueldos = list(map(lambda d: d.sueldo, detalles))
-    return reduce(lambda a, b: a + b, sueldos, 0.0) / len(sueldos) if sueldos else 0
+    if isinstance(detalles, DetallesColumnares):
+        return detalles.promedio('sueldo')
+    sueldos = list(map(lambda d: d.sueldo_centavos, detalles))
+    return a_monto(reduce(lambda a, b: a + b, sueldos, 0)) / len(sueldos) if sueldos else 0
 
 def filtrar_empleados_por_sueldo(detalles: List['DetalleNomina'], min_sueldo: float = 0) -> List['DetalleNomina']:  
     """
     Filtra empleados por sueldo mínimo usando filter y lambda
     """
+    if isinstance(detalles, DetallesColumnares):
+        return list(detalles.filtrar('sueldo', '>=', min_sueldo))
     return list(filter(lambda d: d.sueldo >= min_sueldo, detalles))
 
 def obtener_top_empleados(detalles: List['DetalleNomina'], top_n: int = 5, por: str = 'neto') -> List['DetalleNomina']:  
     """
     Obtiene los top N empleados por neto o sueldo
     """
-    key_func = lambda d: getattr(d, por)
+    if isinstance(detalles, DetallesColumnares):
+        return [detalles[i] for i in detalles.ordenar_por(por)[:top_n]]
+    atributo = f"{por}_centavos"
+    key_func = lambda d: getattr(d, atributo)
     return sorted(detalles, key=key_func, reverse=True)[:top_n]
 
 def calcular_distribucion_sueldos(detalles: List['DetalleNomina']) -> Dict[str, int]:  
@@ -42,6 +53,15 @@ def calcular_distribucion_sueldos(detalles: List['DetalleNomina']) -> Dict[str,
         '2000+': 0
     }
     
+    if isinstance(detalles, DetallesColumnares):
+        menores = [detalles.contar('sueldo', '<=', limite) for limite in (500, 1000, 1500, 2000)]
+        rangos['0-500'] = menores[0]
+        rangos['501-1000'] = menores[1] - menores[0]
+        rangos['1001-1500'] = menores[2] - menores[1]
+        rangos['1501-2000'] = menores[3] - menores[2]
+        rangos['2000+'] = len(detalles) - menores[3]
+        return rangos
+    
     for detalle in detalles:
         sueldo = detalle.sueldo
         if sueldo <= 500:
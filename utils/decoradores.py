@@ -1,134 +1,114 @@
-from typing import Callable, Any
+from typing import Callable, List
 from functools import wraps
-import re
+
+from utils.metricas import instrumentar
+from utils.validacion import ESQUEMA_EMPLEADO, ErrorValidacion
+
+# Reglas de validación
+#
+# Las reglas viven en utils.validacion (ESQUEMA_EMPLEADO, compilado una sola
+# vez). Estas funciones, los decoradores de abajo y la importación masiva de
+# empleados usan exactamente el mismo esquema.
+
+def comprobar_cedula(cedula) -> None:
+    ESQUEMA_EMPLEADO.comprobar('cedula', cedula)
+
+def comprobar_sueldo(sueldo) -> None:
+    ESQUEMA_EMPLEADO.comprobar('sueldo', sueldo)
+
+def comprobar_nombre(nombre) -> None:
+    ESQUEMA_EMPLEADO.comprobar('nombre', nombre)
+
+def comprobar_departamento(departamento) -> None:
+    ESQUEMA_EMPLEADO.comprobar('departamento', departamento)
+
+def comprobar_cargo(cargo) -> None:
+    ESQUEMA_EMPLEADO.comprobar('cargo', cargo)
+
+def validar_datos_empleado(cedula, nombre, sueldo, departamento, cargo) -> List[str]:
+    """
+    Aplica todas las reglas de empleado sin lanzar excepciones.
+    Returns: Lista de mensajes de error (vacía si los datos son válidos)
+    """
+    errores = ESQUEMA_EMPLEADO.validar({'cedula': cedula, 'nombre': nombre, 'sueldo': sueldo,
+                                        'departamento': departamento, 'cargo': cargo})
+    return [error.mensaje for error in errores]
 
 # Decoradores de Validación
 #
-# Estos decoradores verifican que los datos del empleado sean correctos.
-# Usan functools.wraps para preservar los metadatos de la función original
-# y buscan los argumentos por su nombre para ser más flexibles.
+# Adaptadores sobre el esquema: la posición de cada campo en la firma se
+# resuelve una sola vez al decorar y cada llamada valida todos sus campos
+# en una pasada, lanzando ErrorValidacion (un ValueError) con el primero.
+
+# Posición por defecto de cada campo (después de self) si la firma no lo nombra
+POSICIONES = {'cedula': 1, 'nombre': 2, 'sueldo': 3, 'departamento': 4, 'cargo': 5}
+
+def _validar_campos(*campos: str) -> Callable[[Callable], Callable]:
+    def decorador(func: Callable) -> Callable:
+        import inspect  # Al decorar, no al importar utils
+        try:
+            parametros = list(inspect.signature(func).parameters)
+        except (TypeError, ValueError):
+            parametros = []
+        posiciones = tuple(
+            (campo, parametros.index(campo) if campo in parametros else POSICIONES[campo])
+            for campo in campos
+        )
+        primera = min(posicion for _, posicion in posiciones)
+        validar = ESQUEMA_EMPLEADO.subesquema(campos).validar
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if len(args) <= primera:
+                # Ningún campo llegó por posición: se valida kwargs directamente
+                valores = kwargs
+            else:
+                valores = {campo: kwargs[campo] if campo in kwargs
+                           else (args[posicion] if posicion < len(args) else None)
+                           for campo, posicion in posiciones}
+            errores = validar(valores)
+            if errores:
+                raise ErrorValidacion(errores)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorador
 
 def validar_cedula(func: Callable) -> Callable:
     """
     Decorador para validar que la cédula tenga 10 dígitos y no esté vacía.
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        cedula = kwargs.get('cedula', None)
-        if cedula is None and len(args) > 1:
-            cedula = args[1]
-        
-        if not cedula or not isinstance(cedula, str) or cedula.strip() == "":
-            raise ValueError("❌ La cédula no puede estar vacía")
-        
-        if not cedula.isdigit() or len(cedula) != 10:
-            raise ValueError("❌ La cédula debe tener exactamente 10 dígitos numéricos")
-        
-        return func(*args, **kwargs)
-    return wrapper
+    return _validar_campos('cedula')(func)
 
 def validar_sueldo_positivo(func: Callable) -> Callable:
     """
     Decorador para validar que el sueldo sea un valor numérico positivo.
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        sueldo = kwargs.get('sueldo', None)
-        if sueldo is None and len(args) > 3:
-            sueldo = args[3]
-        
-        if not sueldo or not isinstance(sueldo, (int, float)):
-            raise ValueError("❌ El sueldo debe ser un valor numérico")
-            
-        if sueldo <= 0:
-            raise ValueError("❌ El sueldo debe ser un valor positivo")
-        
-        return func(*args, **kwargs)
-    return wrapper
+    return _validar_campos('sueldo')(func)
 
 def validar_nombre(func: Callable) -> Callable:
     """
     Decorador para validar que el nombre no esté vacío y solo contenga letras.
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        nombre = None
-        
-        if 'nombre' in kwargs:
-            nombre = kwargs['nombre']
-        elif len(args) > 2:  # nombre es usualmente el tercer argumento
-            nombre = args[2]
-        
-        # Validar que no esté vacío
-        if not nombre or nombre.strip() == "":
-            raise ValueError("❌ El nombre no puede estar vacío")
-        
-        if nombre:
-            # Validar que el nombre solo contenga letras y espacios
-            if not re.match(r'^[a-zA-ZáéíóúÁÉÍÓÚñÑ\s]+$', nombre):
-                raise ValueError("❌ El nombre solo puede contener letras y espacios")
-            
-            # Validar longitud mínima
-            if len(nombre.strip()) < 2:
-                raise ValueError("❌ El nombre debe tener al menos 2 caracteres")
-        
-        return func(*args, **kwargs)
-    return wrapper
+    return _validar_campos('nombre')(func)
 
 def validar_departamento(func: Callable) -> Callable:
     """
     Decorador para validar que el departamento no esté vacío y tenga al menos 2 caracteres.
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        departamento = kwargs.get('departamento', None)
-        if departamento is None and len(args) > 4:
-            departamento = args[4]
-
-        if not departamento or departamento.strip() == "":
-            raise ValueError("❌ El departamento no puede estar vacío")
-        
-        if len(departamento.strip()) < 2:
-            raise ValueError("❌ El departamento debe tener al menos 2 caracteres")
-        
-        return func(*args, **kwargs)
-    return wrapper
+    return _validar_campos('departamento')(func)
 
 def validar_cargo(func: Callable) -> Callable:
     """
     Decorador para validar que el cargo no esté vacío y tenga al menos 2 caracteres.
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        cargo = kwargs.get('cargo', None)
-        if cargo is None and len(args) > 5:
-            cargo = args[5]
-
-        if not cargo or cargo.strip() == "":
-            raise ValueError("❌ El cargo no puede estar vacío")
-        
-        if len(cargo.strip()) < 2:
-            raise ValueError("❌ El cargo debe tener al menos 2 caracteres")
-        
-        return func(*args, **kwargs)
-    return wrapper
+    return _validar_campos('cargo')(func)
 
 def validar_empleado_completo(func: Callable) -> Callable:
     """
-    Decorador compuesto que aplica todas las validaciones de empleado
-    en una cadena ordenada and robusta.
+    Decorador que aplica todas las validaciones de empleado en una sola
+    capa (antes eran cinco decoradores anidados).
     """
-    # Se aplican los decoradores de manera anidada, de adentro hacia afuera,
-    # y finalmente se devuelve la función decorada.
-    @wraps(func)
-    @validar_cedula
-    @validar_sueldo_positivo
-    @validar_nombre
-    @validar_departamento
-    @validar_cargo
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
-    return wrapper
+    return _validar_campos(*ESQUEMA_EMPLEADO.nombres)(func)
 
 # Decoradores de Manejo de Lógica del Sistema
 #
@@ -137,14 +117,10 @@ def validar_empleado_completo(func: Callable) -> Callable:
 
 def log_operacion(func: Callable) -> Callable:
     """
-    Decorador para registrar una operación exitosa en la consola.
+    Decorador para registrar una operación en el registro de métricas
+    (llamadas, errores y latencia) en lugar de imprimir en la consola.
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        resultado = func(*args, **kwargs)
-        print(f"📝 Operación '{func.__name__}' ejecutada exitosamente")
-        return resultado
-    return wrapper
+    return instrumentar(func)
 
 def manejar_errores(func: Callable) -> Callable:
     """
@@ -0,0 +1,63 @@
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Iterable, Tuple
+
+# Los montos se manejan como enteros en centavos. Reglas de redondeo:
+#   - montos recibidos (sueldos, bonos, JSON): al centavo más cercano,
+#     mitades alejándose de cero, según el valor decimal escrito
+#     (1.005 -> 1.01 aunque el float sea 1.00499999...)
+#   - porcentajes (IESS): entero exacto y luego mitad hacia arriba
+#   - sumas y restas: exactas, sin redondeo
+CENTAVOS_POR_UNIDAD = 100
+
+# Aporte personal al IESS: 9.45 % como fracción exacta
+TASA_IESS: Tuple[int, int] = (945, 10000)
+
+_CENTAVO = Decimal('0.01')
+
+def a_centavos(valor) -> int:
+    """
+    Convierte un monto (float, int, str o Decimal) a centavos enteros
+    """
+    if type(valor) is int:
+        return valor * CENTAVOS_POR_UNIDAD
+    if type(valor) is float:
+        escalado = valor * CENTAVOS_POR_UNIDAD
+        entero = round(escalado)
+        # Lejos de la mitad, el float escalado ya decide el centavo; cerca de
+        # ella se mira el valor decimal que representa el float
+        if abs(abs(escalado - entero) - 0.5) > 1e-6:
+            return int(entero)
+        valor = repr(valor)
+    return int((Decimal(valor) * CENTAVOS_POR_UNIDAD).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+def a_monto(centavos: int) -> float:
+    """
+    Centavos como float de dos decimales (el float más cercano al valor
+    exacto; es lo que se escribe en JSON)
+    """
+    return centavos / CENTAVOS_POR_UNIDAD
+
+def aplicar_tasa(centavos: int, tasa: Tuple[int, int]) -> int:
+    """
+    centavos * numerador / denominador redondeado a la mitad hacia arriba
+    (alejándose de cero), sin pasar por floats
+    """
+    numerador, denominador = tasa
+    cociente, resto = divmod(abs(centavos) * numerador, denominador)
+    if 2 * resto >= denominador:
+        cociente += 1
+    return cociente if centavos >= 0 else -cociente
+
+def sumar_montos(montos: Iterable[float]) -> float:
+    """
+    Suma exacta de montos en unidades (cada uno redondeado al centavo)
+    """
+    return a_monto(sum(map(a_centavos, montos)))
+
+def formatear(centavos: int) -> str:
+    """
+    Texto con separador de miles y dos decimales: 123456 -> '1,234.56'
+    """
+    signo = '-' if centavos < 0 else ''
+    unidades, resto = divmod(abs(centavos), CENTAVOS_POR_UNIDAD)
+    return f"{signo}{unidades:,}.{resto:02d}"
@@ -1,78 +1,99 @@
-from typing import List, Dict, TYPE_CHECKING
-from functools import reduce
+from typing import Iterable, Dict
+from modelos.empleado import Empleado
 from modelos.detalle_nomina import DetalleNomina
+from modelos.detalles_columnares import DetallesColumnares
+from utils.acumulador import AcumuladorEstadisticas
 
-if TYPE_CHECKING:
-    from modelos.detalle_nomina import DetalleNomina
-
-def generar_estadisticas_avanzadas(detalles: List['DetalleNomina']) -> Dict:
+def generar_estadisticas_avanzadas(detalles: Iterable['DetalleNomina']) -> Dict:
     """
-    Genera estadísticas avanzadas usando funciones de orden superior
+    Genera estadísticas avanzadas en una sola pasada (acepta generadores)
     """
-    # Usando comprehensions para listas básicas
-    netos = [d.neto for d in detalles]
-    sueldos = [d.sueldo for d in detalles]
-    bonos = [d.bono for d in detalles]
-    
-    # Usando reduce para cálculos agregados
-    total_neto = reduce(lambda a, b: a + b, netos, 0.0)
-    total_sueldos = reduce(lambda a, b: a + b, sueldos, 0.0)
-    total_bonos = reduce(lambda a, b: a + b, bonos, 0.0)
+    if isinstance(detalles, DetallesColumnares):
+        return _estadisticas_avanzadas_columnares(detalles)
     
-    # Usando map para transformaciones
-    nombres = list(map(lambda d: d.empleado.nombre, detalles))
+    stats = AcumuladorEstadisticas().agregar_todos(detalles)
     
-    # Usando filter para segmentación
-    altos_sueldos = list(filter(lambda d: d.sueldo > 1000, detalles))
-    bajos_sueldos = list(filter(lambda d: d.sueldo <= 1000, detalles))
-    
-    # Encontrar extremos con lambda
-    mayor_neto = max(detalles, key=lambda d: d.neto) if detalles else None
-    menor_neto = min(detalles, key=lambda d: d.neto) if detalles else None
+    return {
+        'totales': {
+            'neto': stats.total_neto,
+            'sueldos': stats.total_sueldos,
+            'bonos': stats.total_bonos,
+            'empleados': stats.cantidad
+        },
+        'promedios': {
+            'neto': stats.promedio_neto,
+            'sueldo': stats.promedio_sueldo
+        },
+        'distribucion': {
+            'altos_sueldos': stats.cantidad_alto_sueldo,
+            'bajos_sueldos': stats.cantidad_bajo_sueldo
+        },
+        'extremes': {
+            'mayor_neto': stats.mayor_neto,
+            'menor_neto': stats.menor_neto
+        },
+        'nombres': stats.nombres
+    }
+
+def _estadisticas_avanzadas_columnares(columnas: DetallesColumnares) -> Dict:
+    """
+    Versión vectorizada de generar_estadisticas_avanzadas
+    """
+    cantidad = len(columnas)
+    total_neto = columnas.total('neto')
+    total_sueldos = columnas.total('sueldo')
+    altos_sueldos = columnas.contar('sueldo', '>', 1000)
     
     return {
         'totales': {
             'neto': total_neto,
             'sueldos': total_sueldos,
-            'bonos': total_bonos,
-            'empleados': len(detalles)
+            'bonos': columnas.total('bono'),
+            'empleados': cantidad
         },
         'promedios': {
-            'neto': total_neto / len(netos) if netos else 0,
-            'sueldo': total_sueldos / len(sueldos) if sueldos else 0
+            'neto': total_neto / cantidad if cantidad else 0,
+            'sueldo': total_sueldos / cantidad if cantidad else 0
         },
         'distribucion': {
-            'altos_sueldos': len(altos_sueldos),
-            'bajos_sueldos': len(bajos_sueldos)
+            'altos_sueldos': altos_sueldos,
+            'bajos_sueldos': cantidad - altos_sueldos
         },
         'extremes': {
-            'mayor_neto': mayor_neto,
-            'menor_neto': menor_neto
+            'mayor_neto': columnas[columnas.indice_maximo('neto')] if cantidad else None,
+            'menor_neto': columnas[columnas.indice_minimo('neto')] if cantidad else None
         },
-        'nombres': nombres
+        'nombres': [empleado.nombre for empleado in columnas.empleados]
     }
 
-def calcular_metricas_departamento(detalles: List['DetalleNomina']) -> Dict[str, Dict]:
+def calcular_metricas_departamento(detalles: Iterable['DetalleNomina']) -> Dict[str, Dict]:
     """
-    Calcula métricas por departamento usando reduce y comprehensions
+    Calcula métricas por departamento en una sola pasada (acepta generadores)
     """
-    # Agrupar por departamento
-    departamentos = {}
-    for detalle in detalles:
-        depto = detalle.empleado.departamento
-        if depto not in departamentos:
-            departamentos[depto] = []
-        departamentos[depto].append(detalle)
+    if isinstance(detalles, DetallesColumnares):
+        return detalles.agrupar_por_departamento()
     
-    # Calcular métricas por departamento
+    return AcumuladorEstadisticas(conservar_filas=False).agregar_todos(detalles).departamentos()
+
+def serializar_metricas_departamento(metricas: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    Convierte las métricas por departamento a datos JSON (el empleado de
+    mayor neto va como diccionario)
+    """
+    return {
+        depto: dict(datos, empleado_mayor_neto=datos['empleado_mayor_neto'].to_dict())
+        for depto, datos in metricas.items()
+    }
+
+def deserializar_metricas_departamento(datos: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    Reconstruye las métricas guardadas con serializar_metricas_departamento
+    """
     metricas = {}
-    for depto, depto_detalles in departamentos.items():
-        netos = [d.neto for d in depto_detalles]
-        metricas[depto] = {
-            'empleados': len(depto_detalles),
-            'total_neto': reduce(lambda a, b: a + b, netos, 0.0),
-            'promedio_neto': reduce(lambda a, b: a + b, netos, 0.0) / len(netos) if netos else 0,
-            'empleado_mayor_neto': max(depto_detalles, key=lambda d: d.neto) if depto_detalles else None
-        }
-    
-    return metricas
\ No newline at end of file
+    for depto, depto_datos in datos.items():
+        mayor = depto_datos['empleado_mayor_neto']
+        metricas[depto] = dict(
+            depto_datos,
+            empleado_mayor_neto=DetalleNomina.from_dict(mayor, Empleado.from_dict(mayor['empleado']))
+        )
+    return metricas
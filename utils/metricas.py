@@ -0,0 +1,217 @@
+from bisect import bisect_left
+from functools import wraps
+from typing import Callable, Dict, List, Optional
+import os
+import threading
+import time
+
+# Límites superiores (segundos) de las cubetas del histograma de latencia
+LIMITES_LATENCIA = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class MetricaOperacion:
+    """
+    Contadores de una operación: llamadas, errores, latencia y bytes de E/S
+    """
+
+    __slots__ = ('llamadas', 'errores', 'segundos', 'cubetas', 'bytes_leidos', 'bytes_escritos')
+
+    def __init__(self, cubetas: int):
+        self.llamadas = 0
+        self.errores = 0
+        self.segundos = 0.0
+        # Una cubeta por límite más la de +Inf (conteos no acumulados)
+        self.cubetas = [0] * (cubetas + 1)
+        self.bytes_leidos = 0
+        self.bytes_escritos = 0
+
+class RegistroMetricas:
+    """
+    Registro de métricas por operación, seguro entre hilos.
+    Deshabilitado, instrumentar() solo agrega una comparación por llamada;
+    habilitado, cada llamada cuenta, mide su latencia en un histograma y
+    recibe los bytes que registrar_io() anota mientras se ejecuta.
+    """
+
+    def __init__(self, habilitado: bool = False, limites: tuple = LIMITES_LATENCIA):
+        self.habilitado = habilitado
+        self.limites = limites
+        self._operaciones: Dict[str, MetricaOperacion] = {}
+        self._lock = threading.Lock()
+        # Pila de operaciones en curso de cada hilo (para atribuir la E/S)
+        self._local = threading.local()
+
+    def habilitar(self, habilitado: bool = True) -> None:
+        self.habilitado = habilitado
+
+    def reiniciar(self) -> None:
+        with self._lock:
+            self._operaciones.clear()
+
+    def _metrica(self, operacion: str) -> MetricaOperacion:
+        metrica = self._operaciones.get(operacion)
+        if metrica is None:
+            metrica = self._operaciones[operacion] = MetricaOperacion(len(self.limites))
+        return metrica
+
+    def medir(self, operacion: str, funcion: Callable, args, kwargs):
+        """
+        Ejecuta la función registrando la llamada, su latencia y si falló
+        """
+        pila = self._local.__dict__.setdefault('pila', [])
+        pila.append(operacion)
+        inicio = time.perf_counter()
+        error = False
+        try:
+            return funcion(*args, **kwargs)
+        except BaseException:
+            error = True
+            raise
+        finally:
+            segundos = time.perf_counter() - inicio
+            pila.pop()
+            with self._lock:
+                metrica = self._metrica(operacion)
+                metrica.llamadas += 1
+                metrica.errores += error
+                metrica.segundos += segundos
+                metrica.cubetas[bisect_left(self.limites, segundos)] += 1
+
+    def _operacion_actual(self) -> str:
+        """
+        Operación instrumentada más interna en curso en este hilo
+        """
+        pila = self._local.__dict__.get('pila')
+        return pila[-1] if pila else 'sin_operacion'
+
+    def registrar_io(self, leidos: int = 0, escritos: int = 0, operacion: Optional[str] = None) -> None:
+        """
+        Suma bytes leídos/escritos a la operación indicada o, si no se indica,
+        a la operación instrumentada más interna en curso en este hilo
+        """
+        if not self.habilitado:
+            return
+        operacion = operacion or self._operacion_actual()
+        with self._lock:
+            metrica = self._metrica(operacion)
+            metrica.bytes_leidos += leidos
+            metrica.bytes_escritos += escritos
+
+    def registrar_error(self, operacion: Optional[str] = None) -> None:
+        """
+        Cuenta un error que la operación manejó sin lanzar la excepción
+        (por ejemplo un archivo dañado que se informa devolviendo None)
+        """
+        if not self.habilitado:
+            return
+        operacion = operacion or self._operacion_actual()
+        with self._lock:
+            self._metrica(operacion).errores += 1
+
+    def _percentil(self, metrica: MetricaOperacion, p: float) -> Optional[float]:
+        """
+        Límite superior de la cubeta donde cae el percentil (None si es +Inf)
+        """
+        objetivo = p * metrica.llamadas
+        acumulado = 0
+        for limite, cantidad in zip(self.limites, metrica.cubetas):
+            acumulado += cantidad
+            if acumulado >= objetivo:
+                return limite
+        return None
+
+    def instantanea(self) -> Dict[str, Dict]:
+        """
+        Copia de las métricas como diccionario serializable a JSON
+        Returns: operación -> llamadas, errores, segundos, p50/p99 estimados,
+        histograma acumulado y bytes de E/S
+        """
+        with self._lock:
+            resultado = {}
+            for operacion in sorted(self._operaciones):
+                metrica = self._operaciones[operacion]
+                histograma, acumulado = {}, 0
+                for limite, cantidad in zip(self.limites + ('+Inf',), metrica.cubetas):
+                    acumulado += cantidad
+                    histograma[str(limite)] = acumulado
+                resultado[operacion] = {
+                    'llamadas': metrica.llamadas,
+                    'errores': metrica.errores,
+                    'segundos_total': metrica.segundos,
+                    'segundos_promedio': metrica.segundos / metrica.llamadas if metrica.llamadas else 0.0,
+                    'p50': self._percentil(metrica, 0.50) if metrica.llamadas else None,
+                    'p99': self._percentil(metrica, 0.99) if metrica.llamadas else None,
+                    'histograma': histograma,
+                    'bytes_leidos': metrica.bytes_leidos,
+                    'bytes_escritos': metrica.bytes_escritos
+                }
+            return resultado
+
+    def exportar_prometheus(self, prefijo: str = "nominas") -> str:
+        """
+        Métricas en el formato de texto de exposición de Prometheus
+        """
+        instantanea = self.instantanea()
+        lineas: List[str] = []
+
+        def familia(nombre: str, tipo: str, ayuda: str) -> None:
+            lineas.append(f"# HELP {prefijo}_{nombre} {ayuda}")
+            lineas.append(f"# TYPE {prefijo}_{nombre} {tipo}")
+
+        etiquetas = {operacion: _escapar(operacion) for operacion in instantanea}
+        for nombre, clave, ayuda in (
+            ('operacion_llamadas_total', 'llamadas', "Llamadas por operación"),
+            ('operacion_errores_total', 'errores', "Errores por operación (excepciones y errores manejados)"),
+            ('io_bytes_leidos_total', 'bytes_leidos', "Bytes leídos de disco por operación"),
+            ('io_bytes_escritos_total', 'bytes_escritos', "Bytes escritos a disco por operación"),
+        ):
+            familia(nombre, 'counter', ayuda)
+            for operacion, datos in instantanea.items():
+                lineas.append(f'{prefijo}_{nombre}{{operacion="{etiquetas[operacion]}"}} {datos[clave]}')
+
+        familia('operacion_segundos', 'histogram', "Latencia de cada operación en segundos")
+        for operacion, datos in instantanea.items():
+            etiqueta = etiquetas[operacion]
+            for limite, cantidad in datos['histograma'].items():
+                lineas.append(f'{prefijo}_operacion_segundos_bucket{{operacion="{etiqueta}",le="{limite}"}} {cantidad}')
+            lineas.append(f'{prefijo}_operacion_segundos_sum{{operacion="{etiqueta}"}} {datos["segundos_total"]}')
+            lineas.append(f'{prefijo}_operacion_segundos_count{{operacion="{etiqueta}"}} {datos["llamadas"]}')
+        return "\n".join(lineas) + "\n"
+
+def _escapar(valor: str) -> str:
+    return valor.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+# Registro global del sistema; NOMINAS_METRICAS=1 lo habilita al iniciar
+REGISTRO = RegistroMetricas(habilitado=os.environ.get('NOMINAS_METRICAS') == '1')
+
+def instrumentar(func: Optional[Callable] = None, *, nombre: Optional[str] = None):
+    """
+    Decorador que registra llamadas, errores y latencia de la función en
+    REGISTRO con el nombre 'Clase.metodo' (o el indicado en 'nombre').
+    Se usa como @instrumentar o @instrumentar(nombre="...").
+    No mide generadores ni corrutinas más allá de su creación.
+    """
+    def decorar(func: Callable) -> Callable:
+        operacion = nombre or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not REGISTRO.habilitado:
+                return func(*args, **kwargs)
+            return REGISTRO.medir(operacion, func, args, kwargs)
+        return wrapper
+    return decorar(func) if func is not None else decorar
+
+def registrar_io(leidos: int = 0, escritos: int = 0, operacion: Optional[str] = None) -> None:
+    """
+    Anota bytes de E/S en REGISTRO (ver RegistroMetricas.registrar_io)
+    """
+    if REGISTRO.habilitado:
+        REGISTRO.registrar_io(leidos, escritos, operacion)
+
+def registrar_error(operacion: Optional[str] = None) -> None:
+    """
+    Cuenta en REGISTRO un error manejado (ver RegistroMetricas.registrar_error)
+    """
+    if REGISTRO.habilitado:
+        REGISTRO.registrar_error(operacion)
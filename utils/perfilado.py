@@ -0,0 +1,137 @@
+from functools import wraps
+from typing import Callable, Optional
+import cProfile
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+
+class Perfilador:
+    """
+    Perfila operaciones con cProfile y tracemalloc sin tocar su código.
+    Por cada operación escribe en el directorio:
+      NNN_operacion.pstats       estadísticas de cProfile (pstats / snakeviz)
+      NNN_operacion.memoria.txt  tiempos, pico de memoria y mayores asignaciones
+    cProfile y tracemalloc son globales al proceso: una operación llamada
+    mientras otra se perfila (anidada o desde otro hilo) se ejecuta sin
+    perfilar y su costo queda dentro del perfil de la que la contiene.
+    """
+
+    def __init__(self, directorio: str, resumen: bool = False, top: int = 15):
+        self.directorio = directorio
+        self.resumen = resumen
+        self.top = top
+        self._activo = threading.Lock()
+        os.makedirs(directorio, exist_ok=True)
+        # La numeración sigue la de sesiones anteriores en el mismo directorio
+        self._contador = sum(1 for nombre in os.listdir(directorio) if nombre.endswith('.pstats'))
+
+    def _ruta(self, operacion: str) -> str:
+        self._contador += 1
+        nombre = re.sub(r'[^\w.-]+', '_', operacion)
+        return os.path.join(self.directorio, f"{self._contador:03d}_{nombre}")
+
+    def perfilar(self, operacion: str, funcion: Callable, *args, **kwargs):
+        """
+        Ejecuta la función perfilada y devuelve su resultado
+        """
+        # Sin espera: si ya hay una operación perfilándose, esta corre normal
+        if not self._activo.acquire(blocking=False):
+            return funcion(*args, **kwargs)
+        try:
+            return self._perfilar(operacion, funcion, args, kwargs)
+        finally:
+            self._activo.release()
+
+    def _perfilar(self, operacion: str, funcion: Callable, args, kwargs):
+        iniciado_aqui = not tracemalloc.is_tracing()
+        if iniciado_aqui:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        antes = tracemalloc.take_snapshot()
+
+        perfil = cProfile.Profile()
+        inicio, inicio_cpu = time.perf_counter(), time.process_time()
+        error = None
+        try:
+            perfil.enable()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                perfil.disable()
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            reloj = time.perf_counter() - inicio
+            cpu = time.process_time() - inicio_cpu
+            _, pico = tracemalloc.get_traced_memory()
+            despues = tracemalloc.take_snapshot()
+            if iniciado_aqui:
+                tracemalloc.stop()
+            self._escribir(operacion, perfil, antes, despues, reloj, cpu, pico, error)
+
+    def _escribir(self, operacion: str, perfil: cProfile.Profile, antes, despues,
+                  reloj: float, cpu: float, pico: int, error: Optional[BaseException]) -> None:
+        ruta = self._ruta(operacion)
+        perfil.dump_stats(f"{ruta}.pstats")
+
+        # Lo que la operación dejó asignado al terminar, sin las trazas del perfilador
+        filtros = [tracemalloc.Filter(False, tracemalloc.__file__),
+                   tracemalloc.Filter(False, cProfile.__file__),
+                   tracemalloc.Filter(False, __file__)]
+        diferencias = despues.filter_traces(filtros).compare_to(antes.filter_traces(filtros), 'lineno')
+        retenido = sum(diferencia.size_diff for diferencia in diferencias)
+        with open(f"{ruta}.memoria.txt", 'w', encoding='utf-8') as f:
+            f.write(f"operación: {operacion}\n")
+            f.write(f"reloj: {reloj * 1000:.2f} ms | CPU: {cpu * 1000:.2f} ms\n")
+            f.write(f"pico de memoria: {pico / 1024:.1f} KiB | retenido: {retenido / 1024:.1f} KiB\n")
+            if error is not None:
+                f.write(f"error: {type(error).__name__}: {error}\n")
+            f.write(f"\nmayores asignaciones retenidas (top {self.top}):\n")
+            for diferencia in diferencias[:self.top]:
+                f.write(f"  {diferencia}\n")
+
+        if self.resumen:
+            estado = f" | ❌ {type(error).__name__}" if error is not None else ""
+            print(f"⏱️  {operacion}: {reloj * 1000:.1f} ms reloj | {cpu * 1000:.1f} ms CPU | "
+                  f"pico {pico / 1024:.1f} KiB | retenido {retenido / 1024:.1f} KiB{estado}",
+                  file=sys.stderr)
+
+    def envolver(self, objeto) -> 'ObjetoPerfilado':
+        """
+        Proxy del objeto cuyos métodos públicos se perfilan al llamarlos
+        """
+        return ObjetoPerfilado(objeto, self)
+
+class ObjetoPerfilado:
+    """
+    Proxy transparente: los atributos se leen del objeto original y cada
+    llamada a un método público pasa por Perfilador.perfilar() con el nombre
+    'Clase.metodo'. Se puede usar en lugar del objeto (por ejemplo de
+    SistemaNominas) sin cambiar el código que lo llama.
+    """
+
+    def __init__(self, objeto, perfilador: Perfilador):
+        object.__setattr__(self, '_objeto', objeto)
+        object.__setattr__(self, '_perfilador', perfilador)
+
+    def __getattr__(self, nombre: str):
+        valor = getattr(self._objeto, nombre)
+        if nombre.startswith('_') or not callable(valor):
+            return valor
+        operacion = f"{type(self._objeto).__name__}.{nombre}"
+        perfilador = self._perfilador
+
+        @wraps(valor)
+        def metodo(*args, **kwargs):
+            return perfilador.perfilar(operacion, valor, *args, **kwargs)
+        return metodo
+
+    def __setattr__(self, nombre: str, valor) -> None:
+        setattr(self._objeto, nombre, valor)
+
+    def __repr__(self) -> str:
+        return f"ObjetoPerfilado({self._objeto!r})"
@@ -0,0 +1,23 @@
+from array import array
+from typing import Dict
+
+def convertir_a_json(valor):
+    """
+    Función 'default' de json.dump para los objetos del sistema:
+    modelos con to_dict() y arreglos array('d') de las series
+    """
+    if hasattr(valor, 'to_dict'):
+        return valor.to_dict()
+    if isinstance(valor, array):
+        return valor.tolist()
+    raise TypeError(f"Objeto no serializable: {type(valor).__name__}")
+
+# Campos públicos del resumen de un período (el índice guarda además
+# tamaño, checksum, mtime y métricas por departamento)
+CAMPOS_RESUMEN = ('id', 'aniomes', 'empleados', 'tot_ing', 'tot_des', 'neto')
+
+def resumen_publico(resumen: Dict) -> Dict:
+    """
+    Deja solo los campos públicos de un resumen de obtener_resumenes()
+    """
+    return {campo: resumen.get(campo) for campo in CAMPOS_RESUMEN}
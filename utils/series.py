@@ -0,0 +1,73 @@
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from modelos.detalles_columnares import DetallesColumnares, COLUMNAS
+from utils.dinero import a_centavos, a_monto
+
+if TYPE_CHECKING:
+    from modelos.detalle_nomina import DetalleNomina
+
+# Columnas que devuelven por defecto las series de tiempo
+COLUMNAS_SERIE = ('neto', 'sueldo', 'iess')
+
+def validar_columnas(columnas: Sequence[str]) -> None:
+    """
+    Verifica que las columnas pedidas sean montos de un detalle de nómina
+    """
+    desconocidas = [columna for columna in columnas if columna not in COLUMNAS]
+    if desconocidas:
+        raise ValueError(f"Columnas no soportadas: {', '.join(desconocidas)}. Opciones: {', '.join(COLUMNAS)}")
+
+def sumar_detalles(detalles: Iterable['DetalleNomina'], columnas: Sequence[str],
+                   cedula: Optional[str] = None, departamento: Optional[str] = None) -> Tuple[float, ...]:
+    """
+    Suma las columnas indicadas sobre los detalles de un empleado (cedula),
+    de un departamento o de todos si no se indica ninguno
+    Returns: Tupla con una suma por columna (exacta: se suma en centavos)
+    """
+    if isinstance(detalles, DetallesColumnares):
+        if cedula is None and departamento is None:
+            return tuple(detalles.total(columna) for columna in columnas)
+        filas = [
+            i for i in range(len(detalles))
+            if (cedula is None or detalles.cedulas[i] == cedula)
+            and (departamento is None or detalles.departamento(i) == departamento)
+        ]
+        sumas = []
+        for columna in columnas:
+            valores = detalles.centavos(columna)
+            sumas.append(a_monto(sum(int(valores[i]) for i in filas)))
+        return tuple(sumas)
+
+    atributos = [f"{columna}_centavos" for columna in columnas]
+    sumas = [0] * len(columnas)
+    for detalle in detalles:
+        empleado = detalle.empleado
+        if cedula is not None and empleado.cedula != cedula:
+            continue
+        if departamento is not None and empleado.departamento != departamento:
+            continue
+        for j, atributo in enumerate(atributos):
+            sumas[j] += getattr(detalle, atributo)
+    return tuple(map(a_monto, sumas))
+
+def variaciones(valores: Sequence[float]) -> array:
+    """
+    Variación de cada período respecto al anterior (alineada con periodos[1:]),
+    restada en centavos
+    """
+    centavos = [a_centavos(valor) for valor in valores]
+    return array('d', (a_monto(centavos[i] - centavos[i - 1]) for i in range(1, len(centavos))))
+
+def acumulado_anual(periodos: List[str], valores: Sequence[float]) -> array:
+    """
+    Suma acumulada del año (YTD): se reinicia cuando cambia el año del período
+    """
+    acumulados = array('d')
+    anio, acumulado = None, 0
+    for periodo, valor in zip(periodos, valores):
+        if periodo[:4] != anio:
+            anio, acumulado = periodo[:4], 0
+        acumulado += a_centavos(valor)
+        acumulados.append(a_monto(acumulado))
+    return acumulados
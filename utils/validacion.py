@@ -0,0 +1,317 @@
+from itertools import repeat
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import re
+
+# Patrón de nombres válidos (compilado una sola vez)
+PATRON_NOMBRE = re.compile(r'^[a-zA-ZáéíóúÁÉÍÓÚñÑ\s]+$')
+
+MENSAJE_FORMATO = "❌ La fila no tiene un formato válido"
+
+# Resultado de comprobar un valor: None si es válido o (código, mensaje)
+Fallo = Optional[Tuple[str, str]]
+
+class ErrorCampo:
+    """
+    Error de validación de un campo: código de la regla incumplida
+    ('vacio', 'tipo', 'digitos', 'patron', 'longitud', 'positivo', 'formato')
+    y mensaje para el usuario
+    """
+
+    __slots__ = ('campo', 'codigo', 'mensaje')
+
+    def __init__(self, campo: Optional[str], codigo: str, mensaje: str):
+        self.campo = campo
+        self.codigo = codigo
+        self.mensaje = mensaje
+
+    def to_dict(self) -> Dict:
+        return {'campo': self.campo, 'codigo': self.codigo, 'mensaje': self.mensaje}
+
+    def __repr__(self) -> str:
+        return f"ErrorCampo({self.campo!r}, {self.codigo!r}, {self.mensaje!r})"
+
+class ErrorValidacion(ValueError):
+    """
+    ValueError con todos los errores de un registro; el texto es el del
+    primero, como lo lanzaban las validaciones encadenadas
+    """
+
+    def __init__(self, errores: List[ErrorCampo]):
+        super().__init__(errores[0].mensaje)
+        self.errores = errores
+
+class Campo:
+    """
+    Reglas declarativas de un campo del esquema.
+    tipo 'texto': no vacío y, si se indican, 'digitos' exactos, 'patron'
+    y 'longitud_minima' (sin espacios a los extremos).
+    tipo 'numero': numérico y, con 'positivo', mayor que cero.
+    'mensajes' asocia el código de cada regla con su mensaje.
+    """
+
+    def __init__(self, nombre: str, tipo: str, mensajes: Dict[str, str],
+                 digitos: Optional[int] = None, patron: Optional[re.Pattern] = None,
+                 longitud_minima: Optional[int] = None, positivo: bool = False):
+        if tipo not in ('texto', 'numero'):
+            raise ValueError(f"Tipo de campo no soportado: {tipo}")
+        self.nombre = nombre
+        self.tipo = tipo
+        self.mensajes = mensajes
+        self.digitos = digitos
+        self.patron = patron
+        self.longitud_minima = longitud_minima
+        self.positivo = positivo
+
+    def verificador(self) -> Callable[[object], bool]:
+        """
+        Predicado rápido valor -> bool, verdadero si el valor cumple todas las
+        reglas. Solo acepta str, int y float exactos: cualquier otro tipo da
+        falso y pasa por la regla completa de compilar().
+        """
+        if self.tipo == 'numero':
+            if self.positivo:
+                def verificar(valor) -> bool:
+                    tipo = type(valor)
+                    return (tipo is float or tipo is int) and valor > 0
+            else:
+                def verificar(valor) -> bool:
+                    tipo = type(valor)
+                    return (tipo is float or tipo is int) and valor != 0
+            return verificar
+
+        # Una función por combinación de reglas, sin ramas para las que no usa
+        digitos = self.digitos
+        coincide = self.patron.match if self.patron is not None else None
+        minimo = max(self.longitud_minima or 1, 1)
+        if digitos is not None:
+            if coincide is None:
+                def verificar(valor) -> bool:
+                    return type(valor) is str and len(valor) == digitos and valor.isdigit()
+            else:
+                def verificar(valor) -> bool:
+                    return (type(valor) is str and len(valor) == digitos and valor.isdigit()
+                            and coincide(valor) is not None)
+        elif coincide is None:
+            def verificar(valor) -> bool:
+                return type(valor) is str and len(valor.strip()) >= minimo
+        else:
+            def verificar(valor) -> bool:
+                return type(valor) is str and len(valor.strip()) >= minimo and coincide(valor) is not None
+        return verificar
+
+    def compilar(self) -> Callable[[object], Fallo]:
+        """
+        Convierte las reglas en una sola función valor -> Fallo; las reglas
+        que el campo no usa no se evalúan
+        """
+        return self._compilar_texto() if self.tipo == 'texto' else self._compilar_numero()
+
+    def _compilar_texto(self) -> Callable[[object], Fallo]:
+        vacio = ('vacio', self.mensajes['vacio'])
+        digitos = self.digitos
+        fallo_digitos = ('digitos', self.mensajes.get('digitos'))
+        coincide = self.patron.match if self.patron is not None else None
+        fallo_patron = ('patron', self.mensajes.get('patron'))
+        minimo = self.longitud_minima
+        fallo_longitud = ('longitud', self.mensajes.get('longitud'))
+
+        def comprobar(valor) -> Fallo:
+            if not isinstance(valor, str):
+                return vacio
+            limpio = valor.strip()
+            if not limpio:
+                return vacio
+            if digitos is not None and not (len(valor) == digitos and valor.isdigit()):
+                return fallo_digitos
+            if coincide is not None and coincide(valor) is None:
+                return fallo_patron
+            if minimo is not None and len(limpio) < minimo:
+                return fallo_longitud
+            return None
+        return comprobar
+
+    def _compilar_numero(self) -> Callable[[object], Fallo]:
+        fallo_tipo = ('tipo', self.mensajes['tipo'])
+        positivo = self.positivo
+        fallo_positivo = ('positivo', self.mensajes.get('positivo'))
+
+        def comprobar(valor) -> Fallo:
+            # Como antes, 0 y None cuentan como "no numérico"; bool no es un número
+            if not valor or not isinstance(valor, (int, float)) or isinstance(valor, bool):
+                return fallo_tipo
+            # 'not >' también rechaza NaN
+            if positivo and not valor > 0:
+                return fallo_positivo
+            return None
+        return comprobar
+
+class ResultadoValidacion:
+    """
+    Resultado de validar un lote: errores por índice de fila (solo las filas
+    con errores) y total de filas revisadas
+    """
+
+    __slots__ = ('total', 'errores')
+
+    def __init__(self, total: int, errores: Dict[int, List[ErrorCampo]]):
+        self.total = total
+        self.errores = errores
+
+    @property
+    def valido(self) -> bool:
+        return not self.errores
+
+    @property
+    def validas(self) -> int:
+        return self.total - len(self.errores)
+
+    def indices_validos(self) -> Iterator[int]:
+        errores = self.errores
+        return (fila for fila in range(self.total) if fila not in errores)
+
+    def to_dict(self) -> Dict:
+        return {
+            'total': self.total,
+            'validas': self.validas,
+            'errores': {fila: [error.to_dict() for error in errores]
+                        for fila, errores in self.errores.items()}
+        }
+
+class EsquemaValidacion:
+    """
+    Conjunto de campos compilado una sola vez. Valida un registro, un lote
+    de registros o un lote columnar en una pasada y devuelve todos los
+    errores por campo en lugar de detenerse en el primero.
+    """
+
+    def __init__(self, campos: Sequence[Campo]):
+        self.campos = tuple(campos)
+        self.nombres = tuple(campo.nombre for campo in self.campos)
+        self._comprobadores = tuple((campo.nombre, campo.compilar()) for campo in self.campos)
+        self._por_nombre = dict(self._comprobadores)
+        self._compilar_caminos_rapidos()
+
+    def _compilar_caminos_rapidos(self) -> None:
+        """
+        Arma, una sola vez, los caminos rápidos sobre los predicados de cada
+        campo: _es_valido(registro) para los registros y, por campo, una
+        función que devuelve los índices de la columna que no pasan. Solo
+        responden "válido / revisar"; los errores los arma la regla compilada
+        del campo.
+        """
+        verificadores = tuple((campo.nombre, campo.verificador()) for campo in self.campos)
+
+        def es_valido(registro) -> bool:
+            obtener = registro.get
+            for nombre, verificar in verificadores:
+                if not verificar(obtener(nombre)):
+                    return False
+            return True
+
+        def revisor(verificar: Callable[[object], bool]) -> Callable[[Sequence], List[int]]:
+            def revisar(valores: Sequence) -> List[int]:
+                return [fila for fila, valido in enumerate(map(verificar, valores)) if not valido]
+            return revisar
+
+        self._es_valido = es_valido
+        self._revisar = {nombre: revisor(verificar) for nombre, verificar in verificadores}
+
+    def subesquema(self, nombres: Sequence[str]) -> 'EsquemaValidacion':
+        """
+        Esquema compilado con solo esos campos (en el orden de este esquema)
+        """
+        return EsquemaValidacion([campo for campo in self.campos if campo.nombre in nombres])
+
+    def validar(self, registro: Dict) -> List[ErrorCampo]:
+        """
+        Errores de un registro (lista vacía si es válido)
+        """
+        if not isinstance(registro, dict):
+            return [ErrorCampo(None, 'formato', MENSAJE_FORMATO)]
+        if self._es_valido(registro):
+            return []
+        obtener = registro.get
+        errores = []
+        for nombre, comprobar in self._comprobadores:
+            fallo = comprobar(obtener(nombre))
+            if fallo is not None:
+                errores.append(ErrorCampo(nombre, *fallo))
+        return errores
+
+    def comprobar(self, campo: str, valor) -> None:
+        """
+        Lanza ErrorValidacion si el valor no cumple las reglas del campo
+        """
+        fallo = self._por_nombre[campo](valor)
+        if fallo is not None:
+            raise ErrorValidacion([ErrorCampo(campo, *fallo)])
+
+    def validar_lote(self, registros: Iterable[Dict]) -> ResultadoValidacion:
+        """
+        Valida una secuencia de diccionarios en una sola pasada
+        """
+        comprobadores = self._comprobadores
+        es_valido = self._es_valido
+        errores: Dict[int, List[ErrorCampo]] = {}
+        total = 0
+        for fila, registro in enumerate(registros):
+            total += 1
+            if not isinstance(registro, dict):
+                errores[fila] = [ErrorCampo(None, 'formato', MENSAJE_FORMATO)]
+                continue
+            if es_valido(registro):
+                continue
+            obtener = registro.get
+            for nombre, comprobar in comprobadores:
+                fallo = comprobar(obtener(nombre))
+                if fallo is not None:
+                    errores.setdefault(fila, []).append(ErrorCampo(nombre, *fallo))
+        return ResultadoValidacion(total, errores)
+
+    def validar_columnas(self, columnas: Dict[str, Sequence]) -> ResultadoValidacion:
+        """
+        Valida un lote columnar (campo -> valores): cada columna se recorre
+        una vez con las reglas en línea y solo las filas que no pasan vuelven
+        a la regla del campo para armar el error. Una columna ausente cuenta
+        como valores vacíos.
+        """
+        longitudes = {len(valores) for valores in columnas.values()}
+        if len(longitudes) > 1:
+            raise ValueError("Las columnas deben tener la misma cantidad de filas")
+        total = longitudes.pop() if longitudes else 0
+
+        errores: Dict[int, List[ErrorCampo]] = {}
+        for nombre, comprobar in self._comprobadores:
+            valores = columnas.get(nombre)
+            if valores is None:
+                valores = list(repeat(None, total))
+            for fila in self._revisar[nombre](valores):
+                fallo = comprobar(valores[fila])
+                if fallo is not None:
+                    errores.setdefault(fila, []).append(ErrorCampo(nombre, *fallo))
+        # Mismo orden que validar_lote: por fila
+        return ResultadoValidacion(total, dict(sorted(errores.items())))
+
+ESQUEMA_EMPLEADO = EsquemaValidacion([
+    Campo('cedula', 'texto', {
+        'vacio': "❌ La cédula no puede estar vacía",
+        'digitos': "❌ La cédula debe tener exactamente 10 dígitos numéricos",
+    }, digitos=10),
+    Campo('sueldo', 'numero', {
+        'tipo': "❌ El sueldo debe ser un valor numérico",
+        'positivo': "❌ El sueldo debe ser un valor positivo",
+    }, positivo=True),
+    Campo('nombre', 'texto', {
+        'vacio': "❌ El nombre no puede estar vacío",
+        'patron': "❌ El nombre solo puede contener letras y espacios",
+        'longitud': "❌ El nombre debe tener al menos 2 caracteres",
+    }, patron=PATRON_NOMBRE, longitud_minima=2),
+    Campo('departamento', 'texto', {
+        'vacio': "❌ El departamento no puede estar vacío",
+        'longitud': "❌ El departamento debe tener al menos 2 caracteres",
+    }, longitud_minima=2),
+    Campo('cargo', 'texto', {
+        'vacio': "❌ El cargo no puede estar vacío",
+        'longitud': "❌ El cargo debe tener al menos 2 caracteres",
+    }, longitud_minima=2),
+])